@@ -0,0 +1,100 @@
+"""
+Compares the JSON codecs and request compression supported by the 
+`APIClient` on payloads shaped like the largest Tree Schema responses
+and requests: a field listing, a batch-assets response and a
+`set_state` call with thousands of transformation links.
+
+Usage, with the package installed (e.g. `pip install -e .`):
+
+    python benchmarks/bench_codec.py [--fields 50000] [--links 10000]
+"""
+import argparse
+import gzip
+import time
+
+from treeschema.api import codec
+
+
+def field_listing(n_fields):
+    user = {'user_id': 1, 'name': 'Grant', 'email': 'grant@treeschema.com'}
+    return {
+        'meta': {'current_page': 1, 'next_page': None, 'total_cnt': n_fields},
+        'data_fields': [
+            {
+                'field_id': i,
+                'name': 'field_%s' % i,
+                'full_path_name': 'parent.child.field_%s' % i,
+                'parent_path': 'parent.child',
+                'type': 'scalar',
+                'data_type': 'string',
+                'data_format': 'varchar(255)',
+                'nullable': bool(i % 2),
+                'description_raw': 'The description for field %s' % i,
+                'description_markup': '<p>The description for field %s</p>' % i,
+                'steward': user,
+                'tech_poc': user,
+                'created_ts': '2020-09-23 18:16:16',
+                'updated_ts': '2020-09-23 18:16:16'
+            }
+            for i in range(n_fields)
+        ]
+    }
+
+
+def link_state(n_links):
+    return {
+        'links': [
+            {'source_field_id': i, 'target_field_id': i + n_links}
+            for i in range(n_links)
+        ]
+    }
+
+
+def best_of(func, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(n_fields, n_links):
+    payloads = {
+        'field listing (%s fields)' % n_fields: field_listing(n_fields),
+        'link state (%s links)' % n_links: link_state(n_links),
+    }
+    codecs = [codec.get_codec('json')]
+    if codec.orjson is not None:
+        codecs.append(codec.get_codec('orjson'))
+    else:
+        print('orjson is not installed, only the json codec is measured\n')
+
+    for label, payload in payloads.items():
+        print(label)
+        baseline = None
+        for c in codecs:
+            encoded = c.dumps(payload)
+            dumps_s = best_of(lambda: c.dumps(payload))
+            loads_s = best_of(lambda: c.loads(encoded))
+            total = dumps_s + loads_s
+            baseline = baseline or total
+            print(
+                '  %-7s encode %8.1f ms  decode %8.1f ms  speedup %5.1fx'
+                % (c.name, dumps_s * 1000, loads_s * 1000, baseline / total)
+            )
+        raw = codecs[0].dumps(payload)
+        compressed = codec.compress(raw)
+        compress_s = best_of(lambda: codec.compress(raw))
+        print(
+            '  gzip    %8.1f MB -> %6.2f MB (%4.1fx smaller) in %6.1f ms\n'
+            % (len(raw) / 1e6, len(compressed) / 1e6, len(raw) / len(compressed), compress_s * 1000)
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--fields', type=int, default=50000)
+    parser.add_argument('--links', type=int, default=10000)
+    args = parser.parse_args()
+    run(args.fields, args.links)
@@ -0,0 +1,77 @@
+"""
+Compares the memory used by fully serialized `DataField` entities with
+the compact `FieldRecord` used by the lite catalog. Fields are built from
+synthetic API responses, nothing is sent to Tree Schema.
+
+Usage, with the package installed (e.g. `pip install -e .`):
+
+    python benchmarks/bench_memory.py [--fields 100000]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from treeschema import TreeSchema
+from treeschema.catalog import DataField, FieldRecord
+
+DATA_TYPES = ('string', 'number', 'boolean', 'object')
+
+
+def field_response(i):
+    """A field as returned by the API, strings are built per response as
+    they would be when decoding JSON
+    """
+    return {
+        'created_ts': '2020-09-23 18:16:%02d' % (i % 60),
+        'data_format': ''.join(['var', 'char']),
+        'data_type': ''.join(DATA_TYPES[i % len(DATA_TYPES)]),
+        'description_markup': None,
+        'description_raw': 'Field number %s' % i,
+        'field_id': i,
+        'full_path_name': 'order.item_%s' % i,
+        'name': 'item_%s' % i,
+        'nullable': bool(i % 2),
+        'parent_path': ''.join(['ord', 'er']),
+        'steward': None,
+        'tech_poc': None,
+        'type': ''.join(['sca', 'lar']),
+        'updated_ts': '2020-09-23 18:16:16'
+    }
+
+
+def measure(build, n):
+    responses = [field_response(i) for i in range(1, n + 1)]
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    held = [build(r) for r in responses]
+    elapsed = time.perf_counter() - start
+    del responses
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return held, current, peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('--fields', type=int, default=100000)
+    args = parser.parse_args()
+    TreeSchema('bench@treeschema.com', 'bench')
+
+    builders = [
+        ('DataField', lambda r: DataField(r, data_store_id=1, data_schema_id=1)),
+        ('FieldRecord', lambda r: FieldRecord(r, data_store_id=1, data_schema_id=1)),
+    ]
+    for name, build in builders:
+        held, current, peak, elapsed = measure(build, args.fields)
+        print('%-12s %8s fields  held %8.1f MB  peak %8.1f MB  %6.0f bytes/field  %6.2f s' % (
+            name, len(held), current / 2 ** 20, peak / 2 ** 20, current / len(held), elapsed
+        ))
+        del held
+        gc.collect()
+
+
+if __name__ == '__main__':
+    main()
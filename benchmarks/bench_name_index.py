@@ -0,0 +1,51 @@
+"""
+Times searches of the name index used by `TreeSchema.find_schemas()` and
+`TreeSchema.find_fields()` over synthetic names, nothing is sent to
+Tree Schema.
+
+Usage, with the package installed (e.g. `pip install -e .`):
+
+    python benchmarks/bench_name_index.py [--names 1000000]
+"""
+import argparse
+import time
+
+from treeschema.name_index import NameIndex
+
+PREFIXES = ('spoc', 'billing', 'events', 'users', 'orders')
+
+
+def name(i):
+    return '%s.table_%s.column_%s' % (PREFIXES[i % len(PREFIXES)], i // 1000, i % 1000)
+
+
+def timed(label, search, repeat=100):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        found = search()
+    elapsed = (time.perf_counter() - start) / repeat
+    print('%-40s %8s matches  %10.3f ms' % (label, len(found), elapsed * 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('--names', type=int, default=1000000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = NameIndex((name(i), i) for i in range(args.names))
+    print('built %s names in %.2f s' % (len(index), time.perf_counter() - start))
+
+    timed("prefix('spoc.table_12.')", lambda: index.prefix('spoc.table_12.'))
+    timed("glob('spoc.table_12.column_1?')", lambda: index.glob('spoc.table_12.column_1?'))
+    timed("glob('*.column_999')", lambda: index.glob('*.column_999'))
+    timed("glob('users.table_7.column_7')", lambda: index.glob('users.table_7.column_7'))
+
+    start = time.perf_counter()
+    index.fuzzy('')
+    print('indexed trigrams in %.2f s' % (time.perf_counter() - start))
+    timed("fuzzy('spoc.tabel_12.colum_10')", lambda: index.fuzzy('spoc.tabel_12.colum_10'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Records a catalog crawl against the Tree Schema API and replays it
+offline, reporting the wall clock and CPU time the client spends on
+the workload. Replays are deterministic, so the CPU time can be
+compared across versions of the client.
+
+Usage, with the package installed (e.g. `pip install -e .`):
+
+    # capture a session, requires real credentials
+    python benchmarks/bench_replay.py record crawl.jsonl --email me@co.com --secret-key KEY
+
+    # replay as fast as possible, or with the original timing
+    python benchmarks/bench_replay.py replay crawl.jsonl [--realtime] [--repeat 5]
+"""
+import argparse
+import time
+
+from treeschema import TreeSchema
+from treeschema.api import APIClient
+from treeschema.api.transport import RecordingTransport, ReplayTransport
+
+
+def crawl(ts):
+    """Loads every data store, schema and field, then checks the links
+    of every transformation.
+    """
+    n_fields = 0
+    for data_store in ts.get_data_stores(refresh=True).values():
+        for schema in data_store.get_schemas(refresh=True).values():
+            n_fields += len(schema.get_fields(refresh=True))
+    for transformation in ts.get_transformations(refresh=True).values():
+        transformation.get_links(refresh=True)
+    return n_fields
+
+
+def record(path, email, secret_key):
+    recorder = APIClient.configure_transport(RecordingTransport(path))
+    try:
+        ts = TreeSchema(email, secret_key)
+        start = time.perf_counter()
+        n_fields = crawl(ts)
+        print('recorded %s fields in %.2f s to %s' % (n_fields, time.perf_counter() - start, path))
+    finally:
+        recorder.close()
+        APIClient.configure_transport()
+
+
+def replay(path, realtime, repeat):
+    ts = TreeSchema('replay@treeschema.com', 'replay')
+    APIClient.configure_http_cache(max_entries=0)
+    for i in range(repeat):
+        # A fresh transport restarts the recorded sequence of responses
+        APIClient.configure_transport(ReplayTransport(path, realtime=realtime))
+        wall, cpu = time.perf_counter(), time.process_time()
+        n_fields = crawl(ts)
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+        print('run %s: %s fields  wall %8.1f ms  cpu %8.1f ms' % (i + 1, n_fields, wall * 1000, cpu * 1000))
+    APIClient.configure_transport()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('mode', choices=['record', 'replay'])
+    parser.add_argument('path')
+    parser.add_argument('--email')
+    parser.add_argument('--secret-key')
+    parser.add_argument('--realtime', action='store_true')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    if args.mode == 'record':
+        record(args.path, args.email, args.secret_key)
+    else:
+        replay(args.path, args.realtime, args.repeat)
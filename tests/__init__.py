@@ -8,3 +8,51 @@ _secret = '0f4db588f140461d8b2bd9ecf3129d12'
 # Creates the basic auth object
 TEST_TREE_SCHEMA = TreeSchema(_email, _secret)
 
+
+TS = '2020-09-23 18:16:16'
+
+
+def data_store(data_store_id, name, **values):
+    """The API representation of a data store, `values` override the defaults"""
+    inputs = {
+        'created_ts': TS, 'data_store_id': data_store_id, 'description_markup': None,
+        'description_raw': None, 'details': {}, 'name': name, 'other_type': None,
+        'steward': None, 'tech_poc': None, 'type': 'kafka', 'updated_ts': TS
+    }
+    inputs.update(values)
+    return inputs
+
+
+def schema(data_schema_id, name, data_store_id=None, **values):
+    """The API representation of a data schema, `values` override the defaults"""
+    inputs = {
+        'created_ts': TS, 'data_schema_id': data_schema_id, 'data_store_id': data_store_id,
+        'description_markup': None, 'description_raw': None, 'name': name,
+        'schema_loc': None, 'steward': None, 'tech_poc': None, 'type': 'json',
+        'updated_ts': TS
+    }
+    inputs.update(values)
+    return inputs
+
+
+def field(field_id, name, **values):
+    """The API representation of a data field, `values` override the defaults"""
+    inputs = {
+        'created_ts': TS, 'data_format': 'varchar', 'data_type': 'string',
+        'description_markup': None, 'description_raw': None, 'field_id': field_id,
+        'full_path_name': name, 'name': name, 'nullable': True, 'parent_path': None,
+        'steward': None, 'tech_poc': None, 'type': 'scalar', 'updated_ts': TS
+    }
+    inputs.update(values)
+    return inputs
+
+
+def named(id_field, entity_id, name, **values):
+    """A minimal entity with only an ID, a name and `values`"""
+    values.update({id_field: entity_id, 'name': name})
+    return values
+
+
+def page(key, items):
+    """A single page listing `items` under `key`"""
+    return {key: items, 'meta': {'next_page': None, 'total_cnt': len(items)}}
@@ -0,0 +1,36 @@
+import asyncio
+import requests
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from treeschema.api import APIClient, AsyncAPIClient
+
+
+class TestAsyncAPIClient(unittest.TestCase):
+
+    def test_endpoint_methods_mirrored(self):
+        for name in ('get_all_users', 'get_data_store_by_id', 'create_transformation_links'):
+            assert asyncio.iscoroutinefunction(getattr(AsyncAPIClient, name))
+        assert not hasattr(AsyncAPIClient, 'configure_pool')
+
+    @patch('treeschema.api.client.r.Session.get')  
+    def test_concurrent_requests(self, mock_get):
+        test_obj = {'data_store': {'data_store_id': 1}}
+        response = requests.Response()
+        response.status_code = 200
+        response.json = MagicMock()
+        response.json.return_value = test_obj
+        mock_get.return_value = response
+
+        async def run_all():
+            async with AsyncAPIClient(max_workers=4) as client:
+                return await asyncio.gather(
+                    *[client.get_data_store_by_id(i) for i in range(20)]
+                )
+
+        results = asyncio.run(run_all())
+        assert len(results) == 20
+        assert all(res == test_obj for res in results)
+        assert mock_get.call_count == 20
@@ -13,7 +13,7 @@ from treeschema import exceptions as ts_exceptions
 
 class TestAPIClient(unittest.TestCase):
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_get_obj(self, mock_get):
         test_obj = {'data': 'value'}
         
@@ -27,7 +27,7 @@ class TestAPIClient(unittest.TestCase):
         resp = client._get_by_url('/an/endpoint')
         assert resp == test_obj
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_get_400(self, mock_get):
         response = requests.Response()
         response.status_code = 400
@@ -37,7 +37,7 @@ class TestAPIClient(unittest.TestCase):
         with pytest.raises(ts_exceptions.TreeSchemaApiError):
             client._get_by_url('/not/found/endpoint')
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_get_paginated(self, mock_get):
         response_objcts = [
             1, 2, 3, 4, 'a', 'b', {'c': 'd'}
@@ -64,7 +64,7 @@ class TestAPIClient(unittest.TestCase):
             )
         assert resp == response_objcts
 
-    @patch('treeschema.api.client.r.post')  
+    @patch('treeschema.api.client.r.Session.post')  
     def test_post_to_url(self, mock_get):
         test_obj = {'data': 'value'}
         
@@ -94,7 +94,7 @@ class TestAPIClient(unittest.TestCase):
         )
         assert resp == test_obj
 
-    @patch('treeschema.api.client.r.post')  
+    @patch('treeschema.api.client.r.Session.post')  
     def test_post_400(self, mock_get):
         response = requests.Response()
         response.status_code = 400
@@ -107,7 +107,7 @@ class TestAPIClient(unittest.TestCase):
                 json_body={'some': 'body'}
             )
 
-    @patch('treeschema.api.client.r.delete')  
+    @patch('treeschema.api.client.r.Session.delete')  
     def _delete_by_url(self, mock_get):
         test_obj = {'data': 'value'}
         
@@ -138,7 +138,7 @@ class TestAPIClient(unittest.TestCase):
         assert resp == False
 
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_get_users(self, mock_get):
         resp_users = [
             {
@@ -171,7 +171,7 @@ class TestAPIClient(unittest.TestCase):
         resp = client.get_all_users()
         assert resp == resp_users
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_get_user_by_email(self, mock_get):
         resp_user = {
                 "user_id": 2,
@@ -190,7 +190,7 @@ class TestAPIClient(unittest.TestCase):
         resp = client.get_user_by_email('asher@treeschema.com')
         assert resp == resp_obj
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_get_user(self, mock_get):
         resp_user = {
                 "user_id": 2,
@@ -209,7 +209,7 @@ class TestAPIClient(unittest.TestCase):
         resp = client.get_user_by_email(2)
         assert resp == resp_obj
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_get_all_data_stores(self, mock_get):
         resp_data_stores = [
             {
@@ -257,7 +257,7 @@ class TestAPIClient(unittest.TestCase):
 
 
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_data_store_by_name(self, mock_get):
         resp_data_store = {
             "data_store_id": 18,
@@ -294,7 +294,7 @@ class TestAPIClient(unittest.TestCase):
         resp = client.get_data_store_by_name('Kafka Prod Cluster')
         assert resp == resp_obj
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_data_store_by_id(self, mock_get):
         resp_data_store = {
             "data_store_id": 18,
@@ -332,7 +332,7 @@ class TestAPIClient(unittest.TestCase):
         assert resp == resp_obj
 
 
-    @patch('treeschema.api.client.r.post')  
+    @patch('treeschema.api.client.r.Session.post')  
     def test_create_data_store(self, mock_get):
         resp_data_store = {
             "data_store_id": 18,
@@ -369,7 +369,7 @@ class TestAPIClient(unittest.TestCase):
         resp = client.create_data_store({'data_store': 'inputs'})
         assert resp == resp_obj
 
-    @patch('treeschema.api.client.r.post')  
+    @patch('treeschema.api.client.r.Session.post')  
     def add_tag_to_data_store(self, mock_get):
         tags = ['new_tag', 'second tag']
         resp_statuses = ['added', 'exists']
@@ -390,7 +390,7 @@ class TestAPIClient(unittest.TestCase):
         assert resp == resp_data_store
 
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def get_all_schemas_for_data_store(self, mock_get):
         resp_data_schemas = [
             {
@@ -436,7 +436,7 @@ class TestAPIClient(unittest.TestCase):
         assert resp == resp_data_schemas
 
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_data_schema_by_name(self, mock_get):
         resp_data_schema = {
             "data_schema_id": 16,
@@ -474,7 +474,7 @@ class TestAPIClient(unittest.TestCase):
         assert resp == resp_obj
 
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_data_schema_by_id(self, mock_get):
         resp_data_schema = {
             "data_schema_id": 16,
@@ -512,7 +512,7 @@ class TestAPIClient(unittest.TestCase):
         assert resp == resp_obj
 
 
-    @patch('treeschema.api.client.r.post')  
+    @patch('treeschema.api.client.r.Session.post')  
     def test_create_data_schema(self, mock_get):
         resp_data_schema = {
             "data_schema_id": 16,
@@ -549,7 +549,7 @@ class TestAPIClient(unittest.TestCase):
         )
         assert resp == resp_obj
 
-    @patch('treeschema.api.client.r.post')  
+    @patch('treeschema.api.client.r.Session.post')  
     def add_tag_to_data_schema(self, mock_get):
         tags = ['new_tag', 'second tag']
         resp_statuses = ['added', 'exists']
@@ -574,7 +574,7 @@ class TestAPIClient(unittest.TestCase):
         assert resp == resp_data_store
 
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def get_all_fields_for_data_schema(self, mock_get):
         resp_data_fields = [
             {
@@ -624,7 +624,7 @@ class TestAPIClient(unittest.TestCase):
         )
         assert resp == resp_data_fields
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_data_field_by_name(self, mock_get):
         resp_data_field = {
             "field_id": 1,
@@ -666,7 +666,7 @@ class TestAPIClient(unittest.TestCase):
         )
         assert resp == resp_obj
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_data_field_by_id(self, mock_get):
         resp_data_field = {
             "field_id": 1,
@@ -708,7 +708,7 @@ class TestAPIClient(unittest.TestCase):
         )
         assert resp == resp_obj
 
-    @patch('treeschema.api.client.r.post')  
+    @patch('treeschema.api.client.r.Session.post')  
     def test_create_data_field(self, mock_get):
         resp_data_field = {
             "field_id": 1,
@@ -750,7 +750,7 @@ class TestAPIClient(unittest.TestCase):
         )
         assert resp == resp_obj
 
-    @patch('treeschema.api.client.r.post')  
+    @patch('treeschema.api.client.r.Session.post')  
     def test_update_field(self, mock_get):
         resp_data_field = {
             "field_id": 1,
@@ -794,7 +794,7 @@ class TestAPIClient(unittest.TestCase):
         assert resp == resp_obj
 
 
-    @patch('treeschema.api.client.r.post')  
+    @patch('treeschema.api.client.r.Session.post')  
     def add_tag_to_data_field(self, mock_get):
         tags = ['new_tag', 'second tag']
         resp_statuses = ['added', 'exists']
@@ -821,7 +821,7 @@ class TestAPIClient(unittest.TestCase):
 
 
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def get_get_all_values_for_field(self, mock_get):
         resp_field_values = [
             {
@@ -864,7 +864,7 @@ class TestAPIClient(unittest.TestCase):
         )
         assert resp == resp_field_values
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_get_field_value_by_name(self, mock_get):
         resp_field_value = {
             "field_value_id": 2,
@@ -891,7 +891,7 @@ class TestAPIClient(unittest.TestCase):
         )
         assert resp == resp_obj
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_get_field_value_by_id(self, mock_get):
         resp_field_value = {
             "field_value_id": 2,
@@ -918,7 +918,7 @@ class TestAPIClient(unittest.TestCase):
         )
         assert resp == resp_obj
 
-    @patch('treeschema.api.client.r.post')  
+    @patch('treeschema.api.client.r.Session.post')  
     def test_create_field_value(self, mock_get):
         resp_field_value = {
             "field_value_id": 2,
@@ -945,7 +945,7 @@ class TestAPIClient(unittest.TestCase):
         )
         assert resp == resp_obj
 
-    @patch('treeschema.api.client.r.post')  
+    @patch('treeschema.api.client.r.Session.post')  
     def test_update_field_value(self, mock_get):
         resp_data_field = {
             "field_value_id": 2,
@@ -974,7 +974,7 @@ class TestAPIClient(unittest.TestCase):
         assert resp == resp_obj
 
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_get_all_transformations(self, mock_get):
         resp_transformations = [
             {
@@ -1016,7 +1016,7 @@ class TestAPIClient(unittest.TestCase):
         resp = client.get_all_transformations()
         assert resp == resp_transformations
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_transformation_by_name(self, mock_get):
         resp_transformation = {
             "transformation_id": 25,
@@ -1049,7 +1049,7 @@ class TestAPIClient(unittest.TestCase):
         resp = client.get_transformation_by_name('My Tansform')
         assert resp == resp_obj
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_transformation_by_id(self, mock_get):
         resp_transformation = {
             "transformation_id": 25,
@@ -1082,7 +1082,7 @@ class TestAPIClient(unittest.TestCase):
         resp = client.get_transformation_by_id(1)
         assert resp == resp_obj
 
-    @patch('treeschema.api.client.r.post')  
+    @patch('treeschema.api.client.r.Session.post')  
     def test_create_transformation(self, mock_get):
         resp_transformation = {
             "transformation_id": 25,
@@ -1116,7 +1116,7 @@ class TestAPIClient(unittest.TestCase):
         assert resp == resp_obj
 
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_get_all_transformation_links(self, mock_get):
         resp_transformation_links = [
             {
@@ -1158,7 +1158,7 @@ class TestAPIClient(unittest.TestCase):
         )
         assert resp == resp_transformation_links
 
-    @patch('treeschema.api.client.r.post')  
+    @patch('treeschema.api.client.r.Session.post')  
     def test_get_transformation_link_by_id(self, mock_get):
         resp_transformation_links = {
             "links": [
@@ -1203,7 +1203,7 @@ class TestAPIClient(unittest.TestCase):
         )
         assert resp == resp_transformation_links
 
-    @patch('treeschema.api.client.r.post')  
+    @patch('treeschema.api.client.r.Session.post')  
     def test_create_transformation_link(self, mock_get):
         resp_data_store = {
             "data_store_id": 18,
@@ -1238,4 +1238,93 @@ class TestAPIClient(unittest.TestCase):
         
         client = APIClient()
         resp = client.create_data_store({'data_store': 'inputs'})
-        assert resp == resp_obj
\ No newline at end of file
+        assert resp == resp_obj
+
+class TestPagination(unittest.TestCase):
+
+    @staticmethod
+    def _page_response(page, page_cnt, per_page=3):
+        items = list(range((page - 1) * per_page, page * per_page))
+        resp_obj = {
+            "meta": {
+                "current_page": page,
+                "next_page": page + 1 if page < page_cnt else None,
+                "total_cnt": page_cnt * per_page
+            },
+            "data_response": items
+        }
+        response = requests.Response()
+        response.status_code = 200
+        response.json = MagicMock()
+        response.json.return_value = resp_obj
+        return response
+
+    @patch('treeschema.api.client.r.Session.get')  
+    def test_get_paginated_fan_out(self, mock_get):
+        mock_get.side_effect = lambda url, **kw: self._page_response(kw['params']['page'], 6)
+
+        client = APIClient()
+        resp = client._get_paginated_by_url(
+            '/an/endpoint',
+            pagininate_resp_key='data_response'
+        )
+        assert resp == list(range(18))
+        assert mock_get.call_count == 6
+
+    @patch('treeschema.api.client.r.Session.get')  
+    def test_get_paginated_grows_during_fan_out(self, mock_get):
+        # Page 1 reports 2 pages but the listing has grown to 3 by the time
+        # the remaining pages are read
+        def get_page(url, **kw):
+            page = kw['params']['page']
+            resp = self._page_response(page, 3)
+            if page == 1:
+                resp.json.return_value['meta']['total_cnt'] = 6
+            return resp
+        mock_get.side_effect = get_page
+
+        client = APIClient()
+        resp = client._get_paginated_by_url(
+            '/an/endpoint',
+            pagininate_resp_key='data_response'
+        )
+        assert resp == list(range(9))
+        assert mock_get.call_count == 3
+
+    @patch('treeschema.api.client.r.Session.get')  
+    def test_get_paginated_serial(self, mock_get):
+        mock_get.side_effect = lambda url, **kw: self._page_response(kw['params']['page'], 4)
+
+        client = APIClient()
+        client.page_workers = 1
+        resp = client._get_paginated_by_url(
+            '/an/endpoint',
+            pagininate_resp_key='data_response'
+        )
+        assert resp == list(range(12))
+        assert mock_get.call_count == 4
+
+    @patch('treeschema.api.client.r.Session.get')  
+    def test_iter_paginated(self, mock_get):
+        mock_get.side_effect = lambda url, **kw: self._page_response(kw['params']['page'], 3)
+
+        client = APIClient()
+        entities = client._iter_paginated_by_url(
+            '/an/endpoint',
+            pagininate_resp_key='data_response'
+        )
+        assert next(entities) == 0
+        assert list(entities) == list(range(1, 9))
+        assert mock_get.call_count == 3
+
+    @patch('treeschema.api.client.r.Session.get')  
+    def test_iter_all_fields_for_schema(self, mock_get):
+        mock_get.side_effect = [self._fields_page(1), self._fields_page(2)]
+
+        client = APIClient()
+        assert list(client.iter_all_fields_for_schema(1, 2)) == list(range(6))
+
+    def _fields_page(self, page):
+        resp = self._page_response(page, 2)
+        resp.json.return_value['data_fields'] = resp.json.return_value.pop('data_response')
+        return resp
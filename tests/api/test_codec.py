@@ -0,0 +1,62 @@
+import gzip
+import json
+import requests
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from treeschema.api import APIClient, codec
+
+
+class TestCodec(unittest.TestCase):
+
+    def tearDown(self):
+        APIClient.configure_codec('json')
+
+    def test_get_codec(self):
+        assert codec.get_codec('json').name == 'json'
+        expected = 'orjson' if codec.orjson is not None else 'json'
+        assert codec.get_codec('auto').name == expected
+        with pytest.raises(ValueError):
+            codec.get_codec('yaml')
+
+    def test_accept_encoding(self):
+        session = APIClient().session
+        assert 'gzip' in session.headers['Accept-Encoding']
+
+    def test_default_body_inputs(self):
+        inputs = APIClient()._json_body_inputs({'a': 1})
+        assert inputs['json'] == {'a': 1}
+
+    def test_compressed_body_inputs(self):
+        APIClient.configure_codec('json', compress_min_bytes=10)
+        client = APIClient()
+
+        small = client._json_body_inputs({'a': 1})
+        assert 'Content-Encoding' not in small['headers']
+        assert json.loads(small['data']) == {'a': 1}
+
+        body = {'links': [{'source_field_id': i, 'target_field_id': i + 1} for i in range(50)]}
+        large = client._json_body_inputs(body)
+        assert large['headers']['Content-Encoding'] == 'gzip'
+        assert large['headers']['Content-Type'] == 'application/json'
+        assert json.loads(gzip.decompress(large['data'])) == body
+
+        # Identical bodies compress to identical bytes
+        with patch('gzip.time.time', return_value=1e9):
+            assert client._json_body_inputs(body)['data'] == large['data']
+
+    @pytest.mark.skipif(codec.orjson is None, reason='orjson is not installed')
+    @patch('treeschema.api.client.r.Session.post')
+    def test_orjson_round_trip(self, mock_post):
+        test_obj = {'data_fields': [{'field_id': 1, 'name': 'a'}]}
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(test_obj).encode('utf-8')
+        mock_post.return_value = response
+
+        APIClient.configure_codec('orjson')
+        resp = APIClient()._post_to_url('/an/endpoint', json_body={'any': 'json'})
+        assert resp == test_obj
+        assert json.loads(mock_post.call_args[1]['data']) == {'any': 'json'}
@@ -0,0 +1,95 @@
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from treeschema.api import APIClient
+
+
+class _CatalogHandler(BaseHTTPRequestHandler):
+    """Serves a fixed JSON document with an ETag and honors If-None-Match"""
+    body = {'data_stores': [{'data_store_id': 1, 'name': 'ds'}], 'next_page': None}
+    etag = '"v1"'
+    requests_seen = []
+
+    def do_GET(self):
+        self.requests_seen.append(dict(self.headers))
+        if self.headers.get('If-None-Match') == self.etag:
+            self.send_response(304)
+            self.send_header('ETag', self.etag)
+            self.end_headers()
+            return
+        content = json.dumps(self.body).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.send_header('ETag', self.etag)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHttpCache(unittest.TestCase):
+
+    def setUp(self):
+        _CatalogHandler.requests_seen = []
+        _CatalogHandler.etag = '"v1"'
+        self.server = HTTPServer(('127.0.0.1', 0), _CatalogHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = 'http://127.0.0.1:%d/data-stores' % self.server.server_port
+        self.cache = APIClient.configure_http_cache()
+
+    def tearDown(self):
+        APIClient.configure_http_cache(max_entries=0)
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_not_modified_served_from_cache(self):
+        client = APIClient()
+        first = client._get_by_url(self.url)
+        first['data_stores'][0]['name'] = 'mutated by caller'
+
+        second = client._get_by_url(self.url)
+        assert second == _CatalogHandler.body
+        assert _CatalogHandler.requests_seen[1]['If-None-Match'] == '"v1"'
+        assert self.cache.hits == 1
+        assert self.cache.misses == 1
+
+    def test_raw_content_stored(self):
+        client = APIClient()
+        client._get_by_url(self.url)
+        assert self.cache.get((self.url, ())).content == json.dumps(_CatalogHandler.body).encode()
+
+        # Every 304 is decoded into its own objects
+        second = client._get_by_url(self.url)
+        third = client._get_by_url(self.url)
+        assert second == third and second is not third
+        assert second['data_stores'][0] is not third['data_stores'][0]
+
+    def test_changed_resource_refreshes_cache(self):
+        client = APIClient()
+        client._get_by_url(self.url)
+        _CatalogHandler.etag = '"v2"'
+        client._get_by_url(self.url)
+        client._get_by_url(self.url)
+        assert self.cache.misses == 2
+        assert self.cache.hits == 1
+        assert self.cache.get((self.url, ())).etag == '"v2"'
+
+    def test_disabled_by_default(self):
+        APIClient.configure_http_cache(max_entries=0)
+        client = APIClient()
+        client._get_by_url(self.url)
+        client._get_by_url(self.url)
+        assert all('If-None-Match' not in h for h in _CatalogHandler.requests_seen)
+
+    def test_lru_eviction(self):
+        cache = APIClient.configure_http_cache(max_entries=1)
+        client = APIClient()
+        client._get_by_url(self.url)
+        client._get_by_url(self.url + '?page=2')
+        assert len(cache) == 1
+        assert cache.get((self.url, ())) is None
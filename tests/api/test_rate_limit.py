@@ -0,0 +1,66 @@
+import os
+import requests
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from treeschema.api import APIClient, endpoints
+from treeschema.api import rate_limit
+
+
+class TestRateLimit(unittest.TestCase):
+
+    def tearDown(self):
+        APIClient.configure_rate_limits()
+
+    def test_endpoint_family(self):
+        field_url = endpoints.FIELD.format(data_store_id=1, data_schema_id=2, field_id=3)
+        parse_url = endpoints.PARSE_MANIFEST.format(data_store_id=1)
+        assert rate_limit.endpoint_family('get', field_url) == rate_limit.READS
+        assert rate_limit.endpoint_family('post', field_url) == rate_limit.WRITES
+        assert rate_limit.endpoint_family('delete', field_url) == rate_limit.WRITES
+        assert rate_limit.endpoint_family('post', endpoints.BATCH_ASSETS) == rate_limit.BATCH_ASSETS
+        assert rate_limit.endpoint_family('post', parse_url) == rate_limit.DBT
+
+    @patch('treeschema.api.rate_limit.time.sleep')
+    def test_token_bucket_waits_when_empty(self, mock_sleep):
+        bucket = rate_limit.TokenBucket(rate=2, capacity=2)
+        with patch('treeschema.api.rate_limit.time.monotonic', return_value=10):
+            bucket._updated = 10
+            assert bucket.acquire() == 0
+            assert bucket.acquire() == 0
+
+        clock = iter([10, 10.5])
+        with patch('treeschema.api.rate_limit.time.monotonic', side_effect=lambda: next(clock)):
+            assert bucket.acquire() == 0.5
+        mock_sleep.assert_called_once_with(0.5)
+
+    def test_file_bucket_shared(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'reads.bucket')
+            first = rate_limit.FileTokenBucket(path, rate=0.001, capacity=3)
+            second = rate_limit.FileTokenBucket(path, rate=0.001, capacity=3)
+            assert first.acquire() == 0
+            assert second.acquire() == 0
+            assert first.acquire() == 0
+            # Both buckets draw from the same three tokens
+            with patch('treeschema.api.rate_limit.time.sleep', side_effect=InterruptedError):
+                with pytest.raises(InterruptedError):
+                    second.acquire()
+            first.close()
+            second.close()
+
+    @patch('treeschema.api.client.r.Session.get')
+    def test_client_acquires_token(self, mock_get):
+        response = requests.Response()
+        response.status_code = 200
+        response.json = MagicMock()
+        response.json.return_value = {}
+        mock_get.return_value = response
+
+        limiter = APIClient.configure_rate_limits(reads=100)
+        limiter.buckets[rate_limit.READS] = MagicMock()
+        APIClient()._get_by_url(endpoints.DATA_STORES)
+        limiter.buckets[rate_limit.READS].acquire.assert_called_once_with()
@@ -0,0 +1,172 @@
+import requests
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from treeschema.api import APIClient
+from treeschema.api.resilience import CircuitBreaker, RetryPolicy
+from treeschema import exceptions as ts_exceptions
+
+
+def _response(status_code, body=None, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response.json = MagicMock()
+    response.json.return_value = body
+    return response
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_backoff_bounds(self):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5)
+        for attempt in range(10):
+            assert 0 <= policy.backoff(attempt) <= min(5, 2 ** attempt)
+
+    def test_retry_after(self):
+        policy = RetryPolicy()
+        assert policy.retry_after(_response(429, headers={'Retry-After': '7'})) == 7
+        assert policy.retry_after(_response(429)) is None
+        http_date = 'Wed, 21 Oct 2015 07:28:00 GMT'
+        assert policy.retry_after(_response(429, headers={'Retry-After': http_date})) == 0
+
+    def test_response_delay(self):
+        policy = RetryPolicy(max_retries=2, max_retry_after=60)
+        # Non-idempotent requests are only retried on 429
+        assert policy.response_delay(_response(502), 0, idempotent=False) is None
+        assert policy.response_delay(_response(502), 0, idempotent=True) is not None
+        assert policy.response_delay(_response(429), 0, idempotent=False) is not None
+        # Retry-After is honored up to the maximum
+        resp = _response(429, headers={'Retry-After': '12'})
+        assert policy.response_delay(resp, 0, idempotent=True) == 12
+        resp = _response(429, headers={'Retry-After': '120'})
+        assert policy.response_delay(resp, 0, idempotent=True) is None
+        # Client errors and exhausted retries are returned to the caller
+        assert policy.response_delay(_response(404), 0, idempotent=True) is None
+        assert policy.response_delay(_response(503), 2, idempotent=True) is None
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def test_open_and_reset(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+        with patch('treeschema.api.resilience.time.monotonic', return_value=100):
+            breaker.record_failure()
+            breaker.before_request()
+            breaker.record_failure()
+            assert breaker.state == CircuitBreaker.OPEN
+            with pytest.raises(ts_exceptions.CircuitBreakerOpen):
+                breaker.before_request()
+
+        with patch('treeschema.api.resilience.time.monotonic', return_value=111):
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            # Only a single trial request is allowed
+            breaker.before_request()
+            with pytest.raises(ts_exceptions.CircuitBreakerOpen):
+                breaker.before_request()
+            breaker.record_success()
+            assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_trial_reopens(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+        with patch('treeschema.api.resilience.time.monotonic', return_value=100):
+            breaker.record_failure()
+        with patch('treeschema.api.resilience.time.monotonic', return_value=111):
+            breaker.before_request()
+            breaker.record_failure()
+            assert breaker.state == CircuitBreaker.OPEN
+
+
+    def test_release_allows_another_trial(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+        with patch('treeschema.api.resilience.time.monotonic', return_value=100):
+            breaker.record_failure()
+        with patch('treeschema.api.resilience.time.monotonic', return_value=111):
+            breaker.before_request()
+            breaker.release()
+            breaker.before_request()
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+
+
+@patch('treeschema.api.client.time.sleep')
+class TestClientResilience(unittest.TestCase):
+
+    def setUp(self):
+        APIClient.configure_resilience(max_retries=3, failure_threshold=3)
+
+    def tearDown(self):
+        APIClient.configure_resilience()
+
+    @patch('treeschema.api.client.r.Session.get')
+    def test_get_retried(self, mock_get, mock_sleep):
+        test_obj = {'data': 'value'}
+        mock_get.side_effect = [_response(502), _response(503), _response(200, test_obj)]
+
+        resp = APIClient()._get_by_url('/an/endpoint')
+        assert resp == test_obj
+        assert mock_get.call_count == 3
+        assert mock_get.call_args[1]['timeout'] == (10, 60)
+
+    @patch('treeschema.api.client.r.Session.get')
+    def test_get_connection_error_retried(self, mock_get, mock_sleep):
+        test_obj = {'data': 'value'}
+        mock_get.side_effect = [requests.exceptions.ConnectionError(), _response(200, test_obj)]
+
+        assert APIClient()._get_by_url('/an/endpoint') == test_obj
+
+    @patch('treeschema.api.client.r.Session.post')
+    def test_post_not_retried(self, mock_post, mock_sleep):
+        mock_post.return_value = _response(502)
+
+        with pytest.raises(ts_exceptions.TreeSchemaApiError) as exc_info:
+            APIClient()._post_to_url('/an/endpoint', json_body={})
+        assert exc_info.value.status_code == 502
+        assert mock_post.call_count == 1
+
+    @patch('treeschema.api.client.r.Session.post')
+    def test_post_retry_after(self, mock_post, mock_sleep):
+        test_obj = {'data': 'value'}
+        mock_post.side_effect = [
+            _response(429, headers={'Retry-After': '4'}),
+            _response(201, test_obj)
+        ]
+
+        assert APIClient()._post_to_url('/an/endpoint', json_body={}) == test_obj
+        mock_sleep.assert_called_once_with(4.0)
+
+    @patch('treeschema.api.client.r.Session.get')
+    def test_circuit_breaker_fails_fast(self, mock_get, mock_sleep):
+        mock_get.return_value = _response(503)
+        APIClient.configure_resilience(max_retries=0, failure_threshold=2)
+
+        client = APIClient()
+        for _ in range(2):
+            with pytest.raises(ts_exceptions.TreeSchemaApiError):
+                client._get_by_url('/an/endpoint')
+
+        with pytest.raises(ts_exceptions.CircuitBreakerOpen):
+            client._get_by_url('/an/endpoint')
+        assert mock_get.call_count == 2
+
+    @patch('treeschema.api.client.r.Session.get')
+    def test_failed_trial_with_other_error(self, mock_get, mock_sleep):
+        APIClient.configure_resilience(max_retries=0, failure_threshold=1, reset_timeout=10)
+        client = APIClient()
+        with patch('treeschema.api.resilience.time.monotonic', return_value=100):
+            mock_get.return_value = _response(503)
+            with pytest.raises(ts_exceptions.TreeSchemaApiError):
+                client._get_by_url('/an/endpoint')
+
+        with patch('treeschema.api.resilience.time.monotonic', return_value=111):
+            mock_get.side_effect = requests.exceptions.ChunkedEncodingError()
+            with pytest.raises(requests.exceptions.ChunkedEncodingError):
+                client._get_by_url('/an/endpoint')
+            assert APIClient.circuit_breaker.state == CircuitBreaker.OPEN
+
+        with patch('treeschema.api.resilience.time.monotonic', return_value=122):
+            mock_get.side_effect = None
+            mock_get.return_value = _response(200, {'data': 'value'})
+            assert client._get_by_url('/an/endpoint') == {'data': 'value'}
+            assert APIClient.circuit_breaker.state == CircuitBreaker.CLOSED
@@ -0,0 +1,30 @@
+import unittest
+from unittest.mock import patch
+
+from treeschema.api import APIClient
+from treeschema.api import session
+
+
+class TestSession(unittest.TestCase):
+
+    def tearDown(self):
+        session.configure_pool()
+
+    def test_session_shared_between_clients(self):
+        assert APIClient().session is APIClient().session
+
+    def test_configure_pool(self):
+        original = APIClient().session
+        APIClient.configure_pool(pool_maxsize=25, pool_block=True, keep_alive=False)
+        new_session = APIClient().session
+
+        assert new_session is not original
+        adapter = new_session.get_adapter('https://api.treeschema.com')
+        assert adapter._pool_maxsize == 25
+        assert adapter._pool_block == True
+        assert new_session.headers['Connection'] == 'close'
+
+    def test_new_session_after_fork(self):
+        original = session.get_session()
+        with patch('treeschema.api.session.os.getpid', return_value=-1):
+            assert session.get_session() is not original
@@ -0,0 +1,84 @@
+import threading
+import requests
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from treeschema.api import APIClient
+from treeschema.api.single_flight import SingleFlight, request_key
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_request_key(self):
+        assert request_key('/a', {'page': 1, 'name': 'x'}) == request_key('/a', {'name': 'x', 'page': 1})
+        assert request_key('/a') != request_key('/a', {'page': 1})
+
+    def test_concurrent_calls_shared(self):
+        single_flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def slow_call():
+            calls.append(1)
+            release.wait(5)
+            return {'user': {'user_id': 1}}
+
+        results = []
+        def worker():
+            results.append(single_flight.do('key', slow_call))
+
+        threads = [threading.Thread(target=worker) for _ in range(10)]
+        for t in threads:
+            t.start()
+        while single_flight.shared < 9:
+            threading.Event().wait(0.01)
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert len(results) == 10
+        assert all(res == {'user': {'user_id': 1}} for res in results)
+        # Every caller receives its own copy
+        assert len(set(id(res) for res in results)) == 10
+
+    def test_errors_shared(self):
+        def failing_call():
+            raise ValueError('failed')
+
+        single_flight = SingleFlight()
+        with pytest.raises(ValueError):
+            single_flight.do('key', failing_call)
+        # A failed flight is not reused by later calls
+        assert single_flight.do('key', lambda: 1) == 1
+
+    @patch('treeschema.api.client.r.Session.get')
+    def test_client_shares_get(self, mock_get):
+        release = threading.Event()
+        response = requests.Response()
+        response.status_code = 200
+        response.json = MagicMock()
+        response.json.return_value = {'data_schema': {'data_schema_id': 1}}
+
+        def slow_get(url, **kwargs):
+            release.wait(5)
+            return response
+        mock_get.side_effect = slow_get
+
+        client = APIClient()
+        shared_before = APIClient.single_flight.shared
+        threads = [
+            threading.Thread(target=client.get_data_schema_by_id, args=(1, 1)) 
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        while APIClient.single_flight.shared - shared_before < 4:
+            threading.Event().wait(0.01)
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert mock_get.call_count == 1
@@ -0,0 +1,81 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pytest
+
+from treeschema.api import APIClient, endpoints
+from treeschema.api.transport import (
+    InMemoryTransport, RecordingTransport, ReplayTransport
+)
+from treeschema.exceptions import TreeSchemaApiError
+
+
+DATA_STORES = {
+    'data_stores': [{'data_store_id': 1, 'name': 'ds'}],
+    'next_page': None,
+    'total_cnt': 1
+}
+
+
+class TestTransport(unittest.TestCase):
+
+    def tearDown(self):
+        APIClient.configure_transport()
+
+    def test_in_memory_transport(self):
+        transport = APIClient.configure_transport(InMemoryTransport())
+        transport.add('get', endpoints.DATA_STORES, DATA_STORES)
+
+        assert APIClient().get_all_data_stores() == DATA_STORES['data_stores']
+        assert transport.requests[0][:2] == ('get', endpoints.DATA_STORES)
+
+        with pytest.raises(TreeSchemaApiError) as e:
+            APIClient()._get_by_url(endpoints.USERS)
+        assert e.value.status_code == 404
+
+    def test_record_and_replay(self):
+        batch = {'data_stores': [{'data_store_id': 1}], 'schemas': [], 'fields': []}
+        inner = InMemoryTransport()
+        inner.add('get', endpoints.DATA_STORES, DATA_STORES)
+        inner.add(
+            'post', endpoints.BATCH_ASSETS,
+            handler=lambda method, url, **kw: (200, dict(batch, ids=kw['json']))
+        )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'session.jsonl')
+            recorder = APIClient.configure_transport(RecordingTransport(path, inner))
+            client = APIClient()
+            client.get_all_data_stores()
+            first = client.batch_retrieve_assets({'data_store_ids': [1]})
+            second = client.batch_retrieve_assets({'data_store_ids': [2]})
+            recorder.close()
+
+            replay = APIClient.configure_transport(ReplayTransport(path))
+            assert len(replay) == 3
+            client = APIClient()
+            assert client.get_all_data_stores() == DATA_STORES['data_stores']
+            # Requests with different bodies are matched to their own response
+            assert client.batch_retrieve_assets({'data_store_ids': [2]}) == second
+            assert client.batch_retrieve_assets({'data_store_ids': [1]}) == first
+            with pytest.raises(TreeSchemaApiError):
+                client.batch_retrieve_assets({'data_store_ids': [3]})
+
+    @patch('treeschema.api.transport.time.sleep')
+    def test_replay_realtime(self, mock_sleep):
+        inner = InMemoryTransport()
+        inner.add('get', endpoints.DATA_STORES, DATA_STORES)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'session.jsonl')
+            clock = iter([0, 5, 5.25])
+            with patch('treeschema.api.transport.time.monotonic', side_effect=lambda: next(clock)):
+                recorder = RecordingTransport(path, inner)
+                recorder.send('get', endpoints.DATA_STORES)
+                recorder.close()
+
+            ReplayTransport(path).send('get', endpoints.DATA_STORES)
+            mock_sleep.assert_not_called()
+            ReplayTransport(path, realtime=True, speed=0.5).send('get', endpoints.DATA_STORES)
+            mock_sleep.assert_called_once_with(0.5)
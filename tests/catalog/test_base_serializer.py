@@ -1,10 +1,20 @@
+import gc
 import unittest
 
 import mock
 import pytest
 
 import treeschema
-from treeschema.catalog.base_serializer import TreeSchemaSerializer
+from treeschema.api import APIClient, endpoints
+from treeschema.api.transport import InMemoryTransport
+from treeschema.catalog import (
+    DataField,
+    DataSchema,
+    Transformation,
+    TreeSchemaUser,
+    lazy_handles
+)
+from treeschema.catalog.base_serializer import TreeSchemaSerializer, _identity_map
 
 
 class TestBaseSerializer(unittest.TestCase):
@@ -58,3 +68,176 @@ class TestBaseSerializer(unittest.TestCase):
             
             assert scalar_from_obj == scalar_from_id
             
+
+
+def _field_inputs(field_id, description):
+    return {
+        'created_ts': '2020-09-23 18:16:16',
+        'data_format': 'varchar',
+        'data_type': 'string',
+        'description_markup': None,
+        'description_raw': description,
+        'field_id': field_id,
+        'full_path_name': 'parent.field_%s' % field_id,
+        'name': 'field_%s' % field_id,
+        'nullable': True,
+        'parent_path': 'parent',
+        'steward': None,
+        'tech_poc': None,
+        'type': 'scalar',
+        'updated_ts': '2020-09-23 18:16:16'
+    }
+
+
+def _schema_inputs(data_schema_id):
+    return {
+        'created_ts': '2020-09-23 18:16:16',
+        'data_schema_id': data_schema_id,
+        'description_markup': None,
+        'description_raw': None,
+        'name': 'schema_%s' % data_schema_id,
+        'schema_loc': None,
+        'steward': None,
+        'tech_poc': None,
+        'type': 'json',
+        'updated_ts': '2020-09-23 18:16:16'
+    }
+
+
+class TestIdentityMap(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = APIClient.configure_transport(InMemoryTransport())
+
+    def tearDown(self):
+        APIClient.configure_transport()
+
+    def test_one_instance_per_entity(self):
+        field = DataField(_field_inputs(8101, 'first'), data_store_id=1, data_schema_id=2)
+        field._field_values_retrieved = True
+
+        # A complete dictionary updates the shared instance
+        again = DataField(_field_inputs(8101, 'second'), data_store_id=1, data_schema_id=2)
+        assert again is field
+        assert field.description_raw == 'second'
+        assert field._field_values_retrieved
+        assert self.transport.requests == []
+
+        # An ID is retrieved again and refreshes the shared instance
+        url = endpoints.FIELD.format(data_store_id=1, data_schema_id=2, field_id=8101)
+        self.transport.add('get', url, {'data_field': _field_inputs(8101, 'third')})
+        assert DataField(8101, data_store_id=1, data_schema_id=2) is field
+        assert field.description_raw == 'third'
+        assert field._field_values_retrieved
+        assert len(self.transport.requests) == 1
+
+        # A lazy ID returns the instance in memory without a request
+        assert DataField(8101, data_store_id=1, data_schema_id=2, lazy=True) is field
+        assert len(self.transport.requests) == 1
+
+    def test_instances_are_released(self):
+        DataField(_field_inputs(8102, 'first'), data_store_id=1, data_schema_id=2)
+        gc.collect()
+        assert (DataField, 8102) not in _identity_map
+
+
+class TestLazyHandles(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = APIClient.configure_transport(InMemoryTransport())
+
+    def tearDown(self):
+        APIClient.configure_transport()
+
+    def test_hydrate_on_first_use(self):
+        url = endpoints.FIELD.format(data_store_id=1, data_schema_id=2, field_id=8501)
+        self.transport.add('get', url, {'data_field': _field_inputs(8501, 'lazy')})
+
+        field = DataField(8501, data_store_id=1, data_schema_id=2, lazy=True)
+        assert field.is_lazy
+        assert field.id == 8501
+        assert field.field_id == 8501
+        assert 'lazy 8501' in repr(field)
+        assert self.transport.requests == []
+
+        assert field.name == 'field_8501'
+        assert not field.is_lazy
+        assert field.description_raw == 'lazy'
+        assert len(self.transport.requests) == 1
+
+        # The handle is the shared instance for the ID
+        assert DataField(8501, data_store_id=1, data_schema_id=2, lazy=True) is field
+        assert len(self.transport.requests) == 1
+
+    def test_lazy_user(self):
+        url = endpoints.USER.format(user_id=8505)
+        self.transport.add(
+            'get', url, {'user': {'user_id': 8505, 'name': 'Lazy', 'email': 'lazy@treeschema.com'}}
+        )
+
+        user = TreeSchemaUser(8505, lazy=True)
+        assert user.is_lazy
+        assert user.id == 8505
+        assert self.transport.requests == []
+
+        assert user.email == 'lazy@treeschema.com'
+        assert not user.is_lazy
+        assert len(self.transport.requests) == 1
+
+    def test_collections_hydrate_handle(self):
+        url = endpoints.FIELD.format(data_store_id=1, data_schema_id=2, field_id=8503)
+        self.transport.add('get', url, {'data_field': _field_inputs(8503, 'tagged')})
+
+        field = DataField(8503, data_store_id=1, data_schema_id=2, lazy=True)
+        assert field.tags == []
+        assert not field.is_lazy
+        assert len(self.transport.requests) == 1
+
+    def test_fields_table_hydrates_handles(self):
+        schema = DataSchema(_schema_inputs(8520), data_store_id=1)
+        schema._fields_retrieved = True
+        schema.field(_field_inputs(8521, 'listed'), pre_fetch=False)
+        with lazy_handles():
+            lazy_field = schema.field(8522, pre_fetch=False)
+        assert lazy_field.is_lazy
+
+        url = endpoints.FIELD.format(data_store_id=1, data_schema_id=8520, field_id=8522)
+        self.transport.add('get', url, {'data_field': _field_inputs(8522, 'lazy')})
+        table = schema.fields_table()
+        assert len(table) == 2
+        assert not lazy_field.is_lazy
+
+    def test_complete_inputs_hydrate_handle(self):
+        with lazy_handles():
+            field = DataField(8502, data_store_id=1, data_schema_id=2)
+        assert field.is_lazy
+
+        DataField(_field_inputs(8502, 'listed'), data_store_id=1, data_schema_id=2)
+        assert not field.is_lazy
+        assert field.name == 'field_8502'
+        assert self.transport.requests == []
+
+    def test_create_links_without_reads(self):
+        url = endpoints.TRANSFORMATION_LINKS.format(transformation_id=8510)
+        self.transport.add('post', url, {'updated_links': []})
+
+        with lazy_handles():
+            transformation = Transformation(8510)
+            links = [
+                (
+                    DataField(8511, data_store_id=1, data_schema_id=2),
+                    DataField(8512, data_store_id=1, data_schema_id=3)
+                ),
+                (
+                    DataField(8513, data_store_id=1, data_schema_id=2),
+                    DataField(8514, data_store_id=1, data_schema_id=3)
+                ),
+            ]
+        transformation.create_links(links)
+
+        assert [(m, u) for m, u, _ in self.transport.requests] == [('post', url)]
+        sent = self.transport.requests[0][2]['json']['links']
+        assert [(l['source_field_id'], l['target_field_id']) for l in sent] == [
+            (8511, 8512), (8513, 8514)
+        ]
+        assert all(f.is_lazy for link in links for f in link)
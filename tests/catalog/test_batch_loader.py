@@ -0,0 +1,79 @@
+import unittest
+
+import pytest
+
+from treeschema.api import APIClient, endpoints
+from treeschema.api.transport import InMemoryTransport
+from treeschema.catalog import DataField, DataSchema, DataStore, batch_loading
+from treeschema.exceptions import DataAssetDoesNotExist
+from .. import data_store, field, schema
+
+
+
+class TestBatchLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = APIClient.configure_transport(InMemoryTransport())
+
+    def tearDown(self):
+        APIClient.configure_transport()
+
+    def batches(self, request, response_by_id):
+        body = request['json']['assets']
+        return 200, {
+            'data_stores': [], 'data_schemas': [],
+            'data_fields': [response_by_id[a['id']] for a in body if a['id'] in response_by_id]
+        }
+
+    def test_fields_are_batched(self):
+        fields = {i: field(i, 'field_%s' % i, data_schema_id=2) for i in range(8601, 8851)}
+        self.transport.add(
+            'post', endpoints.BATCH_ASSETS, None,
+            handler=lambda method, url, **kwargs: self.batches(kwargs, fields)
+        )
+
+        with batch_loading() as loader:
+            handles = [DataField(i, data_store_id=1, data_schema_id=2) for i in fields]
+        assert len(loader) == 250
+        assert self.transport.requests == []
+
+        names = [f.name for f in handles]
+        assert names == ['field_%s' % i for i in fields]
+        assert loader.requests == 3
+        assert len(self.transport.requests) == 3
+        assert [len(kwargs['json']['assets']) for _, _, kwargs in self.transport.requests] == [
+            100, 100, 50
+        ]
+        assert not any(f.is_lazy for f in handles)
+
+    def test_mixed_assets(self):
+        self.transport.add('post', endpoints.BATCH_ASSETS, {
+            'data_stores': [data_store(8901, 'store_8901')],
+            'data_schemas': [schema(8911, 'schema_8911', 8901)],
+            'data_fields': []
+        })
+
+        with batch_loading():
+            store = DataStore(8901)
+            data_schema = DataSchema(8911, data_store_id=8901)
+        assert data_schema.name == 'schema_8911'
+        assert store.name == 'store_8901'
+        assert len(self.transport.requests) == 1
+        assert self.transport.requests[0][2]['json']['assets'] == [
+            {'type': 'data_store', 'id': 8901}, {'type': 'schema', 'id': 8911}
+        ]
+
+    def test_missing_assets_are_retrieved_individually(self):
+        self.transport.add('post', endpoints.BATCH_ASSETS, {
+            'data_stores': [], 'data_schemas': [], 'data_fields': []
+        })
+        url = endpoints.FIELD.format(data_store_id=1, data_schema_id=2, field_id=8951)
+        self.transport.add('get', url, {'data_field': None})
+
+        with batch_loading():
+            handle = DataField(8951, data_store_id=1, data_schema_id=2)
+        with pytest.raises(DataAssetDoesNotExist):
+            handle.name
+        assert [(m, u) for m, u, _ in self.transport.requests] == [
+            ('post', endpoints.BATCH_ASSETS), ('get', url)
+        ]
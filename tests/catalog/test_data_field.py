@@ -34,7 +34,7 @@ class TestDataField(unittest.TestCase):
     def test_create_data_field(self):
         DataField(self.data_field_inputs, data_store_id=1, data_schema_id=1)
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_field_values_access(self, mock_get):
         test_obj = {'meta': {'next_page': None}, 'field_values': []}
         response = requests.Response()
@@ -46,7 +46,7 @@ class TestDataField(unittest.TestCase):
         df = DataField(self.data_field_inputs, data_store_id=1, data_schema_id=1)
         df._field_values_by_id is df.field_values
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_add_remove_field_values(self, mock_get):
         test_obj = {'meta': {'next_page': None}, 'field_values': []}
         response = requests.Response()
@@ -30,7 +30,7 @@ class TestDataSchema(unittest.TestCase):
     def test_create_data_schema(self):
         DataSchema(self.data_schema_inputs, data_store_id=1)
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_fields_access(self, mock_get):
         test_obj = {'meta': {'next_page': None}, 'data_fields': []}
         response = requests.Response()
@@ -42,7 +42,7 @@ class TestDataSchema(unittest.TestCase):
         ds = DataSchema(self.data_schema_inputs, data_store_id=1)
         ds._fields_by_id is ds.fields
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_add_remove_fields(self, mock_get):
         test_obj = {'meta': {'next_page': None}, 'data_fields': []}
         response = requests.Response()
@@ -71,3 +71,35 @@ class TestDataSchema(unittest.TestCase):
         assert ds.fields == {}
         assert ds._fields_by_id == {}
         assert ds._fields_by_name == {}
+
+    @patch('treeschema.api.client.r.Session.get')  
+    def test_iter_fields(self, mock_get):
+        field_inputs = {
+            'created_ts': '2020-01-01 00:00:00',
+            'data_format': 'string',
+            'data_type': 'string',
+            'description_markup': None,
+            'description_raw': None,
+            'field_id': 1,
+            'full_path_name': 'field_a',
+            'name': 'field_a',
+            'nullable': True,
+            'parent_path': None,
+            'steward': None,
+            'tech_poc': None,
+            'type': 'scalar',
+            'updated_ts': '2020-01-01 00:00:00'
+        }
+        test_obj = {'meta': {'next_page': None}, 'data_fields': [field_inputs]}
+        response = requests.Response()
+        response.status_code = 200
+        response.json = MagicMock()
+        response.json.return_value = test_obj
+        mock_get.return_value = response
+
+        ds = DataSchema(self.data_schema_inputs, data_store_id=1)
+        fields = list(ds.iter_fields())
+
+        assert [f.id for f in fields] == [1]
+        assert ds._fields_retrieved == False
+        assert ds._fields_by_id == {}
@@ -31,7 +31,7 @@ class TestDataStore(unittest.TestCase):
     def test_create_data_store(self):
         DataStore(self.data_store_inputs)
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_schemas_access(self, mock_get):
         test_obj = {'meta': {'next_page': None}, 'data_schemas': []}
         response = requests.Response()
@@ -43,7 +43,7 @@ class TestDataStore(unittest.TestCase):
         ds = DataStore(self.data_store_inputs)
         ds._schemas_by_id is ds.schemas
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_add_remove_schemas(self, mock_get):
         test_obj = {'meta': {'next_page': None}, 'data_schemas': []}
         response = requests.Response()
@@ -0,0 +1,54 @@
+import unittest
+
+import pytest
+
+from treeschema.catalog import DataField, FieldRecord, LinkRecord
+from .. import field
+
+
+FIELD = field(
+    8201, 'status', description_raw='The order status', full_path_name='order.status',
+    nullable=False, parent_path='order', steward={'user_id': 1, 'name': 'Grant'}, tech_poc=2
+)
+
+
+class TestRecords(unittest.TestCase):
+
+    def test_field_record(self):
+        record = FieldRecord(dict(FIELD), data_store_id=1, data_schema_id=2)
+        assert record.id == 8201
+        assert (record.data_store_id, record.data_schema_id) == (1, 2)
+        assert record.steward == 1 and record.tech_poc == 2
+        assert not hasattr(record, '__dict__')
+        # Repeated values share a single string
+        other = FieldRecord(dict(FIELD, data_type=''.join(['str', 'ing'])))
+        assert other.data_type is record.data_type
+        assert record.as_dict()['full_path_name'] == 'order.status'
+
+    def test_read_only(self):
+        record = FieldRecord(dict(FIELD))
+        with pytest.raises(AttributeError):
+            record.name = 'renamed'
+        with pytest.raises(AttributeError):
+            record.extra = 1
+        with pytest.raises(AttributeError):
+            del record.name
+
+    def test_from_entity(self):
+        field = DataField(
+            dict(FIELD, field_id=8202, steward=None, tech_poc=None),
+            data_store_id=1,
+            data_schema_id=2
+        )
+        record = FieldRecord.from_entity(field)
+        assert record.id == 8202 and record.data_schema_id == 2
+        assert record.as_dict() == dict(
+            field._obj, data_store_id=1, data_schema_id=2
+        )
+
+    def test_link_record(self):
+        link = {f: None for f in LinkRecord.__SOURCE__.__FIELDS__}
+        link.update(transformation_link_id=8203, source_schema_name='orders')
+        record = LinkRecord(link, transformation_id=5)
+        assert record.id == 8203 and record.transformation_id == 5
+        assert record == LinkRecord(dict(link), transformation_id=5)
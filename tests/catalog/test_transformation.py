@@ -31,7 +31,7 @@ class TestTransformation(unittest.TestCase):
     def test_create_transformation(self):
         Transformation(self.transformation_inputs)
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_transformation_link_access(self, mock_get):
         test_obj = {'meta': {'next_page': None}, 'transformation_links': []}
         response = requests.Response()
@@ -43,7 +43,7 @@ class TestTransformation(unittest.TestCase):
         t = Transformation(self.transformation_inputs)
         t._links_by_id is t.links
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_add_remove_links(self, mock_get):
         test_obj = {'meta': {'next_page': None}, 'transformation_links': []}
         
@@ -1,5 +1,7 @@
 import requests
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import mock
@@ -7,7 +9,8 @@ import pytest
 
 import treeschema
 from treeschema.api import APIClient
-from treeschema.catalog import TreeSchemaUser
+from treeschema.catalog import DataSchema, TreeSchemaUser
+from treeschema.catalog import user as user_module
 
 
 class TestBaseSerializer(unittest.TestCase):
@@ -23,7 +26,7 @@ class TestBaseSerializer(unittest.TestCase):
         assert usr.obj == self.user_inputs
 
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_get_users(self, mock_get):
         resp_users = [
             {
@@ -56,7 +59,7 @@ class TestBaseSerializer(unittest.TestCase):
         resp = client.get_all_users()
         assert resp == resp_users
 
-    # @patch('treeschema.api.client.r.get')  
+    # @patch('treeschema.api.client.r.Session.get')  
     # def test_get_user_by_email(self, mock_get):
     #     resp_obj = {
     #         "users": {
@@ -74,3 +77,100 @@ class TestBaseSerializer(unittest.TestCase):
     #     client = APIClient()
     #     resp = client.get_all_users()
     #     assert resp == resp_obj
+
+
+def _schema_inputs(schema_id, steward, tech_poc):
+    return {
+        'created_ts': '2020-09-23 18:16:16',
+        'data_schema_id': schema_id,
+        'description_markup': None,
+        'description_raw': None,
+        'name': 'schema_%s' % schema_id,
+        'schema_loc': None,
+        'steward': steward,
+        'tech_poc': tech_poc,
+        'type': 'avro',
+        'updated_ts': '2020-09-23 18:16:16'
+    }
+
+
+def _json_response(body):
+    response = requests.Response()
+    response.status_code = 200
+    response.json = MagicMock()
+    response.json.return_value = body
+    return response
+
+
+# Every test starts from an empty identity map, so users held by other
+# tests (e.g. TEST_USER) are requested again
+@patch.dict('treeschema.catalog.base_serializer._identity_map', clear=True)
+class TestResolveUser(unittest.TestCase):
+
+    grant = {'user_id': 1, 'name': 'Grant', 'email': 'grant@treeschema.com'}
+    asher = {'user_id': 2, 'name': 'Asher', 'email': 'asher@treeschema.com'}
+
+    def test_shared_user_from_dicts(self):
+        first = DataSchema(_schema_inputs(1, dict(self.grant), dict(self.grant)), data_store_id=1)
+        second = DataSchema(_schema_inputs(2, dict(self.grant), None), data_store_id=1)
+        assert first.steward is first.tech_poc
+        assert first.steward is second.steward
+        assert user_module.resolve_user(first.steward) is first.steward
+
+    @patch('treeschema.api.client.r.Session.get')
+    def test_user_id_fetched_once(self, mock_get):
+        mock_get.return_value = _json_response({'user': dict(self.grant)})
+        schemas = [
+            DataSchema(_schema_inputs(i, 1, 1), data_store_id=1) for i in range(10)
+        ]
+        assert mock_get.call_count == 1
+        assert all(s.steward is schemas[0].tech_poc for s in schemas)
+        assert schemas[0].steward.email == 'grant@treeschema.com'
+
+    @patch('treeschema.api.client.r.Session.get')
+    def test_prefetch_requests_missing_users(self, mock_get):
+        users_by_id = {1: self.grant, 2: self.asher}
+        mock_get.side_effect = lambda url, **kwargs: _json_response(
+            {'user': dict(users_by_id[int(url.rstrip('/').split('/')[-1])])}
+        )
+        results = [_schema_inputs(1, 1, 2), _schema_inputs(2, 2, None)]
+        assert user_module.referenced_user_ids(results) == [1, 2]
+
+        users = user_module.prefetch_users(user_module.referenced_user_ids(results))
+        assert [u.id for u in users] == [1, 2]
+        schemas = [DataSchema(r, data_store_id=1) for r in results]
+        # One request per missing user, the organization is not listed
+        assert mock_get.call_count == 2
+        assert all('/users/' in call[0][0] for call in mock_get.call_args_list)
+        assert schemas[0].tech_poc is schemas[1].steward
+        assert schemas[1].steward.name == 'Asher'
+
+    @patch.object(user_module, 'PREFETCH_LIST_THRESHOLD', 1)
+    @patch('treeschema.api.client.r.Session.get')
+    def test_prefetch_lists_many_missing_users(self, mock_get):
+        mock_get.return_value = _json_response({
+            'meta': {'current_page': 1, 'next_page': None, 'total_cnt': 2},
+            'users': [dict(self.grant), dict(self.asher)]
+        })
+        users = user_module.prefetch_users([1, 2])
+        assert mock_get.call_count == 1
+        assert sorted(u.id for u in users) == [1, 2]
+
+    @patch('treeschema.api.client.r.Session.get')
+    def test_users_fetched_concurrently(self, mock_get):
+        # Both requests must be in flight at the same time to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def get(url, **kwargs):
+            barrier.wait()
+            user_id = int(url.rstrip('/').split('/')[-1])
+            user = {'user_id': user_id, 'name': 'User', 'email': '%s@treeschema.com' % user_id}
+            return _json_response({'user': user})
+
+        mock_get.side_effect = get
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            users = list(executor.map(user_module.resolve_user, [11, 12, 11, 12]))
+        assert [u.id for u in users] == [11, 12, 11, 12]
+        assert users[0] is users[2] and users[1] is users[3]
+        assert mock_get.call_count == 2
+
@@ -23,7 +23,7 @@ class TestDbt(unittest.TestCase):
         with pytest.raises(treeschema.exceptions.DbtManifestInvalid):
             resp = dbt.parse_dbt_manifest(b'some invalid content')
 
-    @patch('treeschema.api.client.r.post')  
+    @patch('treeschema.api.client.r.Session.post')  
     def test_parse_dbt_interface(self, mock_post):
         test_obj = {'dbt_process_id': 'abc-123'}
         response = requests.Response()
@@ -40,7 +40,7 @@ class TestDbt(unittest.TestCase):
         resp = dbt.parse_dbt_manifest(file_loc)
         assert resp == test_obj['dbt_process_id']
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_parse_dbt_interface(self, mock_get):
         test_obj = {
             'status': 'success',
@@ -0,0 +1,106 @@
+import asyncio
+import requests
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from treeschema import AsyncTreeSchema
+from treeschema.api import APIClient, endpoints
+from treeschema.api.transport import InMemoryTransport
+from treeschema.catalog import DataStore
+from . import TEST_TREE_SCHEMA, data_store, schema
+
+
+class TestAsyncTreeSchema(unittest.TestCase):
+
+    @patch('treeschema.api.client.r.Session.get')  
+    def test_concurrent_data_store_lookups(self, mock_get):
+        resp_data_stores = [
+            {
+                "data_store_id": 31,
+                "name": "Async Store",
+                "type": "kafka",
+                "other_type": None,
+                "created_ts": "2020-09-23 18:16:16",
+                "updated_ts": "2020-09-23 18:16:16",
+                "description_markup": None,
+                "description_raw": None,
+                "steward": None,
+                "tech_poc": None,
+                "details": {}
+            }
+        ]
+        resp_obj = {
+            "meta": {"current_page": 1, "next_page": None, "total_cnt": 1},
+            "data_stores": resp_data_stores
+        }
+        response = requests.Response()
+        response.status_code = 200
+        response.json = MagicMock()
+        response.json.return_value = resp_obj
+        mock_get.return_value = response
+
+        TEST_TREE_SCHEMA._data_stores_retrieved = False
+        ats = AsyncTreeSchema()
+
+        async def run_all():
+            return await asyncio.gather(
+                *[ats.data_store('async store') for _ in range(50)]
+            )
+
+        try:
+            results = asyncio.run(run_all())
+        finally:
+            ats.close()
+            TEST_TREE_SCHEMA._data_stores_retrieved = False
+
+        # All lookups share the single listing request
+        assert mock_get.call_count == 1
+        assert all(ds is results[0] for ds in results)
+        assert results[0].id == 31
+
+    def test_catalog_calls_share_one_thread(self):
+        ats = AsyncTreeSchema()
+
+        async def run_all():
+            return await asyncio.gather(
+                *[ats._apply(threading.get_ident) for _ in range(20)]
+            )
+
+        try:
+            threads = set(asyncio.run(run_all()))
+        finally:
+            ats.close()
+        assert len(threads) == 1
+        assert threading.get_ident() not in threads
+
+    def test_concurrent_lookups_overlap(self):
+        transport = APIClient.configure_transport(InMemoryTransport())
+        self.addCleanup(APIClient.configure_transport)
+        # Every request must be in flight at the same time to pass the barrier
+        barrier = threading.Barrier(8, timeout=5)
+
+        def handler(method, url, **kwargs):
+            barrier.wait()
+            schema_id = int(url.rstrip('/').split('/')[-1])
+            return 200, {'data_schema': schema(schema_id, 'overlap_%s' % schema_id, 9701)}
+
+        schema_ids = list(range(9711, 9719))
+        for schema_id in schema_ids:
+            url = endpoints.SCHEMA.format(data_store_id=9701, data_schema_id=schema_id)
+            transport.add('get', url, handler=handler)
+        ds = DataStore(data_store(9701, 'Async Overlap'))
+        ats = AsyncTreeSchema(max_workers=8)
+
+        async def run_all():
+            return await asyncio.gather(
+                *[ats.schema(ds, i, pre_fetch=False) for i in schema_ids]
+            )
+
+        try:
+            schemas = asyncio.run(run_all())
+        finally:
+            ats.close()
+        assert [s.id for s in schemas] == schema_ids
+        assert all(ds._schemas_by_id[s.id] is s for s in schemas)
+        assert len(transport.requests) == 8
@@ -0,0 +1,114 @@
+import os
+import requests
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from treeschema import catalog_cache
+from treeschema.api import APIClient, endpoints
+from treeschema.api.transport import InMemoryTransport
+from treeschema.catalog import DataStore
+from . import TEST_TREE_SCHEMA, data_store, schema
+
+
+DATA_STORE = data_store(1, 'Kafka')
+
+SCHEMA = schema(
+    7, 'orders', type='avro',
+    steward={'user_id': 1, 'name': 'Grant', 'email': 'grant@treeschema.com'}
+)
+
+
+class TestCatalogCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'catalog.sqlite')
+
+    def tearDown(self):
+        TEST_TREE_SCHEMA.disable_persistent_cache()
+        self.tmp.cleanup()
+
+    def test_put_get_invalidate(self):
+        cache = catalog_cache.CatalogCache(self.path, max_age=60)
+        assert cache.get(catalog_cache.SCHEMAS, 1) is None
+        cache.put(catalog_cache.SCHEMAS, 1, [SCHEMA])
+        assert cache.get(catalog_cache.SCHEMAS, 1) == [SCHEMA]
+        assert cache.get(catalog_cache.SCHEMAS, 2) is None
+
+        # A second connection, e.g. a new process, reads the same listing
+        other = catalog_cache.CatalogCache(self.path, max_age=60)
+        assert other.get(catalog_cache.SCHEMAS, 1) == [SCHEMA]
+
+        cache.invalidate(catalog_cache.SCHEMAS, 1)
+        assert other.get(catalog_cache.SCHEMAS, 1) is None
+        assert cache.hits == 1 and cache.misses == 2
+        cache.close()
+        other.close()
+
+    def test_stale_listing(self):
+        cache = catalog_cache.CatalogCache(self.path, max_age=60)
+        with patch('treeschema.catalog_cache.time.time', return_value=1000):
+            cache.put(catalog_cache.DATA_STORES, None, [DATA_STORE])
+        with patch('treeschema.catalog_cache.time.time', return_value=1059):
+            assert cache.get(catalog_cache.DATA_STORES) == [DATA_STORE]
+        with patch('treeschema.catalog_cache.time.time', return_value=1061):
+            assert cache.get(catalog_cache.DATA_STORES) is None
+        cache.close()
+
+    @patch('treeschema.api.client.r.Session.get')
+    def test_warm_start_schemas(self, mock_get):
+        response = requests.Response()
+        response.status_code = 200
+        response.json = MagicMock()
+        response.json.return_value = {
+            'meta': {'current_page': 1, 'next_page': None, 'total_cnt': 1},
+            'data_schemas': [SCHEMA.copy()]
+        }
+        mock_get.return_value = response
+
+        TEST_TREE_SCHEMA.enable_persistent_cache(self.path)
+        DataStore(DATA_STORE.copy()).get_schemas()
+        assert mock_get.call_count == 1
+
+        # A new data store object is served from disk
+        schemas = DataStore(DATA_STORE.copy()).get_schemas()
+        assert mock_get.call_count == 1
+        assert schemas[7].name == 'orders'
+        assert schemas[7].steward.email == 'grant@treeschema.com'
+
+        # Refreshing always goes to Tree Schema
+        DataStore(DATA_STORE.copy()).get_schemas(refresh=True)
+        assert mock_get.call_count == 2
+
+        catalog_cache.invalidate(catalog_cache.SCHEMAS, 1)
+        DataStore(DATA_STORE.copy()).get_schemas()
+        assert mock_get.call_count == 3
+
+    def test_lookups_keep_listing(self):
+        transport = APIClient.configure_transport(InMemoryTransport())
+        self.addCleanup(APIClient.configure_transport)
+        ds = dict(DATA_STORE, data_store_id=9401)
+        listed = dict(SCHEMA, data_schema_id=9411, steward=None)
+        looked_up = dict(SCHEMA, data_schema_id=9412, name='refunds', steward=None)
+        created = dict(SCHEMA, data_schema_id=9413, name='returns', steward=None)
+        transport.add(
+            'get', endpoints.SCHEMAS.format(data_store_id=9401),
+            {'meta': {'current_page': 1, 'next_page': None, 'total_cnt': 1},
+             'data_schemas': [listed]}
+        )
+        transport.add(
+            'get', endpoints.SCHEMA.format(data_store_id=9401, data_schema_id=9412),
+            {'data_schema': looked_up}
+        )
+        transport.add('post', endpoints.SCHEMAS.format(data_store_id=9401), {'data_schema': created})
+
+        cache = TEST_TREE_SCHEMA.enable_persistent_cache(self.path)
+        data_store = DataStore(ds)
+        data_store.get_schemas()
+        assert data_store.schema(9412).name == 'refunds'
+        assert data_store.schema('orders').id == 9411
+        assert cache.get(catalog_cache.SCHEMAS, 9401) == [listed]
+
+        assert data_store.schema({'name': 'returns', 'type': 'avro'}).id == 9413
+        assert cache.get(catalog_cache.SCHEMAS, 9401) is None
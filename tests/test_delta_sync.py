@@ -0,0 +1,123 @@
+import unittest
+from unittest.mock import patch
+
+from treeschema import delta_sync
+from treeschema.api import APIClient, endpoints
+from treeschema.api.transport import InMemoryTransport
+from treeschema.catalog import DataSchema, lazy_handles
+from treeschema.treeschema import _EntityHolder
+from . import TEST_TREE_SCHEMA, data_store, field
+from . import schema as schema_inputs
+
+
+
+class StubCatalog(object):
+    """Serves a listing that honors `updated_since` and reports the total
+    number of entities, as the Tree Schema API does
+    """
+
+    def __init__(self, resp_key, entities):
+        self.resp_key = resp_key
+        self.entities = entities
+        self.params = []
+
+    def __call__(self, method, url, **kwargs):
+        params = kwargs.get('params') or {}
+        self.params.append(params)
+        since = params.get('updated_since')
+        found = [e for e in self.entities if since is None or e['updated_ts'] >= since]
+        meta = {'next_page': None, 'total_cnt': len(self.entities)}
+        return 200, {self.resp_key: found, 'meta': meta}
+
+
+class TestDeltaSync(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = APIClient.configure_transport(InMemoryTransport())
+
+    def tearDown(self):
+        APIClient.configure_transport()
+
+    def test_high_water_mark(self):
+        entities = [{'updated_ts': '2021-01-02 00:00:00'}, {'updated_ts': None}]
+        assert delta_sync.high_water_mark([]) is None
+        assert delta_sync.high_water_mark(entities) == '2021-01-02 00:00:00'
+        assert delta_sync.high_water_mark(entities, '2021-03-01 00:00:00') == '2021-03-01 00:00:00'
+
+    def test_incremental_fields(self):
+        stub = StubCatalog('data_fields', [
+            field(7101, 'id', updated_ts='2021-01-01 00:00:00'),
+            field(7102, 'status', updated_ts='2021-01-01 00:00:00'),
+        ])
+        self.transport.add('get', endpoints.FIELDS.format(data_store_id=7100, data_schema_id=7100), handler=stub)
+        schema = DataSchema(schema_inputs(7100, 'orders', type='avro'), data_store_id=7100)
+
+        schema.get_fields()
+        status = schema.field('status')
+        stub.entities[1] = field(7102, 'order_status', updated_ts='2021-02-01 00:00:00')
+        stub.entities.append(field(7103, 'total', updated_ts='2021-02-02 00:00:00'))
+        stub.params.clear()
+
+        schema.get_fields(refresh=True, incremental=True)
+        assert stub.params[0] == {'updated_since': '2021-01-01 00:00:00', 'page': 1}
+        # The updated field is the same object and is indexed by its new name
+        assert schema.field('order_status') is status
+        assert 'status' not in schema._fields_by_name
+        assert sorted(schema._fields_by_id) == [7101, 7102, 7103]
+        assert schema._fields_hwm == '2021-02-02 00:00:00'
+
+        # A deleted field is detected by the total count and falls back to
+        # a full retrieval
+        del stub.entities[0]
+        stub.params.clear()
+        schema.get_fields(refresh=True, incremental=True)
+        assert {'page': 1} in stub.params
+        assert sorted(schema._fields_by_id) == [7102, 7103]
+
+        # Merging an update for a lazy handle sends no request of its own
+        with lazy_handles():
+            lazy_field = schema.field(7104, pre_fetch=False)
+        stub.entities.append(field(7104, 'currency', updated_ts='2021-03-01 00:00:00'))
+        sent = len(self.transport.requests)
+        schema.get_fields(refresh=True, incremental=True)
+        assert len(self.transport.requests) == sent + 2
+        assert schema.field('currency') is lazy_field
+        assert not lazy_field.is_lazy
+
+    def test_incremental_data_stores(self):
+        stub = StubCatalog('data_stores', [
+            data_store(7111, 'Kafka', updated_ts='2021-01-01 00:00:00'),
+            data_store(7112, 'Postgres', updated_ts='2021-01-01 00:00:00'),
+        ])
+        self.transport.add('get', endpoints.DATA_STORES, handler=stub)
+        with patch.object(TEST_TREE_SCHEMA, '_entity_holder', _EntityHolder(TEST_TREE_SCHEMA)), \
+                patch.object(TEST_TREE_SCHEMA, '_data_stores_retrieved', False), \
+                patch.object(TEST_TREE_SCHEMA, '_data_stores_hwm', None):
+            TEST_TREE_SCHEMA.get_data_stores()
+            stub.entities[0] = data_store(7111, 'Kafka', updated_ts='2021-02-01 00:00:00')
+            stub.entities[0]['description_raw'] = 'events'
+            stub.params.clear()
+
+            TEST_TREE_SCHEMA.get_data_stores(refresh=True, incremental=True)
+            assert stub.params == [
+                {'updated_since': '2021-01-01 00:00:00', 'page': 1},
+                {'page': 1, 'page_size': 1}
+            ]
+            assert TEST_TREE_SCHEMA.data_store('Kafka').description_raw == 'events'
+
+            # A lazy handle that is updated is filled from the listing
+            with lazy_handles():
+                lazy_store = TEST_TREE_SCHEMA.data_store(7113)
+            assert lazy_store.is_lazy
+            stub.entities.append(data_store(7113, 'Redis', updated_ts='2021-03-01 00:00:00'))
+            stub.params.clear()
+            TEST_TREE_SCHEMA.get_data_stores(refresh=True, incremental=True)
+            assert not lazy_store.is_lazy
+            assert TEST_TREE_SCHEMA.data_store('redis') is lazy_store
+            assert len(stub.params) == 2
+            del stub.entities[2]
+
+            del stub.entities[1]
+            TEST_TREE_SCHEMA.get_data_stores(refresh=True, incremental=True)
+            assert list(TEST_TREE_SCHEMA.data_stores) == [7111]
+            assert 'postgres' not in TEST_TREE_SCHEMA._entity_holder._data_stores_by_name
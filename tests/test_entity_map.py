@@ -0,0 +1,138 @@
+import unittest
+from unittest.mock import patch
+
+from treeschema import entity_map
+from treeschema.api import APIClient, endpoints
+from treeschema.api.transport import InMemoryTransport
+from treeschema.catalog import DataSchema, DataStore
+from . import TEST_TREE_SCHEMA, field, page
+from . import data_store as data_store_inputs, schema as schema_inputs
+
+
+def data_store():
+    return DataStore(data_store_inputs(1, 'Kafka'))
+
+
+def schema(i):
+    inputs = schema_inputs(i, 'schema_%s' % i, 1, description_raw='description %s' % i, type='avro')
+    return DataSchema(inputs, data_store_id=1)
+
+
+class TestEntityMap(unittest.TestCase):
+
+    def setUp(self):
+        entity_map.reset_stats()
+
+    def tearDown(self):
+        entity_map.configure_eviction(entity_map.SCHEMAS)
+        entity_map.configure_eviction(entity_map.FIELDS)
+        APIClient.configure_transport()
+
+    def stats(self):
+        return entity_map.cache_stats()[entity_map.SCHEMAS]
+
+    def test_unbounded_counts_lookups(self):
+        ds = data_store()
+        resident = self.stats()['resident_entries']
+        ds._add_data_schema(schema(1))
+        assert 1 in ds._schemas_by_id
+        assert 2 not in ds._schemas_by_id
+        stats = self.stats()
+        assert stats['hits'] == 1 and stats['misses'] == 1
+        assert stats['resident_entries'] == resident + 1
+        del ds
+        assert self.stats()['resident_entries'] == resident
+
+    def test_max_entries_evicts_least_recently_used(self):
+        TEST_TREE_SCHEMA.configure_eviction(entity_map.SCHEMAS, max_entries=2)
+        ds = data_store()
+        ds._schemas_retrieved = True
+        ds._add_data_schema(schema(1))
+        ds._add_data_schema(schema(2))
+        # Touch schema 1 so that schema 2 is the least recently used
+        assert 1 in ds._schemas_by_id
+        ds._add_data_schema(schema(3))
+
+        assert list(ds._schemas_by_id) == [1, 3]
+        assert 'schema_2' not in ds._schemas_by_name
+        assert self.stats()['evictions'] == 1
+
+        # The evicted schema is listed again by full listings
+        transport = APIClient.configure_transport(InMemoryTransport())
+        transport.add('get', endpoints.SCHEMAS.format(data_store_id=1), page(
+            'data_schemas', [schema_inputs(i, 'schema_%s' % i, 1) for i in (1, 2, 3)]
+        ))
+        assert sorted(ds.get_schemas()) == [1, 2, 3]
+        assert len(transport.requests) == 1
+
+    def test_listing_larger_than_limit(self):
+        TEST_TREE_SCHEMA.configure_eviction(entity_map.FIELDS, max_entries=1)
+        data_schema = schema(11)
+        transport = APIClient.configure_transport(InMemoryTransport())
+        url = endpoints.FIELDS.format(data_store_id=1, data_schema_id=11)
+        transport.add('get', url, page(
+            'data_fields', [field(111, 'a'), field(112, 'b')]
+        ))
+
+        assert sorted(data_schema.get_fields()) == [111, 112]
+        assert sorted(data_schema.fields) == [111, 112]
+        assert [f.id for f in data_schema.iter_fields()] == [111, 112]
+        assert len(data_schema.fields_table()) == 2
+        assert len(data_schema._fields_by_id) == 1
+
+    @patch('treeschema.entity_map.time.monotonic')
+    def test_ttl_expires_entities(self, mock_monotonic):
+        TEST_TREE_SCHEMA.configure_eviction(entity_map.SCHEMAS, ttl=60)
+        ds = data_store()
+        ds._schemas_retrieved = True
+        mock_monotonic.return_value = 100
+        ds._add_data_schema(schema(1))
+        mock_monotonic.return_value = 150
+        ds._add_data_schema(schema(2))
+
+        mock_monotonic.return_value = 161
+        assert 'schema_1' not in ds._schemas_by_name
+        assert 1 not in ds._schemas_by_id
+        assert 2 in ds._schemas_by_id
+        # The listing is no longer complete and is fetched on next access
+        assert not ds._schemas_retrieved
+        assert self.stats()['expirations'] == 1
+
+    @patch('treeschema.entity_map.time.monotonic')
+    def test_ttl_applies_to_get(self, mock_monotonic):
+        TEST_TREE_SCHEMA.configure_eviction(entity_map.SCHEMAS, ttl=60)
+        ds = data_store()
+        mock_monotonic.return_value = 100
+        ds._add_data_schema(schema(1))
+
+        assert ds._schemas_by_id.get(1).id == 1
+        mock_monotonic.return_value = 161
+        assert ds._schemas_by_id.get(1) is None
+        assert ds._schemas_by_name.get('schema_1') is None
+        with self.assertRaises(KeyError):
+            ds._schemas_by_id[1]
+        assert self.stats()['expirations'] == 1
+
+    @patch('treeschema.entity_map.time.monotonic')
+    def test_ttl_applies_to_iteration(self, mock_monotonic):
+        TEST_TREE_SCHEMA.configure_eviction(entity_map.SCHEMAS, ttl=60)
+        ds = data_store()
+        ds._schemas_retrieved = True
+        mock_monotonic.return_value = 100
+        ds._add_data_schema(schema(1))
+        mock_monotonic.return_value = 150
+        ds._add_data_schema(schema(2))
+
+        mock_monotonic.return_value = 161
+        assert [s.id for s in ds._schemas_by_id.values()] == [2]
+        assert [k for k, _ in ds._schemas_by_name.items()] == ['schema_2']
+        assert not entity_map.is_complete(ds._schemas_retrieved, ds._schemas_by_id)
+
+    def test_max_bytes(self):
+        size = entity_map.estimate_size(schema(1))
+        TEST_TREE_SCHEMA.configure_eviction(entity_map.SCHEMAS, max_bytes=int(size * 2.5))
+        ds = data_store()
+        for i in range(1, 6):
+            ds._add_data_schema(schema(i))
+        assert list(ds._schemas_by_id) == [4, 5]
+        assert 0 < self.stats()['resident_bytes'] <= size * 2.5
@@ -0,0 +1,65 @@
+import unittest
+
+import pytest
+
+from treeschema import fields_table
+from treeschema.api import APIClient, endpoints
+from treeschema.api.transport import InMemoryTransport
+from treeschema.catalog import DataStore
+from . import data_store, field, page, schema
+
+
+
+class TestFieldsTable(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = APIClient.configure_transport(InMemoryTransport())
+        self.transport.add('get', endpoints.SCHEMAS.format(data_store_id=8401), page(
+            'data_schemas', [schema(8411, 'orders'), schema(8412, 'users')]
+        ))
+        orders_url = endpoints.FIELDS.format(data_store_id=8401, data_schema_id=8411)
+        self.transport.add('get', orders_url, page('data_fields', [
+            field(
+                8421, 'id', data_type='number', nullable=False,
+                description_raw='The order ID', steward=3
+            ),
+            field(8422, 'note'),
+        ]))
+        users_url = endpoints.FIELDS.format(data_store_id=8401, data_schema_id=8412)
+        self.transport.add('get', users_url, page('data_fields', [field(8423, 'email')]))
+        self.transport.add('get', endpoints.USER.format(user_id=3), {
+            'user': {'user_id': 3, 'name': 'Steward', 'email': 'steward@treeschema.com'}
+        })
+        self.ds = DataStore(data_store(8401, 'Table DS'))
+
+    def tearDown(self):
+        APIClient.configure_transport()
+
+    def test_data_store_fields_table(self):
+        table = self.ds.fields_table()
+        assert len(table) == 3
+        assert list(table['data_schema_id']) == [8411, 8411, 8412]
+        assert list(table['steward_id']) == [3, fields_table.MISSING_ID, fields_table.MISSING_ID]
+        # Fields are read from the pages and not added to the local cache
+        assert not self.ds.schema('orders')._fields_retrieved
+        assert len(self.ds.schema('orders')._fields_by_id) == 0
+
+        undocumented = table.where(nullable=True, data_type='string', has_description=False)
+        assert undocumented['full_path_name'] == ['note', 'email']
+        assert table.value_counts('data_type') == {'number': 1, 'string': 2}
+
+    def test_retrieved_fields(self):
+        orders = self.ds.schema('orders')
+        orders.get_fields()
+        sent = len(self.transport.requests)
+        table = orders.fields_table()
+        assert len(self.transport.requests) == sent
+        assert list(table['field_id']) == [8421, 8422]
+        assert list(table['steward_id'])[0] == 3
+
+    def test_to_numpy(self):
+        np = pytest.importorskip('numpy')
+        cols = self.ds.fields_table().to_numpy()
+        mask = cols['nullable'] & (cols['data_type'] == 'string') & ~cols['has_description']
+        assert list(cols['field_id'][mask]) == [8422, 8423]
+        assert cols['created_ts'][0] == np.datetime64('2020-09-23T18:16:16')
@@ -0,0 +1,32 @@
+import unittest
+
+from treeschema.api import APIClient, endpoints
+from treeschema.api.transport import InMemoryTransport
+from treeschema.catalog import FieldRecord
+from . import TEST_TREE_SCHEMA, field, page
+
+
+
+class TestLiteCatalog(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = APIClient.configure_transport(InMemoryTransport())
+        self.transport.add(
+            'get',
+            endpoints.FIELDS.format(data_store_id=1, data_schema_id=8301),
+            page('data_fields', [field(8311, 'id'), field(8312, 'name')])
+        )
+
+    def tearDown(self):
+        APIClient.configure_transport()
+
+    def test_fields(self):
+        lite = TEST_TREE_SCHEMA.lite()
+        fields = lite.fields(data_store_id=1, data_schema_id=8301)
+        assert [f.full_path_name for f in fields] == ['id', 'name']
+        assert all(isinstance(f, FieldRecord) and f.data_schema_id == 8301 for f in fields)
+
+        assert lite.fields(1, 8301) is fields
+        assert len(self.transport.requests) == 1
+        lite.fields(1, 8301, refresh=True)
+        assert len(self.transport.requests) == 2
@@ -0,0 +1,104 @@
+import unittest
+from unittest.mock import patch
+
+from treeschema.api import APIClient, endpoints
+from treeschema.api.transport import InMemoryTransport
+from treeschema import name_index
+from treeschema.name_index import NameIndex
+from treeschema.treeschema import _EntityHolder
+from . import TEST_TREE_SCHEMA, data_store, field, page, schema
+
+
+NAMES = [
+    'spoc.accounts', 'spoc.accounts_v2', 'SPOC.Accounts.Archive', 'spoc.orders',
+    'billing.accounts', 'users', 'users', 'events.created_ts'
+]
+
+
+class TestNameIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = NameIndex((n, i) for i, n in enumerate(NAMES))
+
+    def test_prefix(self):
+        assert sorted(self.index.prefix('SPOC.acc')) == [0, 1, 2]
+        assert self.index.prefix('nothing') == []
+        assert len(self.index.prefix('')) == len(NAMES)
+
+    def test_glob(self):
+        assert sorted(self.index.glob('spoc.accounts*')) == [0, 1, 2]
+        assert sorted(self.index.glob('*.accounts')) == [0, 4]
+        assert sorted(self.index.glob('users')) == [5, 6]
+        assert self.index.glob('spoc.accounts_v?') == [1]
+        assert sorted(self.index.glob('*ts*')) == [0, 1, 2, 4, 7]
+        assert self.index.glob('spoc.account') == []
+
+    def test_glob_character_classes(self):
+        index = NameIndex([('user_1', 1), ('user_a', 2), ('user_[1]', 3), ('[draft', 4)])
+        assert index.glob('*[0-9]') == [1]
+        assert index.glob('*_[!a]') == [1]
+        assert sorted(index.glob('*_[1a]')) == [1, 2]
+        assert index.glob('*[]]') == [3]
+        assert index.glob('[draft') == [4]
+        assert index.glob('[[]d*') == [4]
+
+    def test_fuzzy(self):
+        found = self.index.fuzzy('spoc.acounts', limit=2)
+        assert [i for i, _ in found] == [0, 1]
+        assert found[0][1] > found[1][1]
+        assert self.index.fuzzy('zzzz') == []
+
+
+class TestFindByName(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = APIClient.configure_transport(InMemoryTransport())
+        self.patches = [
+            patch.object(TEST_TREE_SCHEMA, '_entity_holder', _EntityHolder(TEST_TREE_SCHEMA)),
+            patch.object(TEST_TREE_SCHEMA, '_data_stores_retrieved', False),
+        ]
+        for p in self.patches:
+            p.start()
+        add = self.transport.add
+        add('get', endpoints.DATA_STORES, page('data_stores', [data_store(9201, 'Find Kafka')]))
+        add('get', endpoints.SCHEMAS.format(data_store_id=9201), page('data_schemas', [
+            schema(9211, 'spoc.accounts', 9201),
+            schema(9212, 'spoc.accounts_v2', 9201),
+            schema(9213, 'orders', 9201),
+        ]))
+        add(
+            'get',
+            endpoints.FIELDS.format(data_store_id=9201, data_schema_id=9213),
+            page('data_fields', [field(92131, 'address.city'), field(92132, 'address.zip')])
+        )
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+        APIClient.configure_transport()
+
+    def test_find(self):
+        assert TEST_TREE_SCHEMA.find_schemas('spoc.*') == []
+
+        kafka = TEST_TREE_SCHEMA.data_store('Find Kafka')
+        kafka.get_schemas()
+        assert [s.id for s in TEST_TREE_SCHEMA.find_schemas('SPOC.accounts*')] == [9211, 9212]
+        assert [s.id for s in TEST_TREE_SCHEMA.find_schemas('spoc.acounts', fuzzy=True, limit=1)] == [9211]
+
+        kafka.schema('orders').get_fields()
+        assert [f.id for f in TEST_TREE_SCHEMA.find_fields('address.*')] == [92131, 92132]
+        assert [f.id for f in TEST_TREE_SCHEMA.find_fields('*.zip')] == [92132]
+
+        # The index is rebuilt once the schemas change
+        kafka._remove_data_schema(9211)
+        assert [s.id for s in TEST_TREE_SCHEMA.find_schemas('spoc.accounts*')] == [9212]
+
+    def test_listing_touches_once(self):
+        kafka = TEST_TREE_SCHEMA.data_store('Find Kafka')
+        schemas = name_index.generation(name_index.SCHEMAS)
+        kafka.get_schemas()
+        assert name_index.generation(name_index.SCHEMAS) == schemas + 1
+
+        fields = name_index.generation(name_index.FIELDS)
+        kafka.schema('orders').get_fields()
+        assert name_index.generation(name_index.FIELDS) == fields + 1
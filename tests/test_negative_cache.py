@@ -0,0 +1,77 @@
+import unittest
+from unittest.mock import patch
+
+import pytest
+
+from treeschema import negative_cache
+from treeschema.api import APIClient, endpoints
+from treeschema.api.transport import InMemoryTransport
+from treeschema.catalog import DataStore
+from treeschema.exceptions import DataAssetDoesNotExist
+from . import TEST_TREE_SCHEMA, data_store, schema
+
+
+def negative_data_store():
+    ds = DataStore(data_store(7201, 'Negative DS'))
+    ds._schemas_retrieved = True
+    return ds
+
+
+class TestNegativeCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = TEST_TREE_SCHEMA.configure_negative_cache(ttl=30)
+        self.transport = APIClient.configure_transport(InMemoryTransport())
+        self.schemas_url = endpoints.SCHEMAS.format(data_store_id=7201)
+
+    def tearDown(self):
+        APIClient.configure_transport()
+        TEST_TREE_SCHEMA.configure_negative_cache(ttl=None)
+
+    def lookups(self):
+        return [r for r in self.transport.requests if r[0] == 'get']
+
+    def test_name_miss_is_cached(self):
+        self.transport.add('get', self.schemas_url, {'data_schema': None})
+        ds = negative_data_store()
+
+        assert ds.schema('optional.topic') is None
+        assert ds.schema('Optional.Topic') is None
+        with pytest.raises(DataAssetDoesNotExist):
+            ds.schema('optional.topic', raise_if_not_exist=True)
+        assert len(self.lookups()) == 1
+        assert self.cache.hits == 2
+
+    def test_id_miss_404_expires(self):
+        with patch('treeschema.negative_cache.time.monotonic') as mock_monotonic:
+            mock_monotonic.return_value = 100
+            ds = negative_data_store()
+            assert ds.schema(7299) is None
+            mock_monotonic.return_value = 129
+            assert ds.schema(7299) is None
+            assert len(self.lookups()) == 1
+
+            mock_monotonic.return_value = 131
+            assert ds.schema(7299) is None
+            assert len(self.lookups()) == 2
+
+    def test_create_forgets_miss(self):
+        self.transport.add('get', self.schemas_url, {'data_schema': None})
+        self.transport.add('post', self.schemas_url, {'data_schema': schema(7202, 'optional.topic')})
+        ds = negative_data_store()
+        assert ds.schema('optional.topic') is None
+        assert len(self.cache) == 1
+
+        created = ds.schema({'name': 'optional.topic', 'type': 'json'})
+        assert created.id == 7202
+        assert len(self.cache) == 0
+        assert ds.schema('optional.topic') is created
+
+    def test_disabled(self):
+        TEST_TREE_SCHEMA.configure_negative_cache(ttl=None)
+        self.transport.add('get', self.schemas_url, {'data_schema': None})
+        ds = negative_data_store()
+        assert ds.schema('optional.topic') is None
+        assert ds.schema('optional.topic') is None
+        assert len(self.lookups()) == 2
+        assert negative_cache.get_cache() is None
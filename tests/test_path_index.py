@@ -0,0 +1,110 @@
+import unittest
+from unittest.mock import patch
+
+import pytest
+
+from treeschema import path_index
+from treeschema.api import APIClient, endpoints
+from treeschema.api.transport import InMemoryTransport
+from treeschema.catalog import Transformation
+from treeschema.exceptions import DataAssetDoesNotExist, InvalidInputs
+from treeschema.path_index import PathIndex
+from . import TEST_TREE_SCHEMA, named, page
+
+
+
+class TestPathIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = APIClient.configure_transport(InMemoryTransport())
+        add = self.transport.add
+        add('get', endpoints.DATA_STORES, page('data_stores', [
+            named('data_store_id', 9001, 'Kafka'),
+            named('data_store_id', 9002, 'Kafka.EU'),
+        ]))
+        add('get', endpoints.SCHEMAS.format(data_store_id=9001), page('data_schemas', [
+            named('data_schema_id', 9011, 'orders'),
+            named('data_schema_id', 9012, 'orders.created'),
+        ]))
+        add('get', endpoints.SCHEMAS.format(data_store_id=9002), page('data_schemas', [
+            named('data_schema_id', 9021, 'orders'),
+        ]))
+        for schema_id, data_store_id in ((9011, 9001), (9012, 9001), (9021, 9002)):
+            add(
+                'get',
+                endpoints.FIELDS.format(data_store_id=data_store_id, data_schema_id=schema_id),
+                page('data_fields', [
+                    named('field_id', schema_id * 10 + 1, 'id', full_path_name='id'),
+                    named('field_id', schema_id * 10 + 2, 'city', full_path_name='address.city'),
+                ])
+            )
+        self.patch = patch.object(path_index, '_index', None)
+        self.patch.start()
+
+    def tearDown(self):
+        self.patch.stop()
+        APIClient.configure_transport()
+
+    def urls(self):
+        return [url for _, url, _ in self.transport.requests]
+
+    def test_resolve_many(self):
+        index = PathIndex()
+        resolved = index.resolve_many([
+            'kafka.orders.id',
+            'Kafka.orders.created.address.city',
+            'Kafka.EU.orders.ID',
+            ('Kafka', 'orders.created', 'id'),
+            'Kafka.missing.id',
+            ('Postgres', 'public.users', 'id'),
+        ])
+        assert resolved == [
+            (9001, 9011, 90111),
+            (9001, 9012, 90122),
+            (9002, 9021, 90211),
+            (9001, 9012, 90121),
+            None,
+            None,
+        ]
+        # Each data store and schema is listed once
+        assert len(self.urls()) == len(set(self.urls())) == 6
+        assert len(index) == 6
+
+        sent = len(self.transport.requests)
+        assert index.resolve(('KAFKA', 'ORDERS', 'ADDRESS.CITY')) == (9001, 9011, 90112)
+        assert len(self.transport.requests) == sent
+
+        # A name missing from a listing in the index lists the parent again
+        assert index.resolve('Kafka.missing.id') is None
+        assert self.urls()[sent:] == [endpoints.SCHEMAS.format(data_store_id=9001)]
+
+    def test_resolve_missing(self):
+        index = PathIndex()
+        assert index.resolve('Kafka.orders.unknown') is None
+        with pytest.raises(DataAssetDoesNotExist):
+            index.resolve('Kafka.orders.unknown', raise_if_not_exist=True)
+        with pytest.raises(InvalidInputs):
+            index.resolve(('Kafka', 'orders'))
+
+    def test_resolve_paths(self):
+        assert TEST_TREE_SCHEMA.resolve_paths(['Kafka.orders.id']) == [(9001, 9011, 90111)]
+        assert TEST_TREE_SCHEMA.path_index() is path_index.get_index()
+
+    def test_create_links_from_paths(self):
+        url = endpoints.TRANSFORMATION_LINKS.format(transformation_id=9101)
+        self.transport.add('post', url, {'updated_links': []})
+
+        transformation = Transformation(9101, lazy=True)
+        transformation.create_links([
+            ('Kafka.orders.id', ('Kafka.EU', 'orders', 'id')),
+            ('Kafka.orders.address.city', 'Kafka.EU.orders.address.city'),
+        ])
+        body = self.transport.requests[-1][2]['json']['links']
+        assert [(l['source_field_id'], l['target_field_id']) for l in body] == [
+            (90111, 90211), (90112, 90212)
+        ]
+        assert self.urls().count(url) == 1
+
+        with pytest.raises(DataAssetDoesNotExist):
+            transformation.create_links(('Kafka.orders.id', 'Kafka.orders.nope'))
+        assert self.urls().count(url) == 1
@@ -0,0 +1,107 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import pytest
+
+from treeschema import search_index
+from treeschema.api import APIClient, endpoints
+from treeschema.api.transport import InMemoryTransport
+from treeschema.catalog import DataField, DataSchema
+from treeschema.exceptions import InvalidInputs
+from treeschema.search_index import SearchIndex, tokenize
+from . import TEST_TREE_SCHEMA, field, schema
+
+
+class TestSearchIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'search.sqlite')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def build(self, index):
+        index.add('schema', 1, name='sales.orders', description='One row per customer order',
+                  data_store_id=10)
+        index.add('field', 2, name='order_total', description='The total of the order in USD',
+                  data_store_id=10, data_schema_id=1)
+        index.add('field', 3, name='customer_email', tags=['pii'], data_store_id=10,
+                  data_schema_id=1)
+        index.add('field', 4, name='email', description='Contact for the order',
+                  data_store_id=20, data_schema_id=5)
+
+    def test_tokenize(self):
+        assert tokenize('sales.order_total, in USD!') == ['sales', 'order', 'total', 'in', 'usd']
+        assert tokenize(None) == []
+
+    def test_search(self):
+        index = SearchIndex()
+        self.build(index)
+
+        results = index.search('order total')
+        assert results[0].id == 2
+        assert sorted(r.id for r in results) == [1, 2, 4]
+        assert results[0].name == 'order_total'
+        assert results[0].data_schema_id == 1
+
+        assert [r.id for r in index.search('order', entity_type='field')] == [2, 4]
+        assert [r.id for r in index.search('email', data_store_id=20)] == [4]
+        assert [r.id for r in index.search('PII')] == [3]
+        assert index.search('missing') == []
+
+        index.remove('field', 3)
+        assert index.search('pii') == []
+
+    def test_persist(self):
+        index = SearchIndex(self.path)
+        self.build(index)
+        index.remove('field', 4)
+        index.close()
+
+        reopened = SearchIndex(self.path)
+        assert len(reopened) == 3
+        assert [r.id for r in reopened.search('email')] == [3]
+        reopened.clear()
+        reopened.close()
+        assert len(SearchIndex(self.path)) == 0
+
+
+class TestSearchCatalog(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.transport = APIClient.configure_transport(InMemoryTransport())
+
+    def tearDown(self):
+        search_index.configure(enabled=False)
+        APIClient.configure_transport()
+        shutil.rmtree(self.dir)
+
+    def test_entities_are_indexed(self):
+        with pytest.raises(InvalidInputs):
+            TEST_TREE_SCHEMA.search('orders')
+
+        TEST_TREE_SCHEMA.configure_search_index(path=os.path.join(self.dir, 'search.sqlite'))
+        data_schema = DataSchema(schema(9311, 'sales.orders', 9301), data_store_id=9301)
+        customer = DataField(field(9321, 'customer_email'), data_store_id=9301, data_schema_id=9311)
+        self.transport.add(
+            'post',
+            endpoints.FIELD_TAGS.format(data_store_id=9301, data_schema_id=9311, field_id=9321),
+            {'tags': ['pii'], 'tag_statuses': ['added']}
+        )
+        customer.add_tags('pii')
+
+        results = TEST_TREE_SCHEMA.search('orders')
+        assert [(r.entity_type, r.id) for r in results] == [('schema', 9311)]
+        found = TEST_TREE_SCHEMA.search('pii email', entity_type='field', data_store_id=9301)
+        assert [(r.id, r.data_schema_id) for r in found] == [(9321, 9311)]
+
+        self.transport.add(
+            'delete', endpoints.FIELDS.format(data_store_id=9301, data_schema_id=9311), {}
+        )
+        data_schema._fields_retrieved = True
+        assert data_schema.delete_fields(customer)
+        assert TEST_TREE_SCHEMA.search('pii') == []
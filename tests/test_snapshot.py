@@ -0,0 +1,125 @@
+import gc
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pytest
+
+from treeschema import snapshot
+from treeschema.catalog import DataStore, Transformation, TransformationLink, lazy_handles
+from treeschema.exceptions import InvalidSnapshot
+from treeschema.treeschema import _EntityHolder
+from . import TS, TEST_TREE_SCHEMA, data_store, field, schema
+
+
+USER = {'user_id': 7001, 'name': 'Snap', 'email': 'snap@treeschema.com'}
+
+
+def build_catalog():
+    ds = DataStore(data_store(7001, 'Snap DS', details={'host': 'kafka'}, steward=dict(USER)))
+    TEST_TREE_SCHEMA._add_data_store(ds)
+    TEST_TREE_SCHEMA._data_stores_retrieved = True
+    ds._schemas_retrieved = True
+    data_schema = ds.schema(schema(
+        7002, 'orders', description_raw='orders', tech_poc=7001, type='avro'
+    ), pre_fetch=False)
+    data_schema._fields_retrieved = True
+    data_field = data_schema.field(field(
+        7003, 'status', full_path_name='order.status', nullable=False,
+        parent_path='order', steward=7001
+    ), pre_fetch=False)
+    data_field._field_values_retrieved = True
+    data_field.field_value({
+        'created_ts': TS, 'description_markup': None, 'description_raw': 'shipped',
+        'field_value': 'S', 'field_value_id': 7004, 'updated_ts': TS
+    })
+
+    tf = Transformation({
+        'created_ts': TS, 'description_markup': None, 'description_raw': None,
+        'name': 'Snap TF', 'steward': None, 'tech_poc': None,
+        'transformation_id': 7005, 'type': 'pub_sub_event', 'updated_ts': TS
+    })
+    TEST_TREE_SCHEMA._add_transformation(tf)
+    TEST_TREE_SCHEMA._transformations_retrieved = True
+    tf._links_retrieved = True
+    tf._add_link(TransformationLink({
+        'created_ts': TS, 'source_data_store_id': 7001, 'source_data_store_name': 'Snap DS',
+        'source_schema_id': 7002, 'source_schema_name': 'orders', 'source_field_id': 7003,
+        'source_field_name': 'order.status', 'target_data_store_id': 7001,
+        'target_data_store_name': 'Snap DS', 'target_schema_id': 7002,
+        'target_schema_name': 'orders', 'target_field_id': 7003,
+        'target_field_name': 'order.status', 'transformation_link_id': 7006,
+        'updated_ts': TS
+    }, transformation_id=7005))
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'catalog.tssnap')
+        self.patches = [
+            patch.object(TEST_TREE_SCHEMA, '_entity_holder', _EntityHolder(TEST_TREE_SCHEMA)),
+            patch.object(TEST_TREE_SCHEMA, '_data_stores_retrieved', False),
+            patch.object(TEST_TREE_SCHEMA, '_transformations_retrieved', False),
+            patch.object(TEST_TREE_SCHEMA, '_users_retrieved', False),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+        self.tmp.cleanup()
+
+    @patch('treeschema.api.client.r.Session.get', side_effect=AssertionError('no requests'))
+    def test_round_trip(self, mock_get):
+        build_catalog()
+        encodings = [snapshot.ENCODING_JSON_ZLIB]
+        if snapshot.msgpack is not None:
+            encodings.append(snapshot.ENCODING_MSGPACK)
+
+        for encoding in encodings:
+            snapshot.save_snapshot(TEST_TREE_SCHEMA, self.path, encoding=encoding)
+            TEST_TREE_SCHEMA._entity_holder = _EntityHolder(TEST_TREE_SCHEMA)
+            TEST_TREE_SCHEMA._data_stores_retrieved = False
+            gc.collect()
+
+            TEST_TREE_SCHEMA.load_snapshot(self.path)
+            assert TEST_TREE_SCHEMA._data_stores_retrieved
+            ds = TEST_TREE_SCHEMA.data_store('Snap DS')
+            assert ds.details == {'host': 'kafka'}
+            field = ds.schema('orders').field('status')
+            assert field.field_value('S').description_raw == 'shipped'
+            assert field.steward is ds.steward
+            assert field.steward.email == 'snap@treeschema.com'
+            link = TEST_TREE_SCHEMA.transformation(7005).link(7006)
+            assert link.target_field_name == 'order.status'
+        mock_get.assert_not_called()
+
+    @patch('treeschema.api.client.r.Session.get', side_effect=AssertionError('no requests'))
+    def test_lazy_handles_are_left_out(self, mock_get):
+        build_catalog()
+        schema = TEST_TREE_SCHEMA.data_store('Snap DS').schema('orders')
+        with lazy_handles():
+            lazy_field = schema.field(7999, pre_fetch=False)
+        assert lazy_field.is_lazy
+
+        snapshot.save_snapshot(TEST_TREE_SCHEMA, self.path)
+        payload = snapshot.build_payload(TEST_TREE_SCHEMA)
+        fields = payload['data_stores'][0][2][0][2]
+        assert [row[0][payload['columns']['fields'].index('field_id')] for row in fields] == [7003]
+        assert lazy_field.is_lazy
+        mock_get.assert_not_called()
+
+    def test_invalid_file(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'not a snapshot at all')
+        with pytest.raises(InvalidSnapshot):
+            TEST_TREE_SCHEMA.load_snapshot(self.path)
+
+        with open(self.path, 'wb') as f:
+            f.write(snapshot._HEADER.pack(snapshot.MAGIC, snapshot.VERSION + 1, 2))
+        with pytest.raises(InvalidSnapshot):
+            TEST_TREE_SCHEMA.load_snapshot(self.path)
@@ -11,7 +11,7 @@ from . import TEST_TREE_SCHEMA
 
 class TestTreeSchema(unittest.TestCase):
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_get_users(self, mock_get):
         resp_users = [
             {
@@ -51,7 +51,7 @@ class TestTreeSchema(unittest.TestCase):
         assert 'asher@treeschema.com' in usrs_by_email
         assert 'grant@treeschema.com' in usrs_by_email
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_get_all_data_stores(self, mock_get):
         ds_name = "Kafka Prod Cluster"
         resp_data_stores = [
@@ -103,7 +103,7 @@ class TestTreeSchema(unittest.TestCase):
         assert ds_name.lower() in ds_by_name
         
 
-    @patch('treeschema.api.client.r.get')  
+    @patch('treeschema.api.client.r.Session.get')  
     def test_get_all_transformations(self, mock_get):
         transformation_name = "My Tansform"
         resp_transformations = [
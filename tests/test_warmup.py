@@ -0,0 +1,118 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+import pytest
+
+from treeschema.api import APIClient, endpoints
+from treeschema.api.transport import InMemoryTransport
+from treeschema.catalog import DataField, DataSchema, DataStore
+from treeschema.exceptions import InvalidInputs
+from treeschema.treeschema import _EntityHolder
+from . import TS, TEST_TREE_SCHEMA, data_store, field, page, schema
+
+
+class TestWarmup(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = APIClient.configure_transport(InMemoryTransport())
+        self.patches = [
+            patch.object(TEST_TREE_SCHEMA, '_entity_holder', _EntityHolder(TEST_TREE_SCHEMA)),
+            patch.object(TEST_TREE_SCHEMA, '_data_stores_retrieved', False),
+            patch.dict('treeschema.catalog.base_serializer._identity_map', clear=True),
+        ]
+        for p in self.patches:
+            p.start()
+
+        add = self.transport.add
+        add('get', endpoints.DATA_STORES, page('data_stores', [
+            data_store(7301, 'Warm Kafka'), data_store(7302, 'Warm PG')
+        ]))
+        add('get', endpoints.SCHEMAS.format(data_store_id=7301), page('data_schemas', [
+            schema(7311, 'orders.created', 7301),
+            schema(7312, 'orders.shipped', 7301),
+            schema(7313, 'users', 7301),
+        ]))
+        for schema_id in (7311, 7312):
+            add(
+                'get',
+                endpoints.FIELDS.format(data_store_id=7301, data_schema_id=schema_id),
+                page('data_fields', [field(schema_id * 10, 'id')])
+            )
+        add(
+            'get',
+            endpoints.FIELD_VALUES.format(data_store_id=7301, data_schema_id=7311, field_id=73110),
+            page('field_values', [{
+                'created_ts': TS, 'description_markup': None, 'description_raw': None,
+                'field_value': 'A', 'field_value_id': 7341, 'updated_ts': TS
+            }])
+        )
+        add('post', endpoints.BATCH_ASSETS, {
+            'data_stores': [data_store(7302, 'Warm PG')],
+            'data_schemas': [schema(7331, 'public.accounts', 7302)],
+            'data_fields': []
+        })
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+        APIClient.configure_transport()
+
+    def urls(self, method='get'):
+        return [url for m, url, _ in self.transport.requests if m == method]
+
+    def test_warm(self):
+        report = TEST_TREE_SCHEMA.warm([
+            {'data_store': 'Warm Kafka', 'schemas': ['orders.*'], 'depth': 'fields'},
+            {'data_store': 'warm kafka', 'schemas': 'orders.created', 'depth': 'values'},
+            {'data_store': 7302, 'schemas': [7331]},
+        ], max_workers=4)
+
+        steps = {s.name: s for s in report.steps}
+        assert [s.name for s in report.steps] == ['data_stores', 'schemas', 'fields', 'values']
+        assert (steps['data_stores'].requests, steps['data_stores'].entities) == (1, 2)
+        # One listing for Warm Kafka and one batch call for the schema ID
+        assert (steps['schemas'].requests, steps['schemas'].entities) == (2, 3)
+        assert (steps['fields'].requests, steps['fields'].entities) == (2, 2)
+        assert (steps['values'].requests, steps['values'].entities) == (1, 1)
+        assert report.total_seconds >= 0
+
+        kafka = TEST_TREE_SCHEMA.data_store(7301)
+        assert kafka.schema('orders.created', pre_fetch=False)._fields_retrieved
+        assert not kafka.schema('users', pre_fetch=False)._fields_retrieved
+        assert TEST_TREE_SCHEMA.data_store(7302).schema(7331, pre_fetch=False).name == 'public.accounts'
+        assert self.urls('post') == [endpoints.BATCH_ASSETS]
+        assert endpoints.SCHEMAS.format(data_store_id=7302) not in self.urls()
+
+        # Everything is in memory, warming again sends no requests
+        sent = len(self.transport.requests)
+        report = TEST_TREE_SCHEMA.warm([
+            {'data_store': 'Warm Kafka', 'schemas': ['orders.*'], 'depth': 'fields'}
+        ])
+        assert len(self.transport.requests) == sent
+        assert all(s.requests == 0 for s in report.steps)
+
+    def test_loaded_on_calling_thread(self):
+        threads = set()
+
+        def recording(add):
+            def wrapper(owner, entity, **kwargs):
+                threads.add(threading.get_ident())
+                return add(owner, entity, **kwargs)
+            return wrapper
+
+        with patch.object(DataStore, '_add_data_schema', recording(DataStore._add_data_schema)), \
+                patch.object(DataSchema, '_add_data_field', recording(DataSchema._add_data_field)), \
+                patch.object(DataField, '_add_field_value', recording(DataField._add_field_value)):
+            TEST_TREE_SCHEMA.warm([
+                {'data_store': 'Warm Kafka', 'schemas': ['orders.*'], 'depth': 'fields'},
+                {'data_store': 'Warm Kafka', 'schemas': ['orders.created'], 'depth': 'values'}
+            ], max_workers=4)
+        assert threads == {threading.get_ident()}
+        assert len(self.urls()) == 5
+
+    def test_invalid_spec(self):
+        with pytest.raises(InvalidInputs):
+            TEST_TREE_SCHEMA.warm([{'schemas': ['*']}])
+        with pytest.raises(InvalidInputs):
+            TEST_TREE_SCHEMA.warm([{'data_store': 1, 'depth': 'everything'}])
@@ -1,2 +1,3 @@
 from .auth import TreeSchemaAuth
 from .treeschema import TreeSchema
+from .async_treeschema import AsyncTreeSchema
@@ -1 +1,2 @@
-from .client import APIClient
\ No newline at end of file
+from .client import APIClient
+from .async_client import AsyncAPIClient
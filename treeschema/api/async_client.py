@@ -0,0 +1,91 @@
+import asyncio
+import functools
+import inspect
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+from .client import APIClient
+
+
+class AsyncAPIClient(object):
+    """An asyncio counterpart to `APIClient`. Every endpoint method of
+    `APIClient` is available as a coroutine with the same name and
+    arguments.
+
+    Requests are executed on a bounded thread pool through the same pooled
+    session used by the synchronous client, so awaiting a request never
+    blocks the event loop and many lookups can be in flight at once. To
+    keep connections open for every in-flight request, size the connection
+    pool to match the number of workers:
+
+    >>> from treeschema.api import APIClient, AsyncAPIClient
+    >>> APIClient.configure_pool(pool_maxsize=32)
+    >>> client = AsyncAPIClient(max_workers=32)
+    >>> data_store = await client.get_data_store_by_name('Kafka')
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 32,
+        executor: Executor = None
+    ) -> None:
+        """
+        :param max_workers: the maximum number of requests that can be in
+            flight at the same time, ignored when an executor is provided
+        :param executor: an optional executor to run requests on, when
+            provided the caller is responsible for shutting it down
+        """
+        self.client = APIClient()
+        self._owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='treeschema'
+        )
+
+    async def run(self, func, *args, **kwargs):
+        """Runs a blocking callable on the client's executor and
+        awaits the result.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor,
+            functools.partial(func, *args, **kwargs)
+        )
+
+    def close(self) -> None:
+        """Shuts down the executor if it was created by this client"""
+        if self._owns_executor:
+            self.executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+
+def _make_async_method(name: str):
+    """Creates a coroutine that executes the `APIClient` method `name`"""
+    sync_method = getattr(APIClient, name)
+
+    @functools.wraps(sync_method)
+    async def async_method(self, *args, **kwargs):
+        return await self.run(getattr(self.client, name), *args, **kwargs)
+
+    return async_method
+
+
+def _is_endpoint_method(name: str) -> bool:
+    """Only public, regular (non-static, non-generator) methods are
+    mirrored as coroutines.
+    """
+    attr = inspect.getattr_static(APIClient, name)
+    return (
+        not name.startswith('_')
+        and inspect.isfunction(attr)
+        and not inspect.isgeneratorfunction(attr)
+    )
+
+
+for _name in dir(APIClient):
+    if _is_endpoint_method(_name):
+        setattr(AsyncAPIClient, _name, _make_async_method(_name))
@@ -1,7 +1,21 @@
+import math
+import os
+import time
 import requests as r
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List
 
+from . import codec as _codec
 from . import endpoints
+from .http_cache import ResponseCache
+from . import session as _session
+from .rate_limit import (
+    BATCH_ASSETS, DBT, READS, WRITES,
+    FileTokenBucket, RateLimiter, TokenBucket, endpoint_family
+)
+from .resilience import CircuitBreaker, RetryPolicy
+from .single_flight import SingleFlight, request_key
+from .transport import HttpTransport, Transport
 from ..exceptions import TreeSchemaApiError
 from .. import TreeSchemaAuth
 
@@ -9,69 +23,455 @@ from .. import TreeSchemaAuth
 class APIClient(object):
     """The underlying client that manages all interactions
     with the Tree Schema REST API.
+
+    All clients within a process send their requests through a single
+    pooled, keep-alive session so that connections are reused across
+    serializers instead of being opened for every request.
     """
     __APPL_JSON_HDR__ = {'Content-Type': 'application/json'}
 
+    # The maximum number of pages fetched concurrently for a listing
+    page_workers = 8
+
+    # Resilience settings shared by all clients, see `configure_resilience()`
+    timeout = (10, 60)
+    retry_policy = RetryPolicy()
+    circuit_breaker = CircuitBreaker()
+
+    # Where requests are sent, see `configure_transport()`
+    transport = HttpTransport()
+
+    # Client side rate limits, see `configure_rate_limits()`
+    rate_limiter = None
+
+    # Identical GETs in flight at the same time share one request, set 
+    # to None to disable
+    single_flight = SingleFlight()
+
+    # Conditional request cache for GETs, see `configure_http_cache()`
+    http_cache = None
+
+    # JSON encoding and request compression, see `configure_codec()`
+    codec = _codec.JsonCodec()
+    compress_min_bytes = None
+
     def __init__(self, *args, **kwargs) -> None: 
         self.auth = TreeSchemaAuth()
         self.base_headers = {'Authorization': 'Basic ' + self.auth.encoded_secret}
 
+    @property
+    def session(self) -> r.Session:
+        """The pooled session shared by every client in this process"""
+        return _session.get_session()
+
+    @staticmethod
+    def configure_pool(
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True
+    ) -> _session.PoolConfig:
+        """Configures the connection pool that is shared by all clients,
+        serializers and dbt managers in this process.
+
+        :param pool_connections: the number of per-host connection pools
+            to keep cached
+        :param pool_maxsize: the maximum number of connections kept open
+            to a single host
+        :param pool_block: whether to wait for a free connection once a
+            host has `pool_maxsize` connections in use
+        :param keep_alive: whether connections should be kept open between
+            requests
+        :returns: the pool configuration that is now in use
+
+        >>> APIClient.configure_pool(pool_maxsize=32, pool_block=True)
+        """
+        return _session.configure_pool(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive
+        )
+
+    @classmethod
+    def configure_resilience(
+        cls,
+        connect_timeout: float = 10,
+        read_timeout: float = 60,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30,
+        max_retry_after: float = 300,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30
+    ) -> None:
+        """Configures the timeouts, retries and circuit breaker used by
+        all clients in this process.
+
+        Idempotent requests (reads and deletes) are retried with 
+        exponential backoff and jitter on connection errors, timeouts and
+        429, 500, 502, 503 and 504 responses. Other requests are only 
+        retried when they could not connect or when the API responds with 
+        a 429, in which case `Retry-After` is honored.
+
+        :param connect_timeout: seconds to wait to establish a connection
+        :param read_timeout: seconds to wait for the server to respond
+        :param max_retries: retries after the first attempt, 0 disables retries
+        :param backoff_factor: the base delay between retries, in seconds
+        :param max_backoff: the longest delay between two attempts
+        :param max_retry_after: the longest `Retry-After` that is honored
+        :param failure_threshold: consecutive failures that open the circuit 
+            breaker, 0 disables the circuit breaker
+        :param reset_timeout: seconds the circuit stays open before a
+            trial request is sent
+
+        >>> APIClient.configure_resilience(read_timeout=120, max_retries=5)
+        """
+        cls.timeout = (connect_timeout, read_timeout)
+        cls.retry_policy = RetryPolicy(
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            max_backoff=max_backoff,
+            max_retry_after=max_retry_after
+        )
+        cls.circuit_breaker = CircuitBreaker(
+            failure_threshold=failure_threshold,
+            reset_timeout=reset_timeout
+        )
+
+    @classmethod
+    def configure_rate_limits(
+        cls,
+        reads: float = None,
+        writes: float = None,
+        batch_assets: float = None,
+        dbt: float = None,
+        burst: float = None,
+        shared_dir: str = None
+    ) -> [RateLimiter, None]:
+        """Limits the rate of requests sent by all clients and threads in 
+        this process. Each endpoint family has its own token bucket, a 
+        family without a rate is not limited. 
+
+        When `shared_dir` is provided the buckets are stored in files 
+        within that directory, so every process on the host that uses the 
+        same directory shares a single limit per family.
+
+        :param reads: requests per second for GET requests
+        :param writes: requests per second for requests that create,
+            update or delete assets
+        :param batch_assets: requests per second for the batch-assets endpoint
+        :param dbt: requests per second for the dbt endpoints
+        :param burst: the largest burst allowed for each family, defaults 
+            to one second worth of requests
+        :param shared_dir: an optional directory to share the limits 
+            across processes on this host
+        :returns: the rate limiter that is now in use, None if no rates
+            are limited
+
+        >>> APIClient.configure_rate_limits(reads=20, writes=5, shared_dir='/tmp')
+        """
+        rates = {READS: reads, WRITES: writes, BATCH_ASSETS: batch_assets, DBT: dbt}
+        buckets = {}
+        for family, rate in rates.items():
+            if rate is None:
+                continue
+            if shared_dir:
+                path = os.path.join(shared_dir, 'treeschema-%s.bucket' % family)
+                buckets[family] = FileTokenBucket(path, rate, burst)
+            else:
+                buckets[family] = TokenBucket(rate, burst)
+        cls.rate_limiter = RateLimiter(buckets) if buckets else None
+        return cls.rate_limiter
+
+    @classmethod
+    def configure_codec(
+        cls,
+        codec: str = 'auto',
+        compress_min_bytes: int = None
+    ) -> _codec.JsonCodec:
+        """Configures how request and response bodies are encoded by all
+        clients in this process.
+
+        :param codec: `json`, `orjson` or `auto` to use `orjson` when it 
+            is installed, `orjson` is considerably faster for large 
+            responses such as field listings and batch retrievals
+        :param compress_min_bytes: when set, request bodies of at least 
+            this many bytes are gzip compressed before being sent, None 
+            disables request compression
+        :returns: the codec that is now in use
+
+        >>> APIClient.configure_codec('auto', compress_min_bytes=64 * 1024)
+        """
+        cls.codec = _codec.get_codec(codec)
+        cls.compress_min_bytes = compress_min_bytes
+        return cls.codec
+
+    @classmethod
+    def configure_transport(cls, transport: Transport = None) -> Transport:
+        """Sets the transport that all clients in this process send their
+        requests through. Timeouts, retries, the circuit breaker and rate 
+        limits are applied by the client regardless of the transport.
+
+        :param transport: a `Transport`, None restores the default 
+            `HttpTransport`
+        :returns: the transport that is now in use
+
+        >>> from treeschema.api.transport import ReplayTransport
+        >>> APIClient.configure_transport(ReplayTransport('crawl.jsonl'))
+        """
+        cls.transport = transport if transport is not None else HttpTransport()
+        return cls.transport
+
+    @classmethod
+    def configure_http_cache(cls, max_entries: int = 1024) -> [ResponseCache, None]:
+        """Enables a conditional request cache for GET requests made by all
+        clients in this process. Responses that include an `ETag` or 
+        `Last-Modified` header are kept, and later requests for the same 
+        URL and parameters are sent with `If-None-Match` / 
+        `If-Modified-Since`. When nothing has changed the server responds 
+        with `304 Not Modified` and the cached response is decoded and 
+        returned.
+
+        :param max_entries: the number of responses to keep, 0 disables 
+            the cache
+        :returns: the cache that is now in use, None if disabled
+
+        >>> APIClient.configure_http_cache(max_entries=10000)
+        >>> ts.data_store('my data store').get_schemas(refresh=True)
+        """
+        cls.http_cache = ResponseCache(max_entries) if max_entries else None
+        return cls.http_cache
+
+    def _json_body_inputs(self, json_body: Any) -> Dict[str, Any]:
+        """Builds the request arguments for a JSON body, encoding it 
+        with the configured codec and compressing large bodies.
+        """
+        if type(self.codec) is _codec.JsonCodec and self.compress_min_bytes is None:
+            return {'json': json_body, 'headers': self.base_headers}
+
+        data = self.codec.dumps(json_body)
+        headers = dict(self.base_headers, **self.__APPL_JSON_HDR__)
+        if self.compress_min_bytes is not None and len(data) >= self.compress_min_bytes:
+            data = _codec.compress(data)
+            headers['Content-Encoding'] = 'gzip'
+        return {'data': data, 'headers': headers}
+
+    def _send(
+        self, 
+        method: str, 
+        url: str, 
+        idempotent: bool = True, 
+        **kwargs
+    ) -> r.Response:
+        """Sends a request through the configured transport, applying the
+        timeouts, retries, circuit breaker and rate limits.
+
+        :param method: one of `get`, `post` or `delete`
+        :param url: The URL for the API
+        :param idempotent: whether the request can safely be sent again
+        :returns: the final response
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        policy = self.retry_policy
+        breaker = self.circuit_breaker
+        limiter = self.rate_limiter
+        family = endpoint_family(method, url)
+        transport = self.transport
+        attempt = 0
+        while True:
+            breaker.before_request()
+            try:
+                if limiter is not None:
+                    limiter.acquire(family)
+            except BaseException:
+                breaker.release()
+                raise
+            try:
+                resp = transport.send(method, url, **kwargs)
+            except (r.exceptions.ConnectionError, r.exceptions.Timeout) as e:
+                breaker.record_failure()
+                delay = policy.exception_delay(e, attempt, idempotent)
+                if delay is None:
+                    raise
+            except Exception:
+                # Any other error, e.g. a broken response, is a failure that
+                # is not retried
+                breaker.record_failure()
+                raise
+            except BaseException:
+                breaker.release()
+                raise
+            else:
+                if resp.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                delay = policy.response_delay(resp, attempt, idempotent)
+                if delay is None:
+                    return resp
+            attempt += 1
+            time.sleep(delay)
+
     def _get_by_url(self, url: str, params: Dict[str, Any] = None) -> Dict:
-        """Executes a GET from the Tree Schema URL and returns the results
+        """Executes a GET from the Tree Schema URL and returns the results.
+        Concurrent callers requesting the same URL and parameters share a 
+        single in-flight request.
 
         :param url: The URL for the API
         :returns: A dictionary of response values, this can be null or contain
                   error messages if the entity is not found
         """
+        if self.single_flight is None:
+            return self._fetch_by_url(url, params)
+        return self.single_flight.do(
+            request_key(url, params),
+            lambda: self._fetch_by_url(url, params)
+        )
+
+    def _fetch_by_url(self, url: str, params: Dict[str, Any] = None) -> Dict:
+        """Sends the GET request for `_get_by_url()`, revalidating a
+        cached response when the conditional request cache is enabled.
+        """
         get_inputs = {'headers': self.base_headers}
         if params:
             get_inputs['params'] = params
 
-        resp = r.get(url, **get_inputs)
+        cache = self.http_cache
+        cached = None
+        if cache is not None:
+            cache_key = request_key(url, params)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                get_inputs['headers'] = dict(self.base_headers, **cached.validators())
+
+        resp = self._send('get', url, **get_inputs)
+        if resp.status_code == 304 and cached is not None:
+            return self.codec.loads(cache.not_modified(cached))
         if resp.status_code >= 400:
             raise TreeSchemaApiError(
-                'Error: %s' % resp.text
+                'Error: %s' % resp.text,
+                status_code=resp.status_code
             )
-        return resp.json()
+        body = self.codec.decode_response(resp)
+        if cache is not None:
+            cache.modified()
+            cache.store(cache_key, resp)
+        return body
 
-    def _get_paginated_by_url(self, url: str, pagininate_resp_key: str) -> List[Dict]:
-        """Gets all objects that exist from a paginated API
+    def _get_paginated_by_url(
+        self, 
+        url: str, 
+        pagininate_resp_key: str, 
+        params: Dict[str, Any] = None
+    ) -> List[Dict]:
+        """Gets all objects that exist from a paginated API. The first page
+        is retrieved on its own, when it reports the total count the
+        remaining pages are fetched concurrently and reassembled in order.
         
+        :param url: the endpoint to query
+        :param pagininate_resp_key: the response key that contains the list of items
+        :param params: additional query parameters sent with every page
+        """
+        params = params or {}
+        found = self._get_by_url(url, params=dict(params, page=1))
+        pages = [found[pagininate_resp_key]]
+        next_page = self._next_page_number(found, 1)
+
+        page_cnt = self._page_count(found, pagininate_resp_key)
+        if next_page is not None and page_cnt and page_cnt > 1 and self.page_workers > 1:
+            remaining_pages = list(range(2, page_cnt + 1))
+            workers = min(self.page_workers, len(remaining_pages))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(
+                    lambda page: self._get_by_url(url, params=dict(params, page=page)),
+                    remaining_pages
+                ))
+            pages.extend(res[pagininate_resp_key] for res in results)
+            # Entities may have been added since the first page was read
+            next_page = self._next_page_number(results[-1], page_cnt)
+
+        while next_page is not None:
+            found = self._get_by_url(url, params=dict(params, page=next_page))
+            pages.append(found[pagininate_resp_key])
+            next_page = self._next_page_number(found, next_page)
+
+        return [entity for page in pages for entity in page]
+
+    def _iter_paginated_by_url(self, url: str, pagininate_resp_key: str) -> Iterator[Dict]:
+        """Yields all objects from a paginated API one page at a time. 
+        While the caller consumes a page the following page is fetched in
+        the background so that at most two pages are held in memory.
+
         :param url: the endpoint to query
         :param pagininate_resp_key: the response key that contains the list of items
         """
-        entities = []
-        has_next = True
-        params = {'page': 1}
-        while has_next:
-            found = self._get_by_url(url, params=params)
-            entities.extend(found[pagininate_resp_key])
-
-            if 'meta' in found.keys():
-                next_page = found['meta']['next_page']
-                if next_page is None:
-                    has_next = False
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page = 1
+            pending = executor.submit(self._get_by_url, url, params={'page': page})
+            while pending is not None:
+                found = pending.result()
+                page = self._next_page_number(found, page)
+                if page is not None:
+                    pending = executor.submit(self._get_by_url, url, params={'page': page})
                 else:
-                    params['page'] += 1 
-            
-        return entities
+                    pending = None
+                yield from found.pop(pagininate_resp_key)
+
+    def _get_total_count(self, url: str) -> [int, None]:
+        """Returns the number of objects in a paginated API as reported by
+        the first page, None if the response does not contain a total count.
+        Only the count is read, so the page holds a single object.
+        """
+        found = self._get_by_url(url, params={'page': 1, 'page_size': 1})
+        meta = found.get('meta') or {}
+        return meta.get('total_cnt')
+
+    @staticmethod
+    def _next_page_number(found: Dict, page: int) -> [int, None]:
+        """Returns the page that follows `page`, or None for the last page"""
+        meta = found.get('meta')
+        if not meta or meta.get('next_page') is None:
+            return None
+        return page + 1
+
+    @staticmethod
+    def _page_count(found: Dict, pagininate_resp_key: str) -> [int, None]:
+        """Estimates the total number of pages from the first page of
+        results, None if the response does not contain a total count
+        """
+        meta = found.get('meta') or {}
+        total_cnt = meta.get('total_cnt')
+        per_page = len(found[pagininate_resp_key])
+        if not total_cnt or not per_page:
+            return None
+        return math.ceil(total_cnt / per_page)
 
-    def _post_to_url(self, url: str, json_body: Dict, params: Dict = None) -> Dict:
+    def _post_to_url(
+        self, 
+        url: str, 
+        json_body: Dict, 
+        params: Dict = None,
+        idempotent: bool = False
+    ) -> Dict:
         """Sends a post request to Tree Schema 
 
         :param url: The URL for the API
         :param json_body: A dictionary of values to send 
+        :param idempotent: True if the request only reads data and can 
+            safely be retried
         :returns: A dictionary response from the request
         """
-        inputs = {'json': json_body, 'headers': self.base_headers}
+        inputs = self._json_body_inputs(json_body)
         if params:
             inputs['params'] = params
-        resp = r.post(url, **inputs)
+        resp = self._send('post', url, idempotent=idempotent, **inputs)
         if resp.status_code >= 400:
             raise TreeSchemaApiError(
-                'Error: %s' % resp.text
+                'Error: %s' % resp.text,
+                status_code=resp.status_code
             )
-        return resp.json()
+        return self.codec.decode_response(resp)
 
     def _post_files_to_url(self, url: str, files: Dict) -> Dict:
         """Sends a post request to Tree Schema 
@@ -83,12 +483,13 @@ class APIClient(object):
         file_headers = self.base_headers.copy()
         file_headers['Accept'] = 'application/octet-stream'
         inputs = {'files': files, 'headers': file_headers}
-        resp = r.post(url, **inputs)
+        resp = self._send('post', url, idempotent=False, **inputs)
         if resp.status_code >= 400:
             raise TreeSchemaApiError(
-                'Error: %s' % resp.text
+                'Error: %s' % resp.text,
+                status_code=resp.status_code
             )
-        return resp.json()
+        return self.codec.decode_response(resp)
 
     def _delete_by_url(self, url: str, json_body: Dict = None) -> bool:
         """Executes a DELETE from the Tree Schema URL 
@@ -96,11 +497,12 @@ class APIClient(object):
         :param url: The URL for the API
         :returns: A boolean, True if the delete is successful
         """
-        body = {}
         if json_body:
-            body['json'] = json_body
+            inputs = self._json_body_inputs(json_body)
+        else:
+            inputs = {'headers': self.base_headers}
 
-        resp = r.delete(url, headers=self.base_headers, **body)
+        resp = self._send('delete', url, **inputs)
         if resp.status_code >= 400:
             success = False
         else:
@@ -112,7 +514,8 @@ class APIClient(object):
         url = endpoints.BATCH_ASSETS
         return self._post_to_url(
             url, 
-            json_body=assets
+            json_body=assets,
+            idempotent=True
         )
 
     def get_all_users(self) -> Dict: 
@@ -122,7 +525,14 @@ class APIClient(object):
             url,
             pagininate_resp_key='users'
         )
-    
+
+    def iter_all_users(self) -> Iterator[Dict]:
+        """Yields all users in the user's organization page by page"""
+        yield from self._iter_paginated_by_url(
+            endpoints.USERS,
+            pagininate_resp_key='users'
+        )
+
     def get_user_by_email(self, email: str):
         """Retrieves a user from their email"""
         url = endpoints.USERS
@@ -146,11 +556,27 @@ class APIClient(object):
             **params
         )
 
-    def get_all_data_stores(self) -> Dict: 
-        """Retrieves a data store from the Tree Schema API"""
+    def get_all_data_stores(self, updated_since: str = None) -> Dict: 
+        """Retrieves a data store from the Tree Schema API
+
+        :param updated_since: only retrieve data stores updated at or 
+            after this timestamp
+        """
         url = endpoints.DATA_STORES
         return self._get_paginated_by_url(
             url,
+            pagininate_resp_key='data_stores',
+            params={'updated_since': updated_since} if updated_since else None
+        )
+
+    def count_data_stores(self) -> [int, None]:
+        """Retrieves the total number of data stores"""
+        return self._get_total_count(endpoints.DATA_STORES)
+
+    def iter_all_data_stores(self) -> Iterator[Dict]:
+        """Yields all data stores page by page"""
+        yield from self._iter_paginated_by_url(
+            endpoints.DATA_STORES,
             pagininate_resp_key='data_stores'
         )
 
@@ -186,15 +612,34 @@ class APIClient(object):
             json_body=_tags,
         )
 
-    def get_all_schemas_for_data_store(self, data_store_id) -> List[Dict]:
+    def get_all_schemas_for_data_store(
+        self, 
+        data_store_id, 
+        updated_since: str = None
+    ) -> List[Dict]:
         args = {'data_store_id': data_store_id}
         url = endpoints.SCHEMAS.format(**args)
         data_schemas = self._get_paginated_by_url(
             url,
-            pagininate_resp_key='data_schemas'
+            pagininate_resp_key='data_schemas',
+            params={'updated_since': updated_since} if updated_since else None
         )            
         return data_schemas
 
+    def count_schemas_for_data_store(self, data_store_id) -> [int, None]:
+        """Retrieves the total number of schemas in a data store"""
+        args = {'data_store_id': data_store_id}
+        return self._get_total_count(endpoints.SCHEMAS.format(**args))
+
+    def iter_all_schemas_for_data_store(self, data_store_id) -> Iterator[Dict]:
+        """Yields all schemas for a data store page by page"""
+        args = {'data_store_id': data_store_id}
+        url = endpoints.SCHEMAS.format(**args)
+        yield from self._iter_paginated_by_url(
+            url,
+            pagininate_resp_key='data_schemas'
+        )
+
     def get_data_schema_by_name(
         self, 
         data_store_id: int, 
@@ -264,16 +709,40 @@ class APIClient(object):
     def get_all_fields_for_schema(
         self, 
         data_store_id: int, 
-        data_schema_id: int
+        data_schema_id: int,
+        updated_since: str = None
     ) -> List[Dict]:
         args = {'data_store_id': data_store_id, 'data_schema_id': data_schema_id}
         url = endpoints.FIELDS.format(**args)
         fields = self._get_paginated_by_url(
             url,
-            pagininate_resp_key='data_fields'
+            pagininate_resp_key='data_fields',
+            params={'updated_since': updated_since} if updated_since else None
         )            
         return fields
 
+    def count_fields_for_schema(
+        self, 
+        data_store_id: int, 
+        data_schema_id: int
+    ) -> [int, None]:
+        """Retrieves the total number of fields in a schema"""
+        args = {'data_store_id': data_store_id, 'data_schema_id': data_schema_id}
+        return self._get_total_count(endpoints.FIELDS.format(**args))
+
+    def iter_all_fields_for_schema(
+        self, 
+        data_store_id: int, 
+        data_schema_id: int
+    ) -> Iterator[Dict]:
+        """Yields all fields for a schema page by page"""
+        args = {'data_store_id': data_store_id, 'data_schema_id': data_schema_id}
+        url = endpoints.FIELDS.format(**args)
+        yield from self._iter_paginated_by_url(
+            url,
+            pagininate_resp_key='data_fields'
+        )
+
     def get_data_field_by_name(
         self,
         data_store_id: int,
@@ -369,6 +838,19 @@ class APIClient(object):
         )            
         return field_values
 
+    def iter_all_values_for_field(self, data_store_id, data_schema_id, field_id) -> Iterator[Dict]:
+        """Yields all of the sample values for a given field page by page"""
+        args = {
+            'data_store_id': data_store_id, 
+            'data_schema_id': data_schema_id, 
+            'field_id': field_id
+        }
+        url = endpoints.FIELD_VALUES.format(**args)
+        yield from self._iter_paginated_by_url(
+            url,
+            pagininate_resp_key='field_values'
+        )
+
     def get_field_value_by_name(
         self,
         data_store_id: int,
@@ -452,6 +934,13 @@ class APIClient(object):
             pagininate_resp_key='transformations'
         )
 
+    def iter_all_transformations(self) -> Iterator[Dict]:
+        """Yields all transformations page by page"""
+        yield from self._iter_paginated_by_url(
+            endpoints.TRANSFORMATIONS,
+            pagininate_resp_key='transformations'
+        )
+
     def get_transformation_by_name(self, name: str) -> Dict[str, Any]:
         """Retrieves a transformation via the Tree Schema API"""
         url = endpoints.TRANSFORMATIONS
@@ -493,7 +982,16 @@ class APIClient(object):
             pagininate_resp_key='transformation_links'
         )            
         return transformation_links
-    
+
+    def iter_all_transformation_links(self, transformation_id) -> Iterator[Dict]:
+        """Yields all links for a transformation page by page"""
+        args = {'transformation_id': transformation_id}
+        url = endpoints.TRANSFORMATION_LINKS.format(**args)
+        yield from self._iter_paginated_by_url(
+            url,
+            pagininate_resp_key='transformation_links'
+        )
+
     def create_transformation_links(
         self, 
         transformation_id, 
@@ -535,7 +1033,8 @@ class APIClient(object):
         return self._post_to_url(
             url, 
             json_body=links,
-            params=params
+            params=params,
+            idempotent=True
         )
 
     def get_transformation_link_by_id(
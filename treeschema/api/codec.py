@@ -0,0 +1,91 @@
+import gzip
+import io
+import json
+from typing import Any
+
+import requests as r
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+
+class JsonCodec(object):
+    """Encodes request bodies and decodes responses with the standard
+    library `json` module.
+    """
+    name = 'json'
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    def loads(self, content: bytes) -> Any:
+        return json.loads(content)
+
+    def decode_response(self, resp: r.Response) -> Any:
+        return resp.json()
+
+
+class OrjsonCodec(JsonCodec):
+    """Encodes and decodes JSON with `orjson`, which is several times
+    faster than the standard library for large payloads.
+    """
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError('orjson must be installed to use the orjson codec')
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, content: bytes) -> Any:
+        return orjson.loads(content)
+
+    def decode_response(self, resp: r.Response) -> Any:
+        return orjson.loads(resp.content)
+
+
+def get_codec(name: str = 'auto') -> JsonCodec:
+    """Returns a codec by name
+
+    :param name: `json`, `orjson` or `auto`, which selects `orjson` when
+        it is installed and falls back to `json` otherwise
+    """
+    if name == 'auto':
+        name = 'orjson' if orjson is not None else 'json'
+    if name == 'orjson':
+        return OrjsonCodec()
+    if name == 'json':
+        return JsonCodec()
+    raise ValueError('Unknown JSON codec: %s' % name)
+
+
+def accept_encoding() -> str:
+    """The content encodings the client can decode, brotli is only
+    advertised when a brotli decoder is installed.
+    """
+    encodings = ['gzip', 'deflate']
+    if brotli is not None:
+        encodings.append('br')
+    return ', '.join(encodings)
+
+
+def compress(body: bytes) -> bytes:
+    """Gzip compresses a request body. The header's timestamp is zero so
+    that identical bodies compress to identical bytes, e.g. for recorded
+    exchanges to match on replay.
+    """
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode='wb', compresslevel=6, mtime=0) as f:
+        f.write(body)
+    return buf.getvalue()
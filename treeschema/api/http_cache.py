@@ -0,0 +1,83 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable
+
+import requests as r
+
+
+class CachedResponse(object):
+    """The raw content of a response along with its validators"""
+    __slots__ = ('etag', 'last_modified', 'content')
+
+    def __init__(self, etag: str, last_modified: str, content: bytes) -> None:
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content = content
+
+    def validators(self) -> Dict[str, str]:
+        """The headers that ask the server to revalidate this response"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache(object):
+    """A thread-safe, size-bounded cache of GET responses keyed on the
+    URL and parameters. Only responses that carry an `ETag` or
+    `Last-Modified` header are stored. When the server answers a
+    conditional request with `304 Not Modified` the stored content is
+    decoded instead of downloading it again. The content is kept as the
+    raw bytes, which are immutable, so callers always receive their own
+    copy of the decoded body.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """
+        :param max_entries: the number of responses to keep, the least
+            recently used responses are dropped first
+        """
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> [CachedResponse, None]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def store(self, key: Hashable, resp: r.Response) -> None:
+        """Stores the content if the response can be revalidated"""
+        etag = resp.headers.get('ETag')
+        last_modified = resp.headers.get('Last-Modified')
+        with self._lock:
+            if not etag and not last_modified:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = CachedResponse(etag, last_modified, resp.content)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def not_modified(self, entry: CachedResponse) -> bytes:
+        """Returns the stored content for a 304 response"""
+        with self._lock:
+            self.hits += 1
+        return entry.content
+
+    def modified(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,148 @@
+import os
+import struct
+import threading
+import time
+from typing import Dict
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+from . import endpoints
+
+# Endpoint families that can be limited independently
+READS = 'reads'
+WRITES = 'writes'
+BATCH_ASSETS = 'batch_assets'
+DBT = 'dbt'
+
+
+def endpoint_family(method: str, url: str) -> str:
+    """Returns the rate limit family for a request"""
+    if url.startswith(endpoints.BATCH_ASSETS):
+        return BATCH_ASSETS
+    if '/dbt/' in url:
+        return DBT
+    if method == 'get':
+        return READS
+    return WRITES
+
+
+class TokenBucket(object):
+    """A thread-safe token bucket. Tokens are added continuously at `rate`
+    per second up to `capacity`, each request consumes one token and
+    waits when the bucket is empty.
+    """
+
+    def __init__(self, rate: float, capacity: float = None) -> None:
+        """
+        :param rate: the sustained number of requests per second
+        :param capacity: the largest burst allowed, defaults to one
+            second worth of requests
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _take(self, tokens: float, now: float, available: float, updated: float):
+        """Refills the bucket and tries to consume `tokens`.
+
+        :returns: a tuple of the remaining tokens, and the number of
+            seconds to wait before trying again (0 if the tokens were taken)
+        """
+        available = min(self.capacity, available + (now - updated) * self.rate)
+        if available >= tokens:
+            return available - tokens, 0.0
+        return available, (tokens - available) / self.rate
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Blocks until `tokens` are available and consumes them
+
+        :returns: the number of seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens, wait = self._take(tokens, now, self._tokens, self._updated)
+                self._updated = now
+            if wait == 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+
+class FileTokenBucket(TokenBucket):
+    """A token bucket whose state is stored in a small file so that every
+    process on the host that points at the same file shares one limit.
+    Access is serialized with an exclusive `flock`, only available on
+    POSIX systems.
+    """
+    _STATE = struct.Struct('!dd')
+
+    def __init__(self, path: str, rate: float, capacity: float = None) -> None:
+        """
+        :param path: the file that holds the shared bucket state, it is
+            created if it does not exist
+        :param rate: the sustained number of requests per second, across
+            all processes
+        :param capacity: the largest burst allowed
+        """
+        if fcntl is None:
+            raise OSError('A shared rate limit requires a POSIX system with fcntl')
+        super(FileTokenBucket, self).__init__(rate, capacity)
+        self.path = path
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+    def _read_state(self):
+        raw = os.pread(self._fd, self._STATE.size, 0)
+        if len(raw) < self._STATE.size:
+            return self.capacity, time.time()
+        return self._STATE.unpack(raw)
+
+    def acquire(self, tokens: float = 1) -> float:
+        waited = 0.0
+        while True:
+            # flock does not exclude threads that share the descriptor
+            with self._lock:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+                try:
+                    available, updated = self._read_state()
+                    # Wall clock time is shared between processes
+                    now = time.time()
+                    available, wait = self._take(tokens, now, available, min(updated, now))
+                    os.pwrite(self._fd, self._STATE.pack(available, now), 0)
+                finally:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+            if wait == 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class RateLimiter(object):
+    """Holds one token bucket per endpoint family, families without a
+    bucket are not limited.
+
+    >>> limiter = RateLimiter({READS: TokenBucket(20), WRITES: TokenBucket(5)})
+    >>> limiter.acquire(READS)
+    """
+
+    def __init__(self, buckets: Dict[str, TokenBucket]) -> None:
+        self.buckets = buckets
+
+    def acquire(self, family: str) -> float:
+        """Waits for a token for the family
+
+        :returns: the number of seconds spent waiting
+        """
+        bucket = self.buckets.get(family)
+        if bucket is None:
+            return 0.0
+        return bucket.acquire()
@@ -0,0 +1,188 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable
+
+import requests as r
+
+from ..exceptions import CircuitBreakerOpen
+
+
+class RetryPolicy(object):
+    """Decides whether a request should be retried and how long to wait
+    before the next attempt.
+
+    Delays grow exponentially with "full jitter", each delay is a random
+    value between zero and `backoff_factor * 2 ** attempt`, capped at
+    `max_backoff`. A 429 response that includes a `Retry-After` header
+    waits for the time requested by the server instead.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30,
+        retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+        max_retry_after: float = 300
+    ) -> None:
+        """
+        :param max_retries: the maximum number of retries after the first
+            attempt, 0 disables retries
+        :param backoff_factor: the base delay, in seconds
+        :param max_backoff: the longest delay between two attempts
+        :param retry_statuses: response status codes that can be retried
+        :param max_retry_after: the longest `Retry-After` that is honored,
+            longer waits are not retried
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.max_retry_after = max_retry_after
+
+    def backoff(self, attempt: int) -> float:
+        """The delay before retrying after attempt number `attempt`
+        (starting at 0)
+        """
+        ceiling = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def retry_after(resp: r.Response) -> [float, None]:
+        """Parses the `Retry-After` header, given either in seconds or as
+        an HTTP date. Returns None when the header is missing or invalid.
+        """
+        value = resp.headers.get('Retry-After')
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def response_delay(
+        self,
+        resp: r.Response,
+        attempt: int,
+        idempotent: bool
+    ) -> [float, None]:
+        """Returns how long to wait before retrying a response, or None if
+        the response should be returned to the caller as is. A 429 is
+        retried for every request since the server did not process it,
+        other statuses are only retried for idempotent requests.
+        """
+        if attempt >= self.max_retries or resp.status_code not in self.retry_statuses:
+            return None
+        if resp.status_code == 429:
+            retry_after = self.retry_after(resp)
+            if retry_after is not None:
+                return retry_after if retry_after <= self.max_retry_after else None
+        elif not idempotent:
+            return None
+        return self.backoff(attempt)
+
+    def exception_delay(
+        self,
+        exc: Exception,
+        attempt: int,
+        idempotent: bool
+    ) -> [float, None]:
+        """Returns how long to wait before retrying after a connection
+        error or timeout, or None if the exception should be raised. A
+        request that could not connect was never sent and can always be
+        retried.
+        """
+        if attempt >= self.max_retries:
+            return None
+        if idempotent or isinstance(exc, r.exceptions.ConnectTimeout):
+            return self.backoff(attempt)
+        return None
+
+
+class CircuitBreaker(object):
+    """Fails requests fast while the Tree Schema API is unavailable.
+
+    After `failure_threshold` consecutive failures (connection errors,
+    timeouts or 5xx responses) the circuit opens and requests raise
+    `CircuitBreakerOpen` without being sent. Once `reset_timeout` seconds
+    have passed a single trial request is let through, the circuit closes
+    again if it succeeds and re-opens if it fails.
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30
+    ) -> None:
+        """
+        :param failure_threshold: the number of consecutive failures that
+            opens the circuit, 0 disables the circuit breaker
+        :param reset_timeout: seconds to wait before a trial request
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def before_request(self) -> None:
+        """Raises `CircuitBreakerOpen` if the request may not be sent"""
+        with self._lock:
+            state = self._state()
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+            raise CircuitBreakerOpen(
+                'The Tree Schema API has failed %s consecutive times, requests '
+                'are paused for up to %s seconds' % (self._failures, self.reset_timeout)
+            )
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def release(self) -> None:
+        """Lets another trial request through when a request was allowed
+        but not sent, e.g. because it was interrupted
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or (
+                self.failure_threshold and self._failures >= self.failure_threshold
+            ):
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
@@ -0,0 +1,113 @@
+import os
+import threading
+
+import requests as r
+from requests.adapters import HTTPAdapter
+
+from .codec import accept_encoding
+
+
+class PoolConfig(object):
+    """Settings for the HTTP connection pool that is shared by every
+    `APIClient` within the current process.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True
+    ) -> None:
+        """
+        :param pool_connections: the number of per-host connection pools
+            to keep cached
+        :param pool_maxsize: the maximum number of connections kept open
+            to a single host
+        :param pool_block: when True, requests wait for a free connection
+            once `pool_maxsize` connections to a host are in use instead of
+            opening (and later discarding) an extra connection
+        :param keep_alive: when False every request asks the server to
+            close the connection once the response has been sent
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+
+
+_lock = threading.Lock()
+_config = PoolConfig()
+_session = None
+_session_pid = None
+
+
+def _build_session(config: PoolConfig) -> r.Session:
+    """Creates a new session with an adapter mounted for both schemes"""
+    session = r.Session()
+    adapter = HTTPAdapter(
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_maxsize,
+        pool_block=config.pool_block
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['Accept-Encoding'] = accept_encoding()
+    if not config.keep_alive:
+        session.headers['Connection'] = 'close'
+    return session
+
+
+def get_session() -> r.Session:
+    """Returns the session shared by all clients in this process. A new
+    session is created on first use and after a fork, since sockets must
+    not be shared between a parent and child process.
+    """
+    global _session, _session_pid
+    pid = os.getpid()
+    if _session is None or _session_pid != pid:
+        with _lock:
+            if _session is None or _session_pid != pid:
+                _session = _build_session(_config)
+                _session_pid = pid
+    return _session
+
+
+def close_session() -> None:
+    """Closes all pooled connections, a new session will be created
+    the next time one is requested.
+    """
+    global _session, _session_pid
+    with _lock:
+        if _session is not None and _session_pid == os.getpid():
+            _session.close()
+        _session = None
+        _session_pid = None
+
+
+def configure_pool(
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    pool_block: bool = False,
+    keep_alive: bool = True
+) -> PoolConfig:
+    """Sets the connection pool settings for the process. Any existing
+    pooled connections are closed so the new settings take effect on
+    the next request.
+
+    :returns: the `PoolConfig` that is now in use
+
+    >>> from treeschema.api import APIClient
+    >>> APIClient.configure_pool(pool_maxsize=32, pool_block=True)
+    """
+    global _config
+    new_config = PoolConfig(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        keep_alive=keep_alive
+    )
+    close_session()
+    with _lock:
+        _config = new_config
+    return new_config
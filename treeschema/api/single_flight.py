@@ -0,0 +1,75 @@
+import copy
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Flight(object):
+    """A call that is in progress, shared by every caller of the same key"""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.waiters = 0
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """Deduplicates identical calls that are in flight at the same time.
+
+    The first caller for a key executes the call, callers that arrive
+    while it is running wait for it and receive a deep copy of the same
+    result instead of issuing their own request. Copies are taken from a
+    snapshot made before the result is handed back, so no caller can see
+    another caller's changes to the response.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights = {}
+        self.shared = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Executes `func` unless a call for `key` is already in flight
+
+        :param key: identifies the call, e.g. the URL and parameters
+        :param func: the callable that performs the call
+        :returns: the result of the call
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = _Flight()
+                self._flights[key] = flight
+            else:
+                flight.waiters += 1
+                self.shared += 1
+
+        if not is_leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.result)
+
+        try:
+            result = func()
+        except BaseException as e:
+            with self._lock:
+                del self._flights[key]
+                flight.error = e
+            flight.done.set()
+            raise
+
+        with self._lock:
+            del self._flights[key]
+            if flight.waiters:
+                flight.result = copy.deepcopy(result)
+        flight.done.set()
+        return result
+
+
+def request_key(url: str, params: Dict[str, Any] = None) -> Hashable:
+    """Builds the single-flight key for a GET request"""
+    if not params:
+        return (url, ())
+    return (url, tuple(sorted((k, str(v)) for k, v in params.items())))
@@ -0,0 +1,238 @@
+import base64
+import hashlib
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+import requests as r
+from requests.structures import CaseInsensitiveDict
+
+from . import session as _session
+from ..exceptions import TreeSchemaApiError
+
+
+class Transport(object):
+    """The layer that `APIClient` sends every request through. A
+    transport receives the HTTP method, URL and the keyword arguments
+    that `requests` accepts and returns a `requests.Response`.
+    """
+
+    def send(self, method: str, url: str, **kwargs) -> r.Response:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class HttpTransport(Transport):
+    """Sends requests to the Tree Schema API over the pooled session"""
+
+    def send(self, method: str, url: str, **kwargs) -> r.Response:
+        return getattr(_session.get_session(), method)(url, **kwargs)
+
+
+def build_response(
+    url: str,
+    status_code: int = 200,
+    content: bytes = b'',
+    headers: Dict[str, str] = None
+) -> r.Response:
+    """Creates a `requests.Response` without a network round trip"""
+    resp = r.Response()
+    resp.url = url
+    resp.status_code = status_code
+    resp._content = content
+    resp.headers = CaseInsensitiveDict(headers or {})
+    resp.encoding = 'utf-8'
+    return resp
+
+
+def exchange_key(method: str, url: str, kwargs: Dict[str, Any]) -> Hashable:
+    """Identifies a request by its method, URL, query parameters and a
+    digest of its body, so that e.g. two batch retrievals to the same
+    URL with different ids are told apart.
+    """
+    params = kwargs.get('params') or {}
+    params = tuple(sorted((k, str(v)) for k, v in params.items()))
+    if kwargs.get('json') is not None:
+        body = json.dumps(kwargs['json'], sort_keys=True).encode('utf-8')
+    elif kwargs.get('data') is not None:
+        body = kwargs['data']
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+    else:
+        body = b''
+    digest = hashlib.sha1(body).hexdigest() if body else None
+    return (method.lower(), url, params, digest)
+
+
+class InMemoryTransport(Transport):
+    """Serves responses registered in memory, useful for tests and for
+    profiling the client without a server. Requests that do not match a
+    registered route receive a 404.
+
+    >>> transport = InMemoryTransport()
+    >>> transport.add('get', endpoints.DATA_STORES, {
+    >>>     'data_stores': [],
+    >>>     'meta': {'current_page': 1, 'next_page': None, 'total_cnt': 0}
+    >>> })
+    >>> APIClient.configure_transport(transport)
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._routes = {}
+        self.requests = []
+
+    def add(
+        self,
+        method: str,
+        url: str,
+        body: Any = None,
+        status_code: int = 200,
+        headers: Dict[str, str] = None,
+        handler: Callable[..., Tuple[int, Any]] = None
+    ) -> None:
+        """Registers the response for a method and URL, query parameters
+        are ignored when matching.
+
+        :param body: a JSON serializable body to return
+        :param status_code: the status code to return
+        :param headers: response headers
+        :param handler: instead of a fixed body, a callable that receives
+            `(method, url, **kwargs)` and returns `(status_code, body)`
+        """
+        with self._lock:
+            self._routes[(method.lower(), url)] = (status_code, body, headers, handler)
+
+    def send(self, method: str, url: str, **kwargs) -> r.Response:
+        with self._lock:
+            self.requests.append((method.lower(), url, kwargs))
+            route = self._routes.get((method.lower(), url))
+        if route is None:
+            return build_response(url, 404, b'{"error": "Not found"}')
+
+        status_code, body, headers, handler = route
+        if handler is not None:
+            status_code, body = handler(method, url, **kwargs)
+        content = b'' if body is None else json.dumps(body).encode('utf-8')
+        return build_response(url, status_code, content, headers)
+
+
+class RecordingTransport(Transport):
+    """Forwards requests to another transport and appends every exchange
+    to a JSON lines file that `ReplayTransport` can serve later.
+
+    >>> recorder = RecordingTransport('crawl.jsonl')
+    >>> APIClient.configure_transport(recorder)
+    >>> ts.batch_load_by_id(data_store_ids=[1, 2, 3])
+    >>> recorder.close()
+    """
+
+    def __init__(self, path: str, transport: Transport = None) -> None:
+        """
+        :param path: the file that exchanges are appended to
+        :param transport: the transport that sends the requests, defaults
+            to `HttpTransport`
+        """
+        self.path = path
+        self.transport = transport or HttpTransport()
+        self._lock = threading.Lock()
+        self._file = open(path, 'a', encoding='utf-8')
+        self._started = time.monotonic()
+
+    def send(self, method: str, url: str, **kwargs) -> r.Response:
+        sent_at = time.monotonic()
+        resp = self.transport.send(method, url, **kwargs)
+        elapsed = time.monotonic() - sent_at
+        method, url, params, digest = exchange_key(method, url, kwargs)
+        record = {
+            'method': method,
+            'url': url,
+            'params': params,
+            'body_digest': digest,
+            'offset': sent_at - self._started,
+            'elapsed': elapsed,
+            'status_code': resp.status_code,
+            'headers': dict(resp.headers),
+            'content': base64.b64encode(resp.content or b'').decode('ascii')
+        }
+        line = json.dumps(record) + '\n'
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+        return resp
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+        self.transport.close()
+
+
+class ReplayTransport(Transport):
+    """Serves the exchanges captured by `RecordingTransport`. Repeated
+    requests are answered in the order they were recorded, once the
+    recorded responses for a request are used up the last one is served
+    again. Requests that were never recorded raise a `TreeSchemaApiError`.
+
+    >>> APIClient.configure_transport(ReplayTransport('crawl.jsonl', realtime=False))
+    """
+
+    # The response headers that describe the encoding on the wire, the
+    # recorded content has already been decoded
+    __WIRE_HEADERS__ = ('content-encoding', 'content-length', 'transfer-encoding')
+
+    def __init__(self, path: str, realtime: bool = False, speed: float = 1.0) -> None:
+        """
+        :param path: a file written by `RecordingTransport`
+        :param realtime: when True each response is delayed by the time the
+            original request took, otherwise responses are served as fast
+            as possible
+        :param speed: divides the recorded delays when replaying in realtime
+        """
+        self.realtime = realtime
+        self.speed = speed
+        self._lock = threading.Lock()
+        self._exchanges = {}
+        self.served = 0
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                key = (
+                    record['method'],
+                    record['url'],
+                    tuple(tuple(p) for p in record['params']),
+                    record['body_digest']
+                )
+                self._exchanges.setdefault(key, deque()).append(record)
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._exchanges.values())
+
+    def send(self, method: str, url: str, **kwargs) -> r.Response:
+        key = exchange_key(method, url, kwargs)
+        with self._lock:
+            recorded = self._exchanges.get(key)
+            if not recorded:
+                raise TreeSchemaApiError(
+                    'Error: no recorded response for %s %s' % (method.upper(), url)
+                )
+            record = recorded.popleft() if len(recorded) > 1 else recorded[0]
+            self.served += 1
+
+        if self.realtime and record['elapsed'] > 0:
+            time.sleep(record['elapsed'] / self.speed)
+        headers = {
+            k: v for k, v in record['headers'].items()
+            if k.lower() not in self.__WIRE_HEADERS__
+        }
+        return build_response(
+            url,
+            record['status_code'],
+            base64.b64decode(record['content']),
+            headers
+        )
@@ -0,0 +1,340 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
+
+from .api import AsyncAPIClient
+from .catalog import (
+    DataField,
+    DataSchema,
+    DataStore,
+    Transformation,
+    TreeSchemaUser
+)
+from .catalog.user import resolve_user
+from .exceptions import DataAssetDoesNotExist, TreeSchemaApiError
+from .treeschema import TreeSchema
+
+
+class AsyncTreeSchema(object):
+    """An asyncio entry point into your Tree Schema data catalog.
+
+    `AsyncTreeSchema` wraps the `TreeSchema` singleton, every lookup is
+    awaitable so that catalog access does not stall the event loop.
+    Entities returned are the same objects held by the `TreeSchema`
+    singleton.
+
+    Requests run concurrently on a bounded worker pool. The catalog is not
+    thread safe, so the responses are applied to it on a single catalog
+    thread, and the `TreeSchema` should not be used from other threads
+    while lookups are running. Concurrent lookups that need the same
+    listing share a single request.
+
+    >>> from treeschema import AsyncTreeSchema
+    >>> ats = AsyncTreeSchema('<your email>', '<your secret key>')
+    >>> ds = await ats.data_store('Kafka')
+    >>> schemas = await asyncio.gather(
+            *[ats.schema(ds, name) for name in ('topic.a', 'topic.b')]
+        )
+    """
+
+    def __init__(
+        self,
+        username: str = None,
+        secret_key: str = None,
+        max_workers: int = 32
+    ) -> None:
+        """
+        :param username: The username in Tree Schema, not required if the
+            `TreeSchema` object has already been created
+        :param secret_key: The secret key for the username in Tree Schema
+        :param max_workers: The maximum number of requests that can be in
+            flight at the same time
+        """
+        self.ts = TreeSchema(username, secret_key)
+        self.client = AsyncAPIClient(max_workers=max_workers)
+        # Every read and change of the catalog runs on this one thread
+        self._catalog = ThreadPoolExecutor(max_workers=1, thread_name_prefix='treeschema-catalog')
+        self._prefetch_locks = {}
+
+    async def _run(self, func, *args, **kwargs):
+        """Runs a request on the worker pool"""
+        return await self.client.run(func, *args, **kwargs)
+
+    async def _apply(self, func, *args, **kwargs):
+        """Runs a call that reads or changes the catalog on the catalog
+        thread
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._catalog,
+            functools.partial(func, *args, **kwargs)
+        )
+
+    async def _prefetch_once(self, key: Tuple, is_retrieved, list_, load) -> None:
+        """Runs a full listing one time, concurrent callers that need the
+        same listing wait for the first one instead of issuing their own.
+
+        :param key: a unique key for the listing
+        :param is_retrieved: a callable that returns True once fetched
+        :param list_: the blocking callable that requests the raw listing
+        :param load: adds the raw listing to the catalog
+        """
+        if is_retrieved():
+            return
+        lock = self._prefetch_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            if not is_retrieved():
+                await self._apply(load, await self._run(list_))
+
+    async def _lookup(
+        self,
+        inputs: [int, str],
+        maps: Callable[[], Tuple[Dict, Dict]],
+        fetch_by_id: Callable[[int], Dict],
+        fetch_by_name: Callable[[str], Dict],
+        load: Callable[[Dict], Any]
+    ) -> Any:
+        """Looks up an entity by ID or name. An entity in memory is found
+        on the catalog thread, otherwise it is requested on the worker
+        pool and loaded on the catalog thread.
+
+        :param maps: returns the mappings of the entities by ID and by name
+        :param fetch_by_id: requests the raw entity for an ID
+        :param fetch_by_name: requests the raw entity for a name
+        :param load: adds the raw entity to the catalog and returns it
+        :returns: the entity, None if it does not exist
+        """
+        def find():
+            by_id, by_name = maps()
+            if isinstance(inputs, int):
+                return by_id.get(inputs)
+            return by_name.get(inputs.lower())
+
+        found = await self._apply(find)
+        if found is not None:
+            return found
+        fetch = fetch_by_id if isinstance(inputs, int) else fetch_by_name
+        try:
+            raw = await self._run(fetch, inputs)
+        except TreeSchemaApiError as e:
+            if e.status_code != 404:
+                raise
+            raw = None
+        if not raw:
+            return None
+        return await self._apply(load, raw)
+
+    async def data_store(self, data_store_input: [int, str, Dict]) -> DataStore:
+        """Gets or creates a data store, see `TreeSchema.data_store()`
+
+        >>> ds = await ats.data_store('Data store name')
+        """
+        await self._prefetch_once(
+            ('data_stores',),
+            lambda: self.ts._data_stores_retrieved,
+            self.ts._list_data_stores,
+            self.ts._load_data_stores
+        )
+        if isinstance(data_store_input, dict):
+            return await self._apply(self.ts.data_store, data_store_input)
+
+        api = self.client.client
+        holder = self.ts._entity_holder
+        data_store = await self._lookup(
+            data_store_input,
+            lambda: (holder._data_stores_by_id, holder._data_stores_by_name),
+            lambda i: api.get_data_store_by_id(i).get('data_store'),
+            lambda n: api.get_data_store_by_name(name=n).get('data_store'),
+            self.ts.data_store
+        )
+        if data_store is None:
+            raise DataAssetDoesNotExist(
+                'The DataStore requested: %s does not exist' % data_store_input
+            )
+        return data_store
+
+    async def schema(
+        self,
+        data_store: [DataStore, int, str],
+        schema_inputs: [int, str, Dict],
+        **kwargs
+    ) -> DataSchema:
+        """Gets or creates a schema within a data store, see
+        `DataStore.schema()` for the keyword arguments
+
+        :param data_store: a `DataStore` or the ID or name of a data store
+
+        >>> schema = await ats.schema('Kafka', 'topic.a')
+        """
+        if not isinstance(data_store, DataStore):
+            data_store = await self.data_store(data_store)
+        if isinstance(schema_inputs, dict) or kwargs.get('refresh'):
+            return await self._apply(data_store.schema, schema_inputs, **kwargs)
+        if kwargs.get('pre_fetch', True):
+            await self._prefetch_once(
+                ('schemas', data_store.id),
+                lambda: data_store._schemas_retrieved,
+                data_store._list_schemas,
+                data_store._load_schemas
+            )
+
+        api = self.client.client
+        schema = await self._lookup(
+            schema_inputs,
+            lambda: (data_store._schemas_by_id, data_store._schemas_by_name),
+            lambda i: api.get_data_schema_by_id(
+                data_store_id=data_store.id, data_schema_id=i
+            ).get('data_schema'),
+            lambda n: api.get_data_schema_by_name(
+                data_store_id=data_store.id, name=n
+            ).get('data_schema'),
+            lambda raw: data_store.schema(raw, pre_fetch=False)
+        )
+        if schema is None and kwargs.get('raise_if_not_exist'):
+            raise DataAssetDoesNotExist('The schema requested: %s does not exist' % schema_inputs)
+        return schema
+
+    async def field(
+        self,
+        data_schema: DataSchema,
+        field_inputs: [int, str, Dict],
+        **kwargs
+    ) -> DataField:
+        """Gets or creates a field within a schema, see `DataSchema.field()`
+        for the keyword arguments
+
+        >>> schema = await ats.schema('Kafka', 'topic.a')
+        >>> field = await ats.field(schema, 'user_id')
+        """
+        if isinstance(field_inputs, dict) or kwargs.get('refresh'):
+            return await self._apply(data_schema.field, field_inputs, **kwargs)
+        if kwargs.get('pre_fetch', True):
+            await self._prefetch_once(
+                ('fields', data_schema.id),
+                lambda: data_schema._fields_retrieved,
+                data_schema._list_fields,
+                data_schema._load_fields
+            )
+
+        api = self.client.client
+        field = await self._lookup(
+            field_inputs,
+            lambda: (data_schema._fields_by_id, data_schema._fields_by_name),
+            lambda i: api.get_data_field_by_id(
+                data_store_id=data_schema.data_store_id,
+                data_schema_id=data_schema.id,
+                field_id=i
+            ).get('data_field'),
+            lambda n: api.get_data_field_by_name(
+                data_store_id=data_schema.data_store_id,
+                data_schema_id=data_schema.id,
+                name=n
+            ).get('data_field'),
+            lambda raw: data_schema.field(raw, pre_fetch=False)
+        )
+        if field is None and kwargs.get('raise_if_not_exist'):
+            raise DataAssetDoesNotExist('The field requested: %s does not exist' % field_inputs)
+        return field
+
+    async def transformation(
+        self,
+        transformation_input: [int, str, Dict]
+    ) -> Transformation:
+        """Gets or creates a transformation, see `TreeSchema.transformation()`
+
+        >>> t = await ats.transformation('Transformation name')
+        """
+        await self._prefetch_once(
+            ('transformations',),
+            lambda: self.ts._transformations_retrieved,
+            self.ts._list_transformations,
+            self.ts._load_transformations
+        )
+        if isinstance(transformation_input, dict):
+            return await self._apply(self.ts.transformation, transformation_input)
+
+        api = self.client.client
+        holder = self.ts._entity_holder
+        transformation = await self._lookup(
+            transformation_input,
+            lambda: (holder._transformations_by_id, holder._transformations_by_name),
+            lambda i: api.get_transformation_by_id(i).get('transformation'),
+            lambda n: api.get_transformation_by_name(n).get('transformation'),
+            self.ts.transformation
+        )
+        if transformation is None:
+            raise DataAssetDoesNotExist(
+                'The Transformation requested: %s does not exist' % transformation_input
+            )
+        return transformation
+
+    async def user(self, user_input: [int, str]) -> TreeSchemaUser:
+        """Retrieves a single user, see `TreeSchema.user()`"""
+        await self._prefetch_once(
+            ('users',),
+            lambda: self.ts._users_retrieved,
+            self.ts._list_users,
+            self.ts._load_users
+        )
+
+        def load(raw: Dict) -> TreeSchemaUser:
+            user = resolve_user(raw)
+            self.ts._add_user(user)
+            return user
+
+        api = self.client.client
+        holder = self.ts._entity_holder
+        user = await self._lookup(
+            user_input,
+            lambda: (holder._users_by_id, holder._users_by_email),
+            lambda i: api.get_user(user_id=i).get('user'),
+            lambda e: api.get_user_by_email(email=e).get('user'),
+            load
+        )
+        if user is None:
+            raise DataAssetDoesNotExist('The TreeSchemaUser requested: %s does not exist' % user_input)
+        return user
+
+    async def create_links(
+        self,
+        transformation: [Transformation, int, str],
+        links: [
+            Dict,
+            List[Dict],
+            Tuple[DataField, DataField],
+            List[Tuple[DataField, DataField]]
+        ]
+    ) -> Dict:
+        """Creates links for a transformation, see
+        `Transformation.create_links()`
+
+        :param transformation: a `Transformation` or the ID or name of a
+            transformation
+        """
+        if not isinstance(transformation, Transformation):
+            transformation = await self.transformation(transformation)
+        return await self._apply(transformation.create_links, links)
+
+    async def batch_load_by_id(
+        self,
+        data_store_ids: List[int] = None,
+        schema_ids: List[int] = None,
+        field_ids: List[int] = None,
+        batch_size: int = 100
+    ) -> None:
+        """Batch loads a set of data assets, see `TreeSchema.batch_load_by_id()`.
+        The batches are requested concurrently.
+        """
+        api = self.client.client
+        batches = self.ts._asset_batches(data_store_ids, schema_ids, field_ids, batch_size)
+        responses = await asyncio.gather(*[
+            self._run(api.batch_retrieve_assets, assets={'assets': batch}) for batch in batches
+        ])
+        for resp in responses:
+            await self._apply(self.ts._load_asset_batch, resp)
+
+    def close(self) -> None:
+        """Releases the worker pool and the catalog thread"""
+        self.client.close()
+        self._catalog.shutdown(wait=False)
@@ -1,4 +1,4 @@
-from .base_serializer import TreeSchemaSerializer
+from .base_serializer import TreeSchemaSerializer, lazy_handles
 from .user import TreeSchemaUser
 from .field_value import FieldValue
 from .data_field import DataField
@@ -7,4 +7,6 @@ from .data_store import DataStore
 from .lineage import LineageImpact
 from .transformation_link import TransformationLink
 from .transformation import Transformation
+from .batch_loader import BatchLoader, batch_loading
 
+from .records import FieldRecord, FieldValueRecord, LinkRecord, SchemaRecord
@@ -1,13 +1,123 @@
-from typing import Any, Dict, List
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
 
+from .. import negative_cache, search_index
 from ..api import APIClient
-from ..exceptions import InvalidInputs
+from ..exceptions import DataAssetDoesNotExist, InvalidInputs, TreeSchemaApiError
 
 
-class TreeSchemaSerializer(object):
+# Every serialized entity in the process, keyed on (class, id). Values are
+# weak references so entities are released once nothing else holds them.
+_identity_map = weakref.WeakValueDictionary()
+_identity_lock = threading.Lock()
+
+# The attributes that place an entity within its parents, these are set 
+# before an entity is looked up and scope the not found results
+_PARENT_ID_FIELDS = ('data_store_id', 'data_schema_id', 'field_id', 'transformation_id')
+
+# Whether entities constructed by ID or name on this thread are lazy
+# handles when `lazy` is not passed, see `lazy_handles()`, and the batch
+# loader that queues them, see `batch_loader.batch_loading()`
+_lazy_scope = threading.local()
+
+# Collections that are set when an entity is constructed but that belong
+# to its retrieved values, lazy handles retrieve themselves when they are
+# first used
+_DEFERRED_ATTRIBUTES = ('tags',)
+
+
+@contextmanager
+def lazy_handles(lazy: bool = True) -> Iterator[None]:
+    """Entities constructed by ID or name within this block are lazy
+    handles, as if `lazy=True` was passed to each of them. A lazy handle
+    records the reference without retrieving anything and is hydrated
+    on the first access of an attribute other than its ID.
+
+    >>> from treeschema.catalog import DataField, lazy_handles
+    >>> with lazy_handles():
+    >>>     source = DataField(123, data_store_id=1, data_schema_id=2)
+    >>>     target = DataField(456, data_store_id=1, data_schema_id=3)
+    >>> transformation.create_links([(source, target)])
+    """
+    previous = getattr(_lazy_scope, 'lazy', False)
+    _lazy_scope.lazy = lazy
+    try:
+        yield
+    finally:
+        _lazy_scope.lazy = previous
+
+
+def is_lazy_handle(entity: Any) -> bool:
+    """Whether an entity is a lazy handle that has not been retrieved,
+    the names of lazy handles are not known and they are indexed by ID
+    """
+    return isinstance(entity, TreeSchemaSerializer) and entity._lazy
+
+
+class _IdentityMapMeta(type):
+    """Routes the construction of every serializer through the identity
+    map so that all code paths share one instance per entity. A complete
+    dictionary for an entity that is already in memory updates and
+    returns the existing instance. IDs and names are retrieved as usual,
+    so that expired or evicted entities are refreshed, and the retrieved
+    values are merged into the existing instance. IDs and names
+    constructed with `lazy=True`, or within `lazy_handles()`, are not
+    retrieved until an attribute other than the ID is used, a lazy ID
+    for an entity that is in memory returns the existing instance.
+    """
+
+    def __call__(cls, inputs, *args, lazy=None, **kwargs):
+        if not hasattr(cls, '__ID_FIELD_NAME__'):
+            return super(_IdentityMapMeta, cls).__call__(inputs, *args, **kwargs)
+        if lazy is None:
+            lazy = getattr(_lazy_scope, 'lazy', False)
+
+        if isinstance(inputs, dict) and cls._all_valid_inputs(cls, inputs):
+            with _identity_lock:
+                existing = _identity_map.get((cls, inputs[cls.__ID_FIELD_NAME__]))
+            if existing is not None:
+                existing._update_self(inputs.copy())
+                return existing
+
+        if lazy and isinstance(inputs, (int, str)):
+            instance = cls.__new__(cls)
+            instance._lazy = True
+            instance.__init__(inputs, *args, **kwargs)
+            instance._deferred = {
+                a: instance.__dict__.pop(a) for a in _DEFERRED_ATTRIBUTES if a in instance.__dict__
+            }
+            registered = instance._register()
+            loader = getattr(_lazy_scope, 'loader', None)
+            if loader is not None and registered is instance:
+                loader.add(instance)
+            return registered
+        instance = super(_IdentityMapMeta, cls).__call__(inputs, *args, **kwargs)
+        return instance._register()
+
+
+class TreeSchemaSerializer(object, metaclass=_IdentityMapMeta):
     """Base class for serializing objects from the 
     Tree Schema API.
     """
+    # Set on handles that have not been retrieved yet
+    _lazy = False
+    _id = None
+
+    def _register(self) -> 'TreeSchemaSerializer':
+        """Registers this entity in the identity map once its ID is known
+        and returns the instance that is held for the ID
+        """
+        if self._id is None or not hasattr(self, '__ID_FIELD_NAME__'):
+            return self
+        cls = self.__class__
+        with _identity_lock:
+            existing = _identity_map.setdefault((cls, self._id), self)
+        if existing is not self and self._is_validated:
+            existing._update_self(self._obj)
+        return existing
+
     def __init__(self, inputs):
         self._validate_input(inputs)
         this_id, this_name, raw_inputs = None, None, None
@@ -32,7 +142,65 @@ class TreeSchemaSerializer(object):
         self._name = this_name
         self._raw_inputs = raw_inputs.copy() if isinstance(raw_inputs, dict) else None
         self._is_validated = False
-        self.obj
+        if not self._lazy:
+            self.obj
+
+    @property
+    def id(self) -> [int, None]:
+        if self._id is None and self._lazy:
+            self.hydrate()
+        return self._id
+
+    @id.setter
+    def id(self, value: [int, None]) -> None:
+        self._id = value
+
+    @property
+    def is_lazy(self) -> bool:
+        """Whether this is a lazy handle that has not been retrieved yet"""
+        return self._lazy
+
+    def hydrate(self) -> 'TreeSchemaSerializer':
+        """Retrieves a lazy handle from Tree Schema, does nothing for
+        entities that are already retrieved
+
+        :returns: itself
+
+        >>> field = DataField(123, data_store_id=1, data_schema_id=2, lazy=True)
+        >>> field.hydrate().name
+        """
+        loader = self.__dict__.pop('_loader', None)
+        if loader is not None and self._lazy:
+            loader.load(self)
+        if self._lazy:
+            self._lazy = False
+            try:
+                self.obj
+            except Exception:
+                self._lazy = True
+                raise
+            self._restore_deferred()
+            self._register()
+        return self
+
+    def _restore_deferred(self) -> None:
+        """Sets the collections that were held back while lazy"""
+        for name, value in self.__dict__.pop('_deferred', {}).items():
+            self.__dict__.setdefault(name, value)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes that are not set, the values of a
+        # lazy handle are retrieved on the first use of any of them
+        if not name.startswith('_') and self.__dict__.get('_lazy'):
+            if name in self.__FIELDS__ or name in self.__dict__.get('_deferred', ()):
+                if name == self.__ID_FIELD_NAME__ and self._id is not None:
+                    return self._id
+                self.hydrate()
+                if name in self.__dict__:
+                    return self.__dict__[name]
+        raise AttributeError(
+            "'%s' object has no attribute '%s'" % (self.__class__.__name__, name)
+        )
 
     def _simplify_user_raw_inputs(self, raw_inputs: Dict):
         """Updates the raw inputs raw_inputs the steward and tech_poc to use the 
@@ -50,6 +218,9 @@ class TreeSchemaSerializer(object):
         return resp
 
     def __repr__(self):
+        if self._lazy:
+            ref = self._id if self._id is not None else repr(self._name)
+            return f'{self.__class__.__name__}(<lazy {ref}>)'
         if hasattr(self, '_obj') and isinstance(self._obj, dict):
             repr_items = []
             for k,v in self._obj.items():
@@ -83,6 +254,7 @@ class TreeSchemaSerializer(object):
                 v = func(resp_obj[f])
                 setattr(self, f, v)
                 resp_obj[f] = v
+        search_index.index_entity(self, resp_obj)
 
     def _all_valid_inputs(self, inputs: Dict) -> bool:
         """Checks to see if all of the inputs provided are validated
@@ -93,6 +265,13 @@ class TreeSchemaSerializer(object):
                 return False
         return True
 
+    @classmethod
+    def _creates(cls, inputs: Any) -> bool:
+        """Checks whether constructing an entity from `inputs` creates it
+        in Tree Schema, i.e. the inputs are an incomplete dictionary
+        """
+        return isinstance(inputs, dict) and not cls._all_valid_inputs(cls, inputs)
+
     @property
     def obj(self) -> Dict[str, Any]:
         """Checks to see if the object already exists locally
@@ -117,12 +296,9 @@ class TreeSchemaSerializer(object):
                 else:
                     this_obj = self._create()
                     self._serialize_obj(this_obj)
+                    self._forget_missing(this_obj)
             else:
-                if self._name:
-                    this_obj = self._get_self_by_name()
-                else:
-                    this_obj = self._get_self_by_id()
-                
+                this_obj = self._get_self()
                 if this_obj:
                     self._is_validated = True
                     self._serialize_obj(this_obj)
@@ -138,11 +314,59 @@ class TreeSchemaSerializer(object):
         self._obj = this_obj
         return self._obj
 
+    def _missing_key(self, by_name: bool, value: Any) -> tuple:
+        """The key for a not found lookup of this entity by ID or by name"""
+        if isinstance(value, str):
+            value = value.lower()
+        parents = tuple(
+            getattr(self, f, None) for f in _PARENT_ID_FIELDS 
+            if f != self.__ID_FIELD_NAME__
+        )
+        return (self.__class__.__name__, parents, by_name, value)
+
+    def _get_self(self) -> Dict[str, Any]:
+        """Retrieves itself by name or by ID. Lookups that Tree Schema
+        reports as not found are remembered by the negative cache, when
+        it is enabled, and raise `DataAssetDoesNotExist`.
+        """
+        by_name = bool(self._name)
+        lookup = self._name if by_name else self.id
+        key = self._missing_key(by_name, lookup)
+        if negative_cache.is_missing(key):
+            raise DataAssetDoesNotExist(
+                'The %s requested: %s does not exist' % (self.__class__.__name__, lookup)
+            )
+        try:
+            this_obj = self._get_self_by_name() if by_name else self._get_self_by_id()
+        except TreeSchemaApiError as e:
+            if e.status_code != 404:
+                raise
+            this_obj = None
+        if not this_obj:
+            negative_cache.add(key)
+            raise DataAssetDoesNotExist(
+                'The %s requested: %s does not exist' % (self.__class__.__name__, lookup)
+            )
+        return this_obj
+
+    def _forget_missing(self, created_obj: Dict[str, Any]) -> None:
+        """Drops not found lookups for an asset that was just created"""
+        if not created_obj:
+            return
+        negative_cache.discard(self._missing_key(False, created_obj.get(self.__ID_FIELD_NAME__)))
+        name_field = getattr(self, '__NAME_FIELD__', None)
+        if name_field and created_obj.get(name_field) is not None:
+            negative_cache.discard(self._missing_key(True, created_obj[name_field]))
+
     def _update_self(self, new_obj):
         """Updates the underlying attributes for itself"""
         if self._all_valid_inputs(new_obj):
-            del self._obj
+            self.__dict__.pop('_obj', None)
+            self._lazy = False
+            self._restore_deferred()
             self._raw_inputs = new_obj
+            # The name may have changed, it is read again from the new values
+            self._name = None
         self.obj
 
     @NotImplementedError
@@ -0,0 +1,113 @@
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+from .base_serializer import _lazy_scope
+from .user import prefetch_users, referenced_user_ids
+from ..api import APIClient
+from ..ts_enums import DATA_STORE, FIELD, SCHEMA
+
+
+# The keys of the batch assets response for each asset type
+_RESPONSE_KEYS = {
+    DATA_STORE: ('data_stores', 'data_store_id'),
+    SCHEMA: ('data_schemas', 'data_schema_id'),
+    FIELD: ('data_fields', 'field_id'),
+}
+
+
+class BatchLoader(object):
+    """Queues lazy data store, schema and field handles and retrieves all
+    of the queued handles together the first time any one of them is
+    used. Handles are retrieved with one batch assets request for every
+    `batch_size` IDs rather than one request each, handles that are not
+    found in the batch are retrieved individually when they are used.
+
+    >>> with batch_loading():
+    >>>     fields = [schema.field(i, pre_fetch=False) for i in field_ids]
+    >>> [f.name for f in fields]  # one request per 100 fields
+    """
+
+    def __init__(self, batch_size: int = 100) -> None:
+        self.batch_size = batch_size
+        self.requests = 0
+        self._pending = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+        # Only one batch is sent at a time, handles that are used while a
+        # batch is in flight wait for it rather than being sent again
+        self._dispatch_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, entity: Any) -> None:
+        """Queues a lazy handle, entities that cannot be retrieved in a
+        batch are ignored
+        """
+        asset_type = getattr(entity, '__BATCH_ASSET_TYPE__', None)
+        if asset_type is None or entity._id is None:
+            return
+        with self._lock:
+            self._pending[(asset_type, entity._id)] = entity
+        entity._loader = self
+
+    def load(self, entity: Any) -> None:
+        """Retrieves every queued handle if the entity is still queued"""
+        with self._dispatch_lock:
+            if entity._lazy:
+                self._dispatch()
+
+    def dispatch(self) -> None:
+        """Retrieves every queued handle"""
+        with self._dispatch_lock:
+            self._dispatch()
+
+    def _dispatch(self) -> None:
+        with self._lock:
+            pending = dict(self._pending)
+            self._pending.clear()
+        keys = list(pending.keys())
+        for i in range(0, len(keys), self.batch_size):
+            batch = keys[i: i + self.batch_size]
+            self._resolve(pending, [{'type': t, 'id': entity_id} for t, entity_id in batch])
+
+    def _resolve(self, pending: Dict, assets: List[Dict[str, Any]]) -> None:
+        resp = APIClient().batch_retrieve_assets(assets={'assets': assets})
+        self.requests += 1
+        found = {
+            asset_type: resp.get(key) or []
+            for asset_type, (key, _) in _RESPONSE_KEYS.items()
+        }
+        # Users are held weakly, this keeps them alive while the entities are built
+        users = prefetch_users(referenced_user_ids(
+            [obj for objs in found.values() for obj in objs]
+        ))
+        for asset_type, objs in found.items():
+            id_field = _RESPONSE_KEYS[asset_type][1]
+            for obj in objs:
+                entity = pending.get((asset_type, obj.get(id_field)))
+                if entity is not None and entity._lazy:
+                    entity.__dict__.pop('_loader', None)
+                    entity._update_self(obj.copy())
+
+
+@contextmanager
+def batch_loading(batch_size: int = 100) -> Iterator[BatchLoader]:
+    """Data stores, schemas and fields constructed by ID within this block
+    are lazy handles that are retrieved together, in batches of
+    `batch_size`, the first time any one of them is used. The handles
+    keep their loader after the block exits.
+
+    >>> with batch_loading() as loader:
+    >>>     schemas = [DataSchema(i, data_store_id=1) for i in schema_ids]
+    >>> schemas[0].name
+    >>> loader.requests
+    """
+    loader = BatchLoader(batch_size)
+    previous = getattr(_lazy_scope, 'loader', None), getattr(_lazy_scope, 'lazy', False)
+    _lazy_scope.loader, _lazy_scope.lazy = loader, True
+    try:
+        yield loader
+    finally:
+        _lazy_scope.loader, _lazy_scope.lazy = previous
@@ -1,13 +1,18 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 from . import FieldValue, TreeSchemaSerializer, TreeSchemaUser
+from .base_serializer import is_lazy_handle
 from .tags import get_tags_added
+from .user import resolve_user
+from .. import catalog_cache, entity_map, search_index
 from ..exceptions import DataAssetDoesNotExist, InvalidFieldInputs
+from ..ts_enums import FIELD
 
 
 class DataField(TreeSchemaSerializer):
     """An object that represents a single data field."""
     __ID_FIELD_NAME__ = 'field_id'
+    __BATCH_ASSET_TYPE__ = FIELD
     __NAME_FIELD__ = 'full_path_name'
     __FIELDS__ = {
         'created_ts': str,
@@ -20,8 +25,8 @@ class DataField(TreeSchemaSerializer):
         'name': str,
         'nullable': bool,
         'parent_path': str,
-        'steward': lambda x: TreeSchemaUser(x),
-        'tech_poc': lambda x: TreeSchemaUser(x),
+        'steward': resolve_user,
+        'tech_poc': resolve_user,
         'type': str,
         'updated_ts': str
     }
@@ -58,8 +63,12 @@ class DataField(TreeSchemaSerializer):
         self.data_store_id = data_store_id
         self.data_schema_id = data_schema_id
         self.tags = []
-        self._field_values_by_id = {}
-        self._field_values_by_value = {}
+        self._field_values_by_id = entity_map.EntityMap(
+            entity_map.FIELD_VALUES, self._evict_field_value
+        )
+        self._field_values_by_value = entity_map.EntityMap(
+            entity_map.FIELD_VALUES, self._evict_field_value, primary=False
+        )
         self._field_values_retrieved = False
         if isinstance(data_field_inputs, dict):
             self._clean_field_inputs(data_field_inputs)
@@ -104,6 +113,7 @@ class DataField(TreeSchemaSerializer):
             )
             added_tags = get_tags_added(tag_res)
             self.tags.extend(added_tags)
+            search_index.index_entity(self, self.obj)
             resp = tag_res
         return resp
         
@@ -123,24 +133,36 @@ class DataField(TreeSchemaSerializer):
 
     @property
     def field_values(self):
-        self._check_retrieve_field_values()
+        if not entity_map.is_complete(self._field_values_retrieved, self._field_values_by_id):
+            return self.get_field_values()
         return self._field_values_by_id
 
     def _add_field_value(self, field_value: FieldValue) -> None:
         """Adds a field value to the internal mappings"""
         self._field_values_by_id[field_value.id] = field_value
-        self._field_values_by_value[field_value.field_value.lower()] = field_value
+        if not is_lazy_handle(field_value):
+            self._field_values_by_value[field_value.field_value.lower()] = field_value
 
     def _remove_field_value(self, field_value_id: int) -> None:
         """Removes a field value from the internal mappings"""
         field_value = self._field_values_by_id.pop(field_value_id, None)
-        if field_value:
+        if field_value and not is_lazy_handle(field_value):
             self._field_values_by_value.pop(field_value.field_value.lower(), None)
 
+    def _evict_field_value(self, field_value: FieldValue, expired: bool) -> None:
+        """Removes a field value that was evicted from the internal mappings"""
+        self._remove_field_value(field_value.id)
+        if expired:
+            self._field_values_retrieved = False
+
     def _reset_field_values(self) -> None:
         """Resets all field value mappings"""
-        self._field_values_by_id = {}
-        self._field_values_by_value = {}
+        self._field_values_by_id = entity_map.EntityMap(
+            entity_map.FIELD_VALUES, self._evict_field_value
+        )
+        self._field_values_by_value = entity_map.EntityMap(
+            entity_map.FIELD_VALUES, self._evict_field_value, primary=False
+        )
 
     def _check_retrieve_field_values(self, force_refresh=False):
         if not self._field_values_retrieved or force_refresh: 
@@ -192,31 +214,76 @@ class DataField(TreeSchemaSerializer):
                 field_updates=update_dict
             )
             self._update_self(resp.get('data_field'))
+            catalog_cache.invalidate(catalog_cache.FIELDS, self.data_schema_id)
         return self
     
 
     def get_field_values(self, refresh: bool = False) -> List:
         """Retrieves all field values for this field from Tree Schema
         """
-        if refresh or not self._field_values_retrieved:
+        complete = entity_map.is_complete(self._field_values_retrieved, self._field_values_by_id)
+        if refresh or not complete:
             if refresh:
                 self._reset_field_values()
-            field_value_results = self.client.get_all_values_for_field(
+            return self._load_field_values(self._list_field_values(refresh))
+
+        return self._field_values_by_id
+
+    def _list_field_values(self, refresh: bool = False) -> List[Dict]:
+        """Retrieves the raw listing of the values of the field, it does
+        not change any local state and can run on any thread
+        """
+        return catalog_cache.cached_listing(
+            catalog_cache.FIELD_VALUES,
+            self.id,
+            lambda: self.client.get_all_values_for_field(
+                data_store_id=self.data_store_id,
+                data_schema_id=self.data_schema_id,
+                field_id=self.id
+            ),
+            refresh=refresh
+        )
+
+    def _load_field_values(self, field_value_results: List[Dict]) -> Dict[int, FieldValue]:
+        """Adds a complete listing of the values of the field"""
+        self._field_values_retrieved = True
+        self._field_values_by_id.evicted = False
+        found = {}
+        for val in field_value_results:
+            found_val = FieldValue(
+                val, 
                 data_store_id=self.data_store_id,
                 data_schema_id=self.data_schema_id,
                 field_id=self.id
             )
-            self._field_values_retrieved = True
-            for val in field_value_results:
-                found_val = FieldValue(
-                    val, 
-                    data_store_id=self.data_store_id,
-                    data_schema_id=self.data_schema_id,
-                    field_id=self.id
-                )
-                self._add_field_value(found_val)
+            self._add_field_value(found_val)
+            found[found_val.id] = found_val
+        if not entity_map.is_complete(self._field_values_retrieved, self._field_values_by_id):
+            # Values were evicted, the listing does not fit in memory
+            return found
+        return self._field_values_by_id
 
-        return self.field_values
+    def iter_field_values(self) -> Iterator[FieldValue]:
+        """Yields each field value for this field. Values are streamed from 
+        Tree Schema one page at a time and are not added to the local cache, 
+        which keeps memory use to roughly one page. If the field values have 
+        already been retrieved the cached values are yielded instead.
+        """
+        if entity_map.is_complete(self._field_values_retrieved, self._field_values_by_id):
+            yield from list(self._field_values_by_id.values())
+            return
+        field_value_results = self.client.iter_all_values_for_field(
+            data_store_id=self.data_store_id,
+            data_schema_id=self.data_schema_id,
+            field_id=self.id
+        )
+        for val in field_value_results:
+            yield FieldValue(
+                val, 
+                data_store_id=self.data_store_id,
+                data_schema_id=self.data_schema_id,
+                field_id=self.id
+            )
 
     def field_value(
         self, 
@@ -262,13 +329,21 @@ class DataField(TreeSchemaSerializer):
             field_value = self._field_values_by_value[field_value_inputs.lower()]
         
         if field_value is None:
-            field_value = FieldValue(
-                field_value_inputs, 
-                data_store_id=self.data_store_id,
-                data_schema_id=self.data_schema_id,
-                field_id=self.id
-            )
+            created = FieldValue._creates(field_value_inputs)
+            try:
+                field_value = FieldValue(
+                    field_value_inputs, 
+                    data_store_id=self.data_store_id,
+                    data_schema_id=self.data_schema_id,
+                    field_id=self.id
+                )
+            except DataAssetDoesNotExist:
+                if raise_if_not_exist:
+                    raise
+                return None
             self._add_field_value(field_value)
+            if created:
+                catalog_cache.invalidate(catalog_cache.FIELD_VALUES, self.id)
 
         if raise_if_not_exist and not field_value:
             raise DataAssetDoesNotExist(
@@ -1,13 +1,19 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 from . import DataField, TreeSchemaSerializer, TreeSchemaUser
+from .base_serializer import is_lazy_handle
 from .tags import get_tags_added
+from .user import prefetch_users, referenced_user_ids, resolve_user
+from .. import catalog_cache, delta_sync, entity_map, name_index, search_index
+from ..fields_table import FieldsTable
 from ..exceptions import DataAssetDoesNotExist
+from ..ts_enums import SCHEMA
 
 
 class DataSchema(TreeSchemaSerializer):
     """An object that represents a single data schema."""
     __ID_FIELD_NAME__ = 'data_schema_id'
+    __BATCH_ASSET_TYPE__ = SCHEMA
     __NAME_FIELD__ = 'name'
     __FIELDS__ = {
         'created_ts': str,
@@ -16,8 +22,8 @@ class DataSchema(TreeSchemaSerializer):
         'description_raw': str,
         'name': str,
         'schema_loc': str,
-        'steward': lambda x: TreeSchemaUser(x),
-        'tech_poc': lambda x: TreeSchemaUser(x),
+        'steward': resolve_user,
+        'tech_poc': resolve_user,
         'type': str,
         'updated_ts': str
     }
@@ -40,9 +46,12 @@ class DataSchema(TreeSchemaSerializer):
         """
         self.data_store_id = data_store_id
         self.tags = []
-        self._fields_by_id = {}
-        self._fields_by_name = {}
+        self._fields_by_id = entity_map.EntityMap(entity_map.FIELDS, self._evict_data_field)
+        self._fields_by_name = entity_map.EntityMap(
+            entity_map.FIELDS, self._evict_data_field, primary=False
+        )
         self._fields_retrieved = False
+        self._fields_hwm = None
         super(DataSchema, self).__init__(data_schema_inputs)
 
     def _get_self_by_id(self):
@@ -80,6 +89,7 @@ class DataSchema(TreeSchemaSerializer):
             )
             added_tags = get_tags_added(tag_res)
             self.tags.extend(added_tags)
+            search_index.index_entity(self, self.obj)
             resp = tag_res
         return resp
         
@@ -98,54 +108,185 @@ class DataSchema(TreeSchemaSerializer):
 
     @property
     def fields(self):
-        self._check_retrieve_fields()
+        if not entity_map.is_complete(self._fields_retrieved, self._fields_by_id):
+            return self.get_fields()
         return self._fields_by_id
 
-    def _add_data_field(self, data_field: DataField) -> None:
-        """Adds a data schema to the internal mappings"""
+    def _add_data_field(self, data_field: DataField, touch: bool = True) -> None:
+        """Adds a data schema to the internal mappings, listings pass
+        `touch=False` and update the name index once for all fields
+        """
         self._fields_by_id[data_field.id] = data_field
-        self._fields_by_name[data_field.name.lower()] = data_field
+        if not is_lazy_handle(data_field):
+            self._fields_by_name[data_field.name.lower()] = data_field
+        if touch:
+            name_index.touch(name_index.FIELDS)
 
     def _remove_data_field(self, field_id: int) -> None:
         """Removes a schema from the internal mappings"""
         field = self._fields_by_id.pop(field_id, None)
-        if field:
+        if field and not is_lazy_handle(field):
             self._fields_by_name.pop(field.name.lower(), None)
+        name_index.touch(name_index.FIELDS)
+
+    def _evict_data_field(self, data_field: DataField, expired: bool) -> None:
+        """Removes a field that was evicted from the internal mappings"""
+        self._remove_data_field(data_field.id)
+        if expired:
+            self._fields_retrieved = False
 
     def _reset_data_fields(self) -> None:
         """Resets all field value mappings"""
-        self._fields_by_id = {}
-        self._fields_by_name = {}
+        self._fields_by_id = entity_map.EntityMap(entity_map.FIELDS, self._evict_data_field)
+        self._fields_by_name = entity_map.EntityMap(
+            entity_map.FIELDS, self._evict_data_field, primary=False
+        )
+        name_index.touch(name_index.FIELDS)
 
     def _check_retrieve_fields(self, force_refresh=False, pre_fetch=True):
         if (not self._fields_retrieved and pre_fetch) or force_refresh: 
             self.get_fields()
 
-    def get_fields(self, refresh: bool =False) -> List[DataField]:
+    def _merge_data_fields(self, field_results: List[Dict]) -> None:
+        """Adds or updates fields that changed in Tree Schema"""
+        # Users are held weakly, this keeps them alive while the entities are built
+        users = prefetch_users(referenced_user_ids(field_results))
+        for field in field_results:
+            existing = self._fields_by_id.get(field['field_id'])
+            if existing is not None and not is_lazy_handle(existing):
+                self._fields_by_name.pop(existing.name.lower(), None)
+            self._add_data_field(DataField(
+                field, 
+                data_store_id=self.data_store_id,
+                data_schema_id=self.id
+            ), touch=False)
+        name_index.touch(name_index.FIELDS)
+        catalog_cache.invalidate(catalog_cache.FIELDS, self.id)
+
+    def _sync_fields(self) -> bool:
+        """Merges the fields updated since the last retrieval, returns
+        False if the fields must be retrieved in full instead
+        """
+        if not delta_sync.can_sync(entity_map.FIELDS, self._fields_retrieved, self._fields_hwm):
+            return False
+        mark = delta_sync.sync_listing(
+            self._fields_by_id,
+            self._fields_hwm,
+            lambda since: self.client.get_all_fields_for_schema(
+                data_store_id=self.data_store_id,
+                data_schema_id=self.id,
+                updated_since=since
+            ),
+            lambda: self.client.count_fields_for_schema(
+                data_store_id=self.data_store_id,
+                data_schema_id=self.id
+            ),
+            self._merge_data_fields
+        )
+        if mark is None:
+            return False
+        self._fields_hwm = mark
+        return True
+
+    def get_fields(self, refresh: bool =False, incremental: bool = False) -> List[DataField]:
         """Retrieves all fields from the data schema. After this is called
         for the first time the fields are cached locally.
 
         :param refresh: Default False, if True, will force all fields 
             to be retrieved from Tree Schema and not the local cache
+        :param incremental: Default False, if True and `refresh` is True, 
+            only the fields updated since the last retrieval are fetched 
+            and merged into the local cache. All fields are retrieved 
+            when fields were deleted from the schema.
         :returns: a list of `DataField` objects that belong to this schema
+
+        >>> my_schema.get_fields(refresh=True, incremental=True)
         """
-        if refresh or not self._fields_retrieved:
+        if refresh and incremental and self._sync_fields():
+            return self.fields
+        if refresh or not entity_map.is_complete(self._fields_retrieved, self._fields_by_id):
             if refresh:
                 self._reset_data_fields()
-            field_results = self.client.get_all_fields_for_schema(
+            return self._load_fields(self._list_fields(refresh))
+
+        return self._fields_by_id
+
+    def _list_fields(self, refresh: bool = False) -> List[Dict]:
+        """Retrieves the raw listing of the fields in the schema, it does
+        not change any local state and can run on any thread
+        """
+        return catalog_cache.cached_listing(
+            catalog_cache.FIELDS,
+            self.id,
+            lambda: self.client.get_all_fields_for_schema(
+                data_store_id=self.data_store_id,
+                data_schema_id=self.id
+            ),
+            refresh=refresh
+        )
+
+    def _load_fields(self, field_results: List[Dict]) -> Dict[int, DataField]:
+        """Adds a complete listing of the fields in the schema"""
+        self._fields_retrieved = True
+        self._fields_by_id.evicted = False
+        found = {}
+        self._fields_hwm = delta_sync.high_water_mark(field_results)
+        # Users are held weakly, this keeps them alive while the entities are built
+        users = prefetch_users(referenced_user_ids(field_results))
+        for field in field_results:
+            found_field = DataField(
+                field, 
                 data_store_id=self.data_store_id,
                 data_schema_id=self.id
             )
-            self._fields_retrieved = True
-            for field in field_results:
-                found_field = DataField(
-                    field, 
-                    data_store_id=self.data_store_id,
-                    data_schema_id=self.id
-                )
-                self._add_data_field(found_field)
+            self._add_data_field(found_field, touch=False)
+            found[found_field.id] = found_field
+        name_index.touch(name_index.FIELDS)
+        if not entity_map.is_complete(self._fields_retrieved, self._fields_by_id):
+            # Fields were evicted, the listing does not fit in memory
+            return found
+        return self._fields_by_id
 
-        return self.fields
+    def fields_table(self) -> FieldsTable:
+        """Returns the fields of the schema as a columnar table. When the 
+        fields have not been retrieved the table is built directly from 
+        the pages returned by Tree Schema without creating `DataField` 
+        objects or adding them to the local cache.
+
+        >>> table = my_schema.fields_table()
+        >>> table.where(nullable=True, has_description=False)
+        """
+        table = FieldsTable()
+        if entity_map.is_complete(self._fields_retrieved, self._fields_by_id):
+            fields = (f.hydrate()._obj for f in list(self._fields_by_id.values()))
+        else:
+            fields = self.client.iter_all_fields_for_schema(self.data_store_id, self.id)
+        table.extend(fields, self.data_store_id, self.id)
+        return table
+
+    def iter_fields(self) -> Iterator[DataField]:
+        """Yields each field in the schema. Fields are streamed from 
+        Tree Schema one page at a time and are not added to the local cache, 
+        which keeps memory use to roughly one page. If the fields have 
+        already been retrieved the cached fields are yielded instead.
+
+        >>> my_schema = ts.data_store('my data store').schema('some schema')
+        >>> for field in my_schema.iter_fields():
+        >>>     print(field.full_path_name)
+        """
+        if entity_map.is_complete(self._fields_retrieved, self._fields_by_id):
+            yield from list(self._fields_by_id.values())
+            return
+        field_results = self.client.iter_all_fields_for_schema(
+            data_store_id=self.data_store_id,
+            data_schema_id=self.id
+        )
+        for field in field_results:
+            yield DataField(
+                field, 
+                data_store_id=self.data_store_id,
+                data_schema_id=self.id
+            )
 
     def field(self, 
         field_inputs: [int, Dict], 
@@ -214,12 +355,20 @@ class DataSchema(TreeSchemaSerializer):
             field = self._fields_by_name[field_inputs.lower()]
         
         if field is None:
-            field = DataField(
-                field_inputs, 
-                data_store_id=self.data_store_id,
-                data_schema_id=self.id
-            )
+            created = DataField._creates(field_inputs)
+            try:
+                field = DataField(
+                    field_inputs, 
+                    data_store_id=self.data_store_id,
+                    data_schema_id=self.id
+                )
+            except DataAssetDoesNotExist:
+                if raise_if_not_exist:
+                    raise
+                return None
             self._add_data_field(field)
+            if created:
+                catalog_cache.invalidate(catalog_cache.FIELDS, self.id)
         
         if raise_if_not_exist and not field:
             raise DataAssetDoesNotExist('The field requested: %s does not exist' % field_inputs) 
@@ -256,6 +405,8 @@ class DataSchema(TreeSchemaSerializer):
         if deleted:
             for fid in _scalar_fields:
                 self._remove_data_field(fid)
+                search_index.remove(search_index.FIELD, fid)
+            catalog_cache.invalidate(catalog_cache.FIELDS, self.id)
         return deleted
 
     def update(self,
@@ -299,4 +450,5 @@ class DataSchema(TreeSchemaSerializer):
                 schema_updates=update_dict
             )
             self._update_self(resp.get('data_schema'))
+            catalog_cache.invalidate(catalog_cache.SCHEMAS, self.data_store_id)
         return self
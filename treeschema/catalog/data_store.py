@@ -1,9 +1,14 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
-from . import DataSchema, TreeSchemaSerializer, TreeSchemaUser
+from . import DataSchema, TreeSchemaSerializer
+from .base_serializer import is_lazy_handle
 from .tags import get_tags_added
+from .user import prefetch_users, referenced_user_ids, resolve_user
+from .. import catalog_cache, delta_sync, entity_map, fields_table, name_index, search_index
+from ..api import APIClient
 from ..exceptions import DataAssetDoesNotExist
 from ..integrations.dbt import DbtManager
+from ..ts_enums import DATA_STORE
 
 
 class DataStore(TreeSchemaSerializer):
@@ -12,6 +17,7 @@ class DataStore(TreeSchemaSerializer):
     with the schemas that belong to it.
     """
     __ID_FIELD_NAME__ = 'data_store_id'
+    __BATCH_ASSET_TYPE__ = DATA_STORE
     __NAME_FIELD__ = 'name'
     __FIELDS__ = {
         'created_ts': str,
@@ -21,8 +27,8 @@ class DataStore(TreeSchemaSerializer):
         'details': dict,
         'name': str,
         'other_type': str,
-        'steward': lambda x: TreeSchemaUser(x),
-        'tech_poc': lambda x: TreeSchemaUser(x),
+        'steward': resolve_user,
+        'tech_poc': resolve_user,
         'type': str,
         'updated_ts': str
     }
@@ -36,12 +42,20 @@ class DataStore(TreeSchemaSerializer):
         fully serialize a data store
         """
         self.tags = []
-        self._schemas_by_id = {}
-        self._schemas_by_name = {}
+        self._schemas_by_id = entity_map.EntityMap(entity_map.SCHEMAS, self._evict_data_schema)
+        self._schemas_by_name = entity_map.EntityMap(
+            entity_map.SCHEMAS, self._evict_data_schema, primary=False
+        )
         self._schemas_retrieved = False
+        self._schemas_hwm = None
         super(DataStore, self).__init__(data_store_inputs)
-        self.dbt = DbtManager(self.id)
         
+    @property
+    def dbt(self) -> DbtManager:
+        if '_dbt' not in self.__dict__:
+            self._dbt = DbtManager(self.id)
+        return self._dbt
+
     def _get_self_by_id(self):
         raw_resp = self.client.get_data_store_by_id(self.id)
         return raw_resp.get('data_store')
@@ -69,6 +83,7 @@ class DataStore(TreeSchemaSerializer):
             tag_res = self.client.add_tag_to_data_store(self.id, tags_to_add)
             added_tags = get_tags_added(tag_res)
             self.tags.extend(added_tags)
+            search_index.index_entity(self, self.obj)
             resp = tag_res
         return resp
 
@@ -86,47 +101,154 @@ class DataStore(TreeSchemaSerializer):
 
     @property
     def schemas(self):
-        self._check_retrieve_schemas()
+        if not entity_map.is_complete(self._schemas_retrieved, self._schemas_by_id):
+            return self.get_schemas()
         return self._schemas_by_id
 
-    def _add_data_schema(self, data_schema: DataSchema) -> None:
-        """Adds a data schema to the internal mappings"""
+    def _add_data_schema(self, data_schema: DataSchema, touch: bool = True) -> None:
+        """Adds a data schema to the internal mappings, listings pass
+        `touch=False` and update the name index once for all schemas
+        """
         self._schemas_by_id[data_schema.id] = data_schema
-        self._schemas_by_name[data_schema.name.lower()] = data_schema
+        if not is_lazy_handle(data_schema):
+            self._schemas_by_name[data_schema.name.lower()] = data_schema
+        if touch:
+            name_index.touch(name_index.SCHEMAS)
 
     def _remove_data_schema(self, schema_id: int) -> None:    
         """Removes a schema from the internal mappings"""
         schema = self._schemas_by_id.pop(schema_id, None)
-        if schema:
+        if schema and not is_lazy_handle(schema):
             self._schemas_by_name.pop(schema.name.lower(), None)
+        name_index.touch(name_index.SCHEMAS)
+
+    def _evict_data_schema(self, data_schema: DataSchema, expired: bool) -> None:
+        """Removes a schema that was evicted from the internal mappings"""
+        self._remove_data_schema(data_schema.id)
+        if expired:
+            self._schemas_retrieved = False
 
     def _reset_data_schemas(self) -> None:
         """Resets all field value mappings"""
-        self._schemas_by_id = {}
-        self._schemas_by_name = {}
+        self._schemas_by_id = entity_map.EntityMap(entity_map.SCHEMAS, self._evict_data_schema)
+        self._schemas_by_name = entity_map.EntityMap(
+            entity_map.SCHEMAS, self._evict_data_schema, primary=False
+        )
+        name_index.touch(name_index.SCHEMAS)
 
     def _check_retrieve_schemas(self, force_refresh=False, pre_fetch=True):
         if (not self._schemas_retrieved and pre_fetch) or force_refresh: 
             self.get_schemas()
 
-    def get_schemas(self, refresh: bool =False) -> List:
+    def _merge_data_schemas(self, schema_results: List[Dict]) -> None:
+        """Adds or updates schemas that changed in Tree Schema"""
+        # Users are held weakly, this keeps them alive while the entities are built
+        users = prefetch_users(referenced_user_ids(schema_results))
+        for schema in schema_results:
+            existing = self._schemas_by_id.get(schema['data_schema_id'])
+            if existing is not None and not is_lazy_handle(existing):
+                self._schemas_by_name.pop(existing.name.lower(), None)
+            self._add_data_schema(DataSchema(schema, data_store_id=self.id), touch=False)
+        name_index.touch(name_index.SCHEMAS)
+        catalog_cache.invalidate(catalog_cache.SCHEMAS, self.id)
+
+    def _sync_schemas(self) -> bool:
+        """Merges the schemas updated since the last retrieval, returns
+        False if the schemas must be retrieved in full instead
+        """
+        if not delta_sync.can_sync(entity_map.SCHEMAS, self._schemas_retrieved, self._schemas_hwm):
+            return False
+        mark = delta_sync.sync_listing(
+            self._schemas_by_id,
+            self._schemas_hwm,
+            lambda since: self.client.get_all_schemas_for_data_store(self.id, updated_since=since),
+            lambda: self.client.count_schemas_for_data_store(self.id),
+            self._merge_data_schemas
+        )
+        if mark is None:
+            return False
+        self._schemas_hwm = mark
+        return True
+
+    def get_schemas(self, refresh: bool =False, incremental: bool = False) -> List:
         """Retrieves all schemas from the data store. After this is called
         for the first time the schemas are cached locally.
 
         :param refresh: Default False, if True, will force all schemas 
             to be retrieved from Tree Schema and not the local cache
+        :param incremental: Default False, if True and `refresh` is True, 
+            only the schemas updated since the last retrieval are fetched 
+            and merged into the local cache. All schemas are retrieved 
+            when schemas were deleted from the data store.
         :returns: a list of `DataSchema` objects that belong to this data store
+
+        >>> my_data_store.get_schemas(refresh=True, incremental=True)
         """
-        if refresh or not self._schemas_retrieved:
+        if refresh and incremental and self._sync_schemas():
+            return self.schemas
+        if refresh or not entity_map.is_complete(self._schemas_retrieved, self._schemas_by_id):
             if refresh:
                 self._reset_data_schemas()
-            schema_results = self.client.get_all_schemas_for_data_store(self.id)
-            self._schemas_retrieved = True
-            for schema in schema_results:
-                found_schema = DataSchema(schema, data_store_id=self.id)
-                self._add_data_schema(found_schema)
-            
-        return self.schemas
+            return self._load_schemas(self._list_schemas(refresh))
+
+        return self._schemas_by_id
+
+    def _list_schemas(self, refresh: bool = False) -> List[Dict]:
+        """Retrieves the raw listing of the schemas in the data store, it
+        does not change any local state and can run on any thread
+        """
+        return catalog_cache.cached_listing(
+            catalog_cache.SCHEMAS,
+            self.id,
+            lambda: self.client.get_all_schemas_for_data_store(self.id),
+            refresh=refresh
+        )
+
+    def _load_schemas(self, schema_results: List[Dict]) -> Dict[int, DataSchema]:
+        """Adds a complete listing of the schemas in the data store"""
+        self._schemas_retrieved = True
+        self._schemas_by_id.evicted = False
+        found = {}
+        self._schemas_hwm = delta_sync.high_water_mark(schema_results)
+        # Users are held weakly, this keeps them alive while the entities are built
+        users = prefetch_users(referenced_user_ids(schema_results))
+        for schema in schema_results:
+            found_schema = DataSchema(schema, data_store_id=self.id)
+            self._add_data_schema(found_schema, touch=False)
+            found[found_schema.id] = found_schema
+        name_index.touch(name_index.SCHEMAS)
+        if not entity_map.is_complete(self._schemas_retrieved, self._schemas_by_id):
+            # Schemas were evicted, the listing does not fit in memory
+            return found
+        return self._schemas_by_id
+
+    def fields_table(self, max_workers: int = None) -> fields_table.FieldsTable:
+        """Returns the fields of every schema in the data store as one 
+        columnar table, see `DataSchema.fields_table()`. Schemas are read
+        concurrently.
+
+        :param max_workers: the number of schemas read at the same time, 
+            defaults to `APIClient.page_workers`
+        """
+        return fields_table.build(
+            list(self.schemas.values()), 
+            max_workers=max_workers or APIClient.page_workers
+        )
+
+    def iter_schemas(self) -> Iterator[DataSchema]:
+        """Yields each schema in the data store. Schemas are streamed from 
+        Tree Schema one page at a time and are not added to the local cache, 
+        which keeps memory use to roughly one page. If the schemas have 
+        already been retrieved the cached schemas are yielded instead.
+
+        >>> for schema in ts.data_store('my data store').iter_schemas():
+        >>>     print(schema.name)
+        """
+        if entity_map.is_complete(self._schemas_retrieved, self._schemas_by_id):
+            yield from list(self._schemas_by_id.values())
+            return
+        for schema in self.client.iter_all_schemas_for_data_store(self.id):
+            yield DataSchema(schema, data_store_id=self.id)
 
     def schema(
         self, 
@@ -175,8 +297,16 @@ class DataStore(TreeSchemaSerializer):
             schema = self._schemas_by_name[schema_inputs.lower()]
         
         if schema is None:
-            schema = DataSchema(schema_inputs, data_store_id=self.id)
+            created = DataSchema._creates(schema_inputs)
+            try:
+                schema = DataSchema(schema_inputs, data_store_id=self.id)
+            except DataAssetDoesNotExist:
+                if raise_if_not_exist:
+                    raise
+                return None
             self._add_data_schema(schema)
+            if created:
+                catalog_cache.invalidate(catalog_cache.SCHEMAS, self.id)
 
         if raise_if_not_exist and not schema:
             raise DataAssetDoesNotExist('The schema requested: %s does not exist' % schema_inputs) 
@@ -216,6 +346,8 @@ class DataStore(TreeSchemaSerializer):
         if deleted:
             for sid in _scalar_schemas:
                 self._remove_data_schema(sid)
+                search_index.remove(search_index.SCHEMA, sid)
+            catalog_cache.invalidate(catalog_cache.SCHEMAS, self.id)
         return deleted
 
 
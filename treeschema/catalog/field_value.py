@@ -1,6 +1,7 @@
 from typing import Any, Dict, List
 
 from . import TreeSchemaSerializer
+from .. import catalog_cache
 
 
 class FieldValue(TreeSchemaSerializer):
@@ -103,4 +104,5 @@ class FieldValue(TreeSchemaSerializer):
                 field_value_updates=update_dict
             )
             self._update_self(resp.get('field_value'))
+            catalog_cache.invalidate(catalog_cache.FIELD_VALUES, self.field_id)
         return self
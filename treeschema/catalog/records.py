@@ -0,0 +1,119 @@
+import sys
+from typing import Any, Dict
+
+from .data_field import DataField
+from .data_schema import DataSchema
+from .field_value import FieldValue
+from .transformation_link import TransformationLink
+
+
+_USER_ROLES = ('steward', 'tech_poc')
+
+
+def _user_id(user: Any) -> [int, None]:
+    """Users are stored by ID, whether they are given as an ID, a
+    dictionary or a `TreeSchemaUser`
+    """
+    if user is None or isinstance(user, int):
+        return user
+    if isinstance(user, dict):
+        return user.get('user_id')
+    return getattr(user, 'id', None)
+
+
+class _Record(object):
+    """A compact, read-only copy of an entity. Records hold the values of
+    the entity's `__FIELDS__` and the IDs of its parents in slots, users
+    as their IDs and repeated strings, such as types and names, interned
+    so that every record shares one copy. Records have no client and do
+    not retrieve anything from Tree Schema.
+    """
+    __slots__ = ()
+    __SOURCE__ = None
+    __PARENTS__ = ()
+    __INTERNED__ = ()
+
+    def __init__(self, obj: Dict[str, Any], **parents) -> None:
+        """
+        :param obj: a complete dictionary of values, as returned by the
+            Tree Schema API or held in the `_obj` of an entity
+        :param parents: the IDs of the parents, e.g. `data_schema_id`
+        """
+        setter = object.__setattr__
+        interned = self.__INTERNED__
+        for f in self.__SOURCE__.__FIELDS__:
+            value = obj.get(f)
+            if f in _USER_ROLES:
+                value = _user_id(value)
+            elif f in interned and isinstance(value, str):
+                value = sys.intern(value)
+            setter(self, f, value)
+        for p in self.__PARENTS__:
+            setter(self, p, parents.get(p, obj.get(p)))
+
+    @classmethod
+    def from_entity(cls, entity) -> '_Record':
+        """Copies a fully serialized entity to a record, lazy handles are
+        retrieved first
+        """
+        obj = entity.hydrate()._obj
+        return cls(obj, **{p: getattr(entity, p, None) for p in cls.__PARENTS__})
+
+    @property
+    def id(self) -> int:
+        return getattr(self, self.__SOURCE__.__ID_FIELD_NAME__)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError('%s is read-only' % self.__class__.__name__)
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError('%s is read-only' % self.__class__.__name__)
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and self.as_dict() == other.as_dict()
+
+    def __hash__(self) -> int:
+        return hash((self.__class__, self.id))
+
+    def as_dict(self) -> Dict[str, Any]:
+        """The values of the record, with users as their IDs"""
+        return {f: getattr(self, f) for f in self.__slots__}
+
+    def __repr__(self):
+        values = ",\n    ".join('%s: %s' % (f, getattr(self, f)) for f in self.__slots__)
+        return '%s(\n    %s\n)' % (self.__class__.__name__, values)
+
+
+class SchemaRecord(_Record):
+    """A read-only data schema, see `DataSchema`"""
+    __SOURCE__ = DataSchema
+    __PARENTS__ = ('data_store_id',)
+    __INTERNED__ = ('type', 'schema_loc')
+    __slots__ = tuple(DataSchema.__FIELDS__) + __PARENTS__
+
+
+class FieldRecord(_Record):
+    """A read-only data field, see `DataField`"""
+    __SOURCE__ = DataField
+    __PARENTS__ = ('data_store_id', 'data_schema_id')
+    __INTERNED__ = ('data_format', 'data_type', 'name', 'parent_path', 'type')
+    __slots__ = tuple(DataField.__FIELDS__) + __PARENTS__
+
+
+class FieldValueRecord(_Record):
+    """A read-only sample value of a field, see `FieldValue`"""
+    __SOURCE__ = FieldValue
+    __PARENTS__ = ('data_store_id', 'data_schema_id', 'field_id')
+    __INTERNED__ = ()
+    __slots__ = tuple(FieldValue.__FIELDS__) + __PARENTS__
+
+
+class LinkRecord(_Record):
+    """A read-only transformation link, see `TransformationLink`"""
+    __SOURCE__ = TransformationLink
+    __PARENTS__ = ('transformation_id',)
+    __INTERNED__ = (
+        'source_data_store_name', 'source_schema_name', 'source_field_name',
+        'target_data_store_name', 'target_schema_name', 'target_field_name'
+    )
+    __slots__ = tuple(TransformationLink.__FIELDS__) + __PARENTS__
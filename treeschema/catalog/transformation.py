@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterator, List, Tuple
 
 from . import (
     DataField, 
@@ -8,6 +8,8 @@ from . import (
     LineageImpact
 )
 from .tags import get_tags_added
+from .user import resolve_user
+from .. import catalog_cache, entity_map, path_index, search_index
 from ..exceptions import DataAssetDoesNotExist, InvalidLinksException
 
 
@@ -20,8 +22,8 @@ class Transformation(TreeSchemaSerializer):
         'description_markup': str,
         'description_raw': str,
         'name': str,
-        'steward': lambda x: TreeSchemaUser(x),
-        'tech_poc': lambda x: TreeSchemaUser(x),
+        'steward': resolve_user,
+        'tech_poc': resolve_user,
         'transformation_id': int,
         'type': str,
         'updated_ts': str
@@ -41,7 +43,7 @@ class Transformation(TreeSchemaSerializer):
         fully serialize a data store
         """
         self.tags = []
-        self._links_by_id = {}
+        self._links_by_id = entity_map.EntityMap(entity_map.LINKS, self._evict_link)
         self._links_retrieved = False
         super(Transformation, self).__init__(transformation_inputs)
 
@@ -61,9 +63,15 @@ class Transformation(TreeSchemaSerializer):
         """Removes a link from the internal mappings"""
         self._links_by_id.pop(link_id, None)
 
+    def _evict_link(self, link: TransformationLink, expired: bool) -> None:
+        """Removes a link that was evicted from the internal mappings"""
+        self._remove_link(link.id)
+        if expired:
+            self._links_retrieved = False
+
     def _reset_links(self) -> None:
         """Sets the internal mappings"""
-        self._links_by_id = {}
+        self._links_by_id = entity_map.EntityMap(entity_map.LINKS, self._evict_link)
     
     def _check_retrieve_links(self, force_refresh=False):
         if not self._links_retrieved or force_refresh: 
@@ -75,7 +83,8 @@ class Transformation(TreeSchemaSerializer):
         will not have all of the links for a given transformation until 
         `get_links()` is called to fetch the existing links.
         """
-        self._check_retrieve_links()
+        if not entity_map.is_complete(self._links_retrieved, self._links_by_id):
+            return self.get_links()
         return self._links_by_id
 
     def add_tags(self, tags: List[str]) -> Dict:
@@ -97,6 +106,7 @@ class Transformation(TreeSchemaSerializer):
             tag_res = self.client.add_tag_to_transformation(self.id, tags_to_add)
             added_tags = get_tags_added(tag_res)
             self.tags.extend(added_tags)
+            search_index.index_entity(self, self.obj)
             resp = tag_res
         return resp
         
@@ -121,19 +131,45 @@ class Transformation(TreeSchemaSerializer):
         :returns: a list of `TransformationLink` objects that belong to 
             this transformation
         """
-        if refresh or not self._links_retrieved:
+        if refresh or not entity_map.is_complete(self._links_retrieved, self._links_by_id):
             if refresh:
                 self._reset_links()
-            link_results = self.client.get_all_transformation_links(self.id)
+            link_results = catalog_cache.cached_listing(
+                catalog_cache.LINKS,
+                self.id,
+                lambda: self.client.get_all_transformation_links(self.id),
+                refresh=refresh
+            )
             self._links_retrieved = True
+            self._links_by_id.evicted = False
+            found = {}
             for link in link_results:
                 found_link = TransformationLink(
                     link, 
                     transformation_id=self.id
                 )
                 self._add_link(found_link)
-            
-        return self.links
+                found[found_link.id] = found_link
+            if not entity_map.is_complete(self._links_retrieved, self._links_by_id):
+                # Links were evicted, the listing does not fit in memory
+                return found
+
+        return self._links_by_id
+
+    def iter_links(self) -> Iterator[TransformationLink]:
+        """Yields each link in the transformation. Links are streamed from 
+        Tree Schema one page at a time and are not added to the local cache, 
+        which keeps memory use to roughly one page. If the links have 
+        already been retrieved the cached links are yielded instead.
+        """
+        if entity_map.is_complete(self._links_retrieved, self._links_by_id):
+            yield from list(self._links_by_id.values())
+            return
+        for link in self.client.iter_all_transformation_links(self.id):
+            yield TransformationLink(
+                link, 
+                transformation_id=self.id
+            )
 
     def _get_single_link(self, source, target):
         """Creates a single transformation link structure"""
@@ -157,6 +193,27 @@ class Transformation(TreeSchemaSerializer):
         return False
         
 
+    def _is_transform_path_obj(self, obj):
+        if (isinstance(obj, tuple) or isinstance(obj, list)) and len(obj) == 2:
+            if all([isinstance(x, str) or (isinstance(x, tuple) and len(x) == 3) for x in obj]):
+                return True
+        return False
+
+    def _get_path_links(self, path_links):
+        """Resolves the source and target paths of each link through the
+        path index, all of the paths are resolved together
+        """
+        paths = [p for lnk in path_links for p in lnk]
+        resolved = path_index.get_index().resolve_many(paths)
+        missing = [p for p, ids in zip(paths, resolved) if ids is None]
+        if missing:
+            raise DataAssetDoesNotExist('The fields requested do not exist: %s' % missing)
+        field_ids = iter(ids[2] for ids in resolved)
+        return [
+            self._get_single_link(source, target) 
+            for source, target in zip(field_ids, field_ids)
+        ]
+
     def _get_link_structure(self, links):
         """Validates and formats the links from the input"""
         _links = None
@@ -166,6 +223,8 @@ class Transformation(TreeSchemaSerializer):
             source = self._scalar_or_entity_id(links[0])
             target = self._scalar_or_entity_id(links[1])
             _links = [self._get_single_link(source, target)]
+        elif self._is_transform_path_obj(links):
+            _links = self._get_path_links([links])
         elif isinstance(links, list) and len(links) > 0:
             if all([self._is_transform_link_obj(l) for l in links]):
                 _links = links
@@ -176,6 +235,8 @@ class Transformation(TreeSchemaSerializer):
                         self._scalar_or_entity_id(lnk[1])
                     ) for lnk in links
                 ]
+            elif all([self._is_transform_path_obj(l) for l in links]):
+                _links = self._get_path_links(links)
         if _links is None:
             _msg = """To create new links the input must be in one of the following:
 
@@ -190,6 +251,10 @@ class Transformation(TreeSchemaSerializer):
 
             - A list of Tuples of Data Fields, position 0 = source & position 1 = target
                 [(DataField, DataField), (DataField, DataField)]
+
+            - A single Tuple or a list of Tuples of field paths, as strings or as
+              tuples of the data store, schema and field names
+                ('Kafka.orders.order_id', ('Postgres', 'public.orders', 'id'))
             """
             raise InvalidLinksException(_msg)
         return _links
@@ -214,6 +279,7 @@ class Transformation(TreeSchemaSerializer):
             links=link_data,
             set_state=set_state
         )
+        catalog_cache.invalidate(catalog_cache.LINKS, self.id)
         self._links_retrieved = True
         link_results = link_results_raw.get('updated_links')
         for link in link_results:
@@ -249,6 +315,14 @@ class Transformation(TreeSchemaSerializer):
         >>>     (src_schema_1.field('field_1'), tgt_schema_1.field('target_field'))
         >>> ]
         >>> t.create_links(transform_links) 
+        
+        Fields can also be given by their paths, all of the paths are resolved
+        together through the catalog's path index
+
+        >>> t.create_links([
+        >>>     ('my 1st data store.my.schema1.field_1', 'another data store.schema.num2.target_field'),
+        >>>     (('my 1st data store', 'my.schema1', 'field_2'), ('another data store', 'schema.num2', 'id'))
+        >>> ])
         """
         return self._create_or_set_links_state(links, False)
 
@@ -320,7 +394,12 @@ class Transformation(TreeSchemaSerializer):
             link = self._links_by_id[link_inputs]
         
         if link is None:
-            link = TransformationLink(link_inputs, transformation_id=self.id)
+            try:
+                link = TransformationLink(link_inputs, transformation_id=self.id)
+            except DataAssetDoesNotExist:
+                if raise_if_not_exist:
+                    raise
+                return None
             self._add_link(link)
 
         if raise_if_not_exist and not link:
@@ -355,6 +434,7 @@ class Transformation(TreeSchemaSerializer):
         if deleted:
             for tlid in _scalar_links:
                 self._remove_link(tlid)
+            catalog_cache.invalidate(catalog_cache.LINKS, self.id)
         return deleted
 
     def check_breaking_change(
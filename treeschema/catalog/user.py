@@ -1,6 +1,10 @@
-from typing import Any, Dict, List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List
 
 from . import TreeSchemaSerializer
+from .base_serializer import _identity_lock, _identity_map
+from ..api import APIClient
 
 
 class TreeSchemaUser(TreeSchemaSerializer):
@@ -27,10 +31,9 @@ class TreeSchemaUser(TreeSchemaSerializer):
         fully serialize a data store
         """
         super(TreeSchemaUser, self).__init__(inputs=user_inputs)
-        self.obj
 
     def __str__(self):
-        name = self._obj.get('name')
+        name = getattr(self, '_obj', {}).get('name')
         if name:
             _str = f'{self.__class__.__name__}({name})'
         else:
@@ -53,3 +56,102 @@ class TreeSchemaUser(TreeSchemaSerializer):
                 self._is_validated = True
                 self.id = user['user_id']
         return user
+
+
+# Users that are being requested by ID, concurrent lookups of the same
+# user wait for the first request while other users are requested freely
+_fetch_locks = {}
+_users_lock = threading.Lock()
+
+# Missing users are requested individually, at most this many at a time,
+# unless more than PREFETCH_LIST_THRESHOLD are missing and all users in
+# the organization are listed instead
+PREFETCH_MAX_WORKERS = 8
+PREFETCH_LIST_THRESHOLD = 50
+
+
+def shared_user(user_id: int) -> [TreeSchemaUser, None]:
+    """The `TreeSchemaUser` in memory for a user ID, if any"""
+    with _identity_lock:
+        return _identity_map.get((TreeSchemaUser, user_id))
+
+
+def shared_users() -> Dict[int, TreeSchemaUser]:
+    """Every `TreeSchemaUser` in memory, keyed on the user ID"""
+    with _identity_lock:
+        return {
+            user_id: user for (cls, user_id), user in list(_identity_map.items())
+            if cls is TreeSchemaUser
+        }
+
+
+def resolve_user(user_input: [int, Dict, TreeSchemaUser]) -> TreeSchemaUser:
+    """Returns the single shared `TreeSchemaUser` for a user. Users are 
+    only requested from Tree Schema when their ID is seen without the 
+    rest of their details and they are not in memory, a complete user 
+    dictionary updates the shared user in place.
+
+    :param user_input: a user ID, a dictionary of user values or a 
+        `TreeSchemaUser`
+    :returns: the shared `TreeSchemaUser`
+    """
+    if isinstance(user_input, TreeSchemaUser):
+        return user_input
+
+    if isinstance(user_input, dict):
+        user = shared_user(user_input.get('user_id'))
+        if user is not None and user_input == user.__dict__.get('_obj'):
+            return user
+        return TreeSchemaUser(user_input)
+
+    user = shared_user(user_input)
+    if user is not None:
+        return user
+    with _users_lock:
+        lock = _fetch_locks.setdefault(user_input, threading.Lock())
+    try:
+        with lock:
+            user = shared_user(user_input)
+            if user is None:
+                user = TreeSchemaUser(user_input)
+    finally:
+        with _users_lock:
+            if _fetch_locks.get(user_input) is lock:
+                del _fetch_locks[user_input]
+    return user
+
+
+def referenced_user_ids(entities: Iterable[Dict]) -> List[int]:
+    """Returns the IDs of stewards and technical points of contact that
+    are referenced only by ID within a list of entity dictionaries
+    """
+    user_ids = set()
+    for entity in entities:
+        for role in ('steward', 'tech_poc'):
+            user_id = entity.get(role)
+            if isinstance(user_id, int):
+                user_ids.add(user_id)
+    return sorted(user_ids)
+
+
+def prefetch_users(user_ids: Iterable[int]) -> List[TreeSchemaUser]:
+    """Loads the users that are not in memory. Missing users are 
+    requested individually and concurrently, only when more than 
+    `PREFETCH_LIST_THRESHOLD` are missing are all users in the 
+    organization listed at once instead.
+
+    Users are only held in memory while something references them, the
+    returned users should be kept until the entities that reference 
+    them are built.
+
+    :returns: the users that were loaded
+
+    >>> users = prefetch_users(referenced_user_ids(field_results))
+    """
+    missing = [i for i in user_ids if shared_user(i) is None]
+    if len(missing) > PREFETCH_LIST_THRESHOLD:
+        return [resolve_user(user) for user in APIClient().get_all_users()]
+    if len(missing) <= 1:
+        return [resolve_user(i) for i in missing]
+    with ThreadPoolExecutor(max_workers=min(len(missing), PREFETCH_MAX_WORKERS)) as executor:
+        return list(executor.map(resolve_user, missing))
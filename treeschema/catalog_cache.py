@@ -0,0 +1,167 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, List
+
+from .api import APIClient
+from .auth import TreeSchemaAuth
+
+
+# The collections that can be cached, each is keyed on the ID of the
+# entity that owns it (0 for the top level collections)
+DATA_STORES = 'data_stores'
+SCHEMAS = 'schemas'
+FIELDS = 'fields'
+FIELD_VALUES = 'field_values'
+TRANSFORMATIONS = 'transformations'
+LINKS = 'links'
+USERS = 'users'
+
+DEFAULT_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'treeschema', 'catalog.sqlite')
+DEFAULT_MAX_AGE = 24 * 60 * 60
+
+
+class CatalogCache(object):
+    """Persists the raw results of catalog listings in a local SQLite
+    database so that a new process can warm start from disk instead of
+    downloading the catalog again. Each listing, e.g. the schemas in a
+    data store, is stored with the time it was fetched and is treated as
+    missing once it is older than `max_age`.
+
+    Listings are scoped to the credentials in use, so users of different
+    organizations can share a cache file.
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH, max_age: float = DEFAULT_MAX_AGE) -> None:
+        """
+        :param path: the SQLite database file, it is created if needed
+        :param max_age: the number of seconds a listing stays fresh
+        """
+        self.path = path
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS listings (
+                    scope TEXT NOT NULL,
+                    collection TEXT NOT NULL,
+                    parent_id INTEGER NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    body BLOB NOT NULL,
+                    PRIMARY KEY (scope, collection, parent_id)
+                )"""
+            )
+
+    @staticmethod
+    def _scope() -> str:
+        """A digest of the credentials in use, the secret itself is never
+        written to disk
+        """
+        secret = TreeSchemaAuth().encoded_secret.encode('utf-8')
+        return hashlib.sha256(secret).hexdigest()[:32]
+
+    def get(self, collection: str, parent_id: int = None) -> [List[Dict], None]:
+        """Returns a listing if it is cached and fresh, otherwise None"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT fetched_at, body FROM listings '
+                'WHERE scope = ? AND collection = ? AND parent_id = ?',
+                (self._scope(), collection, parent_id or 0)
+            ).fetchone()
+            if row is None or time.time() - row[0] > self.max_age:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return APIClient.codec.loads(row[1])
+
+    def put(self, collection: str, parent_id: int, entities: List[Dict]) -> None:
+        """Stores a listing, replacing any previous version"""
+        body = APIClient.codec.dumps(entities)
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO listings VALUES (?, ?, ?, ?, ?)',
+                (self._scope(), collection, parent_id or 0, time.time(), body)
+            )
+
+    def invalidate(self, collection: str, parent_id: int = None) -> None:
+        """Drops a listing, e.g. after one of its entities was created,
+        updated or deleted
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                'DELETE FROM listings WHERE scope = ? AND collection = ? AND parent_id = ?',
+                (self._scope(), collection, parent_id or 0)
+            )
+
+    def clear(self) -> None:
+        """Drops every listing for the current credentials"""
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM listings WHERE scope = ?', (self._scope(),))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_cache = None
+
+
+def configure(path: [str, None] = DEFAULT_PATH, max_age: float = DEFAULT_MAX_AGE) -> [CatalogCache, None]:
+    """Enables the persistent catalog cache for this process
+
+    :param path: the SQLite database file, None disables the cache
+    :param max_age: the number of seconds a listing stays fresh
+    :returns: the cache that is now in use, None if disabled
+    """
+    global _cache
+    if _cache is not None:
+        _cache.close()
+    _cache = CatalogCache(path, max_age) if path else None
+    return _cache
+
+
+def get_cache() -> [CatalogCache, None]:
+    return _cache
+
+
+def cached_listing(
+    collection: str,
+    parent_id: [int, None],
+    fetch: Callable[[], List[Dict]],
+    refresh: bool = False
+) -> List[Dict]:
+    """Returns a listing from the persistent cache when it is enabled and
+    fresh, otherwise calls `fetch` and stores the results.
+
+    :param collection: the collection being listed, e.g. `SCHEMAS`
+    :param parent_id: the ID of the entity that owns the collection
+    :param fetch: retrieves the listing from Tree Schema
+    :param refresh: skips the cached listing and fetches it again
+    """
+    cache = _cache
+    if cache is None:
+        return fetch()
+    if not refresh:
+        found = cache.get(collection, parent_id)
+        if found is not None:
+            return found
+    results = fetch()
+    cache.put(collection, parent_id, results)
+    return results
+
+
+def invalidate(collection: str, parent_id: int = None) -> None:
+    """Drops a cached listing if the persistent cache is enabled"""
+    cache = _cache
+    if cache is not None:
+        cache.invalidate(collection, parent_id)
@@ -0,0 +1,64 @@
+from typing import Any, Callable, Dict, Iterable, List
+
+from . import entity_map
+
+
+# Every entity carries the time it was last updated, e.g. '2020-09-23 18:16:16',
+# which sorts lexicographically in the same order as chronologically
+UPDATED_TS = 'updated_ts'
+
+
+def high_water_mark(
+    entities: Iterable[Dict[str, Any]],
+    current: [str, None] = None
+) -> [str, None]:
+    """Returns the latest `updated_ts` of the serialized entities, or
+    `current` if it is later
+
+    :param entities: the entities as returned by the API
+    :param current: the previous high-water mark
+    """
+    mark = current
+    for entity in entities:
+        updated_ts = entity.get(UPDATED_TS)
+        if updated_ts and (mark is None or updated_ts > mark):
+            mark = updated_ts
+    return mark
+
+
+def can_sync(level: str, retrieved: bool, mark: [str, None]) -> bool:
+    """Whether a collection can be refreshed incrementally. The full
+    listing must have been retrieved before and the entities at `level`
+    must not be bounded, otherwise the number of entities held locally
+    cannot be compared to the number reported by Tree Schema.
+    """
+    return retrieved and mark is not None and not entity_map.is_bounded(level)
+
+
+def sync_listing(
+    entities_by_id: Dict[int, Any],
+    mark: str,
+    fetch_changed: Callable[[str], List[Dict]],
+    fetch_total: Callable[[], int],
+    merge: Callable[[List[Dict]], None]
+) -> [str, None]:
+    """Refreshes a collection with only the entities that changed since
+    `mark`. Deleted entities are not returned by Tree Schema so they are
+    detected by comparing the number of entities held after merging the
+    changes to the total reported by Tree Schema.
+
+    :param entities_by_id: the entities held locally
+    :param mark: the high-water mark of the last refresh
+    :param fetch_changed: retrieves the entities updated since a timestamp
+    :param fetch_total: retrieves the number of entities in the collection
+    :param merge: adds or updates the changed entities locally
+    :returns: the new high-water mark, or None when entities were deleted
+        and the collection must be refreshed in full
+    """
+    changed = fetch_changed(mark)
+    if changed:
+        merge(changed)
+    total = fetch_total()
+    if total is None or total != len(entities_by_id):
+        return None
+    return high_water_mark(changed, mark)
@@ -0,0 +1,357 @@
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+
+# The levels of the entity hierarchy that can be bounded
+DATA_STORES = 'data_stores'
+SCHEMAS = 'schemas'
+FIELDS = 'fields'
+FIELD_VALUES = 'field_values'
+TRANSFORMATIONS = 'transformations'
+LINKS = 'links'
+USERS = 'users'
+LEVELS = (DATA_STORES, SCHEMAS, FIELDS, FIELD_VALUES, TRANSFORMATIONS, LINKS, USERS)
+
+
+class EvictionPolicy(object):
+    """Limits for the entity maps at a single level of the hierarchy.
+    Size limits apply to each map, e.g. to the fields of each schema.
+    Because evicting an entity also releases its children, the limits
+    at the upper levels bound the total number of entities held.
+    """
+
+    def __init__(
+        self,
+        ttl: float = None,
+        max_entries: int = None,
+        max_bytes: int = None
+    ) -> None:
+        """
+        :param ttl: the number of seconds an entity is kept after it was
+            added, None keeps entities until they are evicted
+        :param max_entries: the number of entities kept in each map, the
+            least recently used entities are evicted first
+        :param max_bytes: the approximate memory, in bytes, that the
+            entities in each map may use
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    @property
+    def bounded(self) -> bool:
+        return self.max_entries is not None or self.max_bytes is not None
+
+
+class CacheStats(object):
+    """Counters for the entity maps at a single level"""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.resident_entries = 0
+        self.resident_bytes = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'resident_entries': self.resident_entries,
+            'resident_bytes': self.resident_bytes
+        }
+
+
+class _Level(object):
+    def __init__(self) -> None:
+        self.policy = None
+        self.stats = CacheStats()
+        self.lock = threading.Lock()
+
+
+_levels = {level: _Level() for level in LEVELS}
+
+
+def configure_eviction(
+    level: str,
+    ttl: float = None,
+    max_entries: int = None,
+    max_bytes: int = None
+) -> [EvictionPolicy, None]:
+    """Sets the eviction policy for one level of the entity hierarchy.
+    Calling this without any limits removes the policy.
+
+    :param level: one of `LEVELS`, e.g. `entity_map.FIELDS`
+    :returns: the policy that is now in use, None if unbounded
+    """
+    if level not in _levels:
+        raise ValueError('Unknown entity level: %s' % level)
+    policy = None
+    if ttl is not None or max_entries is not None or max_bytes is not None:
+        policy = EvictionPolicy(ttl, max_entries, max_bytes)
+    _levels[level].policy = policy
+    return policy
+
+
+def is_bounded(level: str) -> bool:
+    """Whether the entity maps at `level` may evict entities for size"""
+    policy = _levels[level].policy
+    return policy is not None and policy.bounded
+
+
+def is_complete(retrieved: bool, entities: Dict) -> bool:
+    """Whether a full listing is held in memory, i.e. it was retrieved
+    and none of its entities have been evicted since. Full listings are
+    fetched again when they are incomplete, single entities that were
+    evicted are fetched individually.
+
+    :param retrieved: whether the listing was retrieved, e.g. 
+        `data_schema._fields_retrieved`
+    :param entities: the primary entity map of the listing
+    """
+    return retrieved and not getattr(entities, 'evicted', False)
+
+
+def cache_stats() -> Dict[str, Dict[str, int]]:
+    """Returns the counters for every level. Resident bytes are only
+    tracked for levels that have a `max_bytes` limit.
+    """
+    return {level: _levels[level].stats.as_dict() for level in LEVELS}
+
+
+def reset_stats() -> None:
+    """Resets the hit, miss and eviction counters"""
+    for level in _levels.values():
+        with level.lock:
+            level.stats.hits = 0
+            level.stats.misses = 0
+            level.stats.evictions = 0
+            level.stats.expirations = 0
+
+
+def estimate_size(entity: Any) -> int:
+    """Approximates the memory held by an entity from its serialized
+    attributes, nested entities such as users are not counted
+    """
+    obj = getattr(entity, '_obj', None)
+    size = sys.getsizeof(entity)
+    if isinstance(obj, dict):
+        size += sys.getsizeof(obj)
+        for v in obj.values():
+            if isinstance(v, (str, bytes, int, float, dict, list)):
+                size += sys.getsizeof(v)
+    return size
+
+
+class EntityMap(OrderedDict):
+    """A dictionary of entities that applies the eviction policy of its
+    level. Without a policy it behaves like a regular dictionary that
+    counts lookups made with `in`.
+
+    Each entity is indexed by a primary map (by ID) and optionally a
+    secondary map (e.g. by name). Only primary maps count towards the
+    resident size and enforce size limits. When an entity is evicted
+    `on_evict` is called with the entity and whether it expired, so that
+    the owner can remove it from every index. Owners mark their listing
+    as not retrieved when an entity expires so the next access lists it
+    again. Any eviction sets `evicted`, see `is_complete()`, so that
+    full listings are fetched again while entities evicted for size are
+    fetched individually when they are requested by ID or name. Expired
+    entities are never returned, whether they are looked up or iterated.
+    """
+
+    def __init__(
+        self,
+        level: str,
+        on_evict: Callable[[Any, bool], None] = None,
+        primary: bool = True
+    ) -> None:
+        """
+        :param level: one of `LEVELS`
+        :param on_evict: a bound method called with each evicted entity 
+            and whether it expired, only a weak reference to its owner 
+            is kept
+        :param primary: whether this map counts towards the level's size
+        """
+        super(EntityMap, self).__init__()
+        self._level = _levels[level]
+        self._primary = primary
+        self._on_evict = weakref.WeakMethod(on_evict) if on_evict is not None else None
+        self._added_at = None
+        self._sizes = None
+        self._bytes = 0
+        self.evicted = False
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        level = self._level
+        is_new = not OrderedDict.__contains__(self, key)
+        OrderedDict.__setitem__(self, key, value)
+        if self._primary and is_new:
+            with level.lock:
+                level.stats.resident_entries += 1
+
+        policy = level.policy
+        if policy is None:
+            return
+        if policy.ttl is not None:
+            if self._added_at is None:
+                self._added_at = OrderedDict()
+            self._added_at.pop(key, None)
+            self._added_at[key] = time.monotonic()
+        if policy.bounded:
+            self.move_to_end(key)
+        if self._primary and policy.max_bytes is not None:
+            if self._sizes is None:
+                self._sizes = {}
+            size = estimate_size(value)
+            delta = size - self._sizes.get(key, 0)
+            self._sizes[key] = size
+            self._bytes += delta
+            with level.lock:
+                level.stats.resident_bytes += delta
+        self._enforce(policy)
+
+    def __contains__(self, key: Hashable) -> bool:
+        level = self._level
+        found = OrderedDict.__contains__(self, key)
+        policy = level.policy
+        if found and policy is not None:
+            if policy.ttl is not None and self._is_expired(key, policy.ttl):
+                self._evict(key, expired=True)
+                found = False
+            elif policy.bounded:
+                self.move_to_end(key)
+        with level.lock:
+            if found:
+                level.stats.hits += 1
+            else:
+                level.stats.misses += 1
+        return found
+
+    def __getitem__(self, key: Hashable) -> Any:
+        policy = self._level.policy
+        if policy is not None and OrderedDict.__contains__(self, key):
+            if policy.ttl is not None and self._is_expired(key, policy.ttl):
+                self._evict(key, expired=True)
+                raise KeyError(key)
+            if policy.bounded:
+                self.move_to_end(key)
+        return OrderedDict.__getitem__(self, key)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def values(self):
+        self._expire()
+        return OrderedDict.values(self)
+
+    def items(self):
+        self._expire()
+        return OrderedDict.items(self)
+
+    def __delitem__(self, key: Hashable) -> None:
+        OrderedDict.__delitem__(self, key)
+        self._forget(key)
+
+    def pop(self, key: Hashable, *default) -> Any:
+        if not OrderedDict.__contains__(self, key):
+            if default:
+                return default[0]
+            raise KeyError(key)
+        value = OrderedDict.__getitem__(self, key)
+        del self[key]
+        return value
+
+    def popitem(self, last: bool = True):
+        if not self:
+            raise KeyError('dictionary is empty')
+        key = next(reversed(self)) if last else next(iter(self))
+        return key, self.pop(key)
+
+    def clear(self) -> None:
+        self._release()
+        OrderedDict.clear(self)
+        self._added_at = None
+        self._sizes = None
+        self._bytes = 0
+        self.evicted = False
+
+    def __del__(self) -> None:
+        try:
+            self._release()
+        except Exception:
+            pass
+
+    def __reduce__(self):
+        return (dict, (dict(self.items()),))
+
+    def _release(self) -> None:
+        """Removes this map's entities from the resident counters"""
+        if self._primary:
+            with self._level.lock:
+                self._level.stats.resident_entries -= len(self)
+                self._level.stats.resident_bytes -= self._bytes
+
+    def _forget(self, key: Hashable) -> None:
+        """Updates the bookkeeping after a key was removed"""
+        if self._added_at is not None:
+            self._added_at.pop(key, None)
+        delta = self._sizes.pop(key, 0) if self._sizes is not None else 0
+        self._bytes -= delta
+        if self._primary:
+            with self._level.lock:
+                self._level.stats.resident_entries -= 1
+                self._level.stats.resident_bytes -= delta
+
+    def _is_expired(self, key: Hashable, ttl: float) -> bool:
+        added_at = self._added_at.get(key) if self._added_at is not None else None
+        return added_at is not None and time.monotonic() - added_at > ttl
+
+    def _evict(self, key: Hashable, expired: bool = False) -> None:
+        value = OrderedDict.__getitem__(self, key)
+        on_evict = self._on_evict() if self._on_evict is not None else None
+        if on_evict is not None:
+            on_evict(value, expired)
+        self.pop(key, None)
+        self.evicted = True
+        with self._level.lock:
+            if expired:
+                self._level.stats.expirations += 1
+            else:
+                self._level.stats.evictions += 1
+
+    def _expire(self) -> None:
+        """Evicts the entities that are older than the TTL"""
+        policy = self._level.policy
+        if policy is None or policy.ttl is None or not self._added_at:
+            return
+        now = time.monotonic()
+        while self._added_at:
+            key, added_at = next(iter(self._added_at.items()))
+            if now - added_at <= policy.ttl:
+                break
+            self._evict(key, expired=True)
+
+    def _enforce(self, policy: EvictionPolicy) -> None:
+        """Evicts expired entities and then the least recently used
+        entities until the map is within its limits
+        """
+        self._expire()
+        if not self._primary:
+            return
+        if policy.max_entries is not None:
+            while len(self) > policy.max_entries:
+                self._evict(next(iter(self)))
+        if policy.max_bytes is not None:
+            while self._bytes > policy.max_bytes and len(self) > 1:
+                self._evict(next(iter(self)))
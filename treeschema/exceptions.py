@@ -16,6 +16,15 @@ class InvalidLinksException(Exception):
         super().__init__(message)
 
 class TreeSchemaApiError(Exception):
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
+class CircuitBreakerOpen(TreeSchemaApiError):
+    def __init__(self, message):
+        super().__init__(message)
+
+class InvalidSnapshot(Exception):
     def __init__(self, message):
         super().__init__(message)
 
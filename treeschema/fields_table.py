@@ -0,0 +1,178 @@
+import sys
+from array import array
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+# Users and missing IDs are stored as -1 in the integer columns
+MISSING_ID = -1
+
+ID_COLUMNS = ('field_id', 'data_schema_id', 'data_store_id', 'steward_id', 'tech_poc_id')
+BOOL_COLUMNS = ('nullable', 'has_description')
+STR_COLUMNS = (
+    'name', 'full_path_name', 'parent_path', 'type', 'data_type', 'data_format'
+)
+TIMESTAMP_COLUMNS = ('created_ts', 'updated_ts')
+COLUMNS = ID_COLUMNS + BOOL_COLUMNS + STR_COLUMNS + TIMESTAMP_COLUMNS
+
+# Columns with few distinct values share one copy of each string
+_INTERNED = ('parent_path', 'type', 'data_type', 'data_format')
+
+
+def _id_or_missing(value: Any) -> int:
+    if value is None:
+        return MISSING_ID
+    if isinstance(value, int):
+        return value
+    if isinstance(value, dict):
+        return value.get('user_id', MISSING_ID)
+    return getattr(value, 'id', None) or MISSING_ID
+
+
+class FieldsTable(object):
+    """The fields of one or more schemas stored by column. Integer and
+    boolean columns are compact arrays and strings are kept in lists,
+    `to_numpy()` and `to_arrow()` convert the columns for vectorized
+    filtering and grouping when NumPy or PyArrow are installed.
+
+    >>> table = ts.data_store('Kafka').fields_table()
+    >>> cols = table.to_numpy()
+    >>> mask = cols['nullable'] & (cols['data_type'] == 'string') & ~cols['has_description']
+    >>> cols['full_path_name'][mask]
+    """
+
+    def __init__(self) -> None:
+        self.columns = {}
+        for c in ID_COLUMNS:
+            self.columns[c] = array('q')
+        for c in BOOL_COLUMNS:
+            self.columns[c] = array('b')
+        for c in STR_COLUMNS + TIMESTAMP_COLUMNS:
+            self.columns[c] = []
+
+    def __len__(self) -> int:
+        return len(self.columns['field_id'])
+
+    def __getitem__(self, column: str) -> Sequence:
+        return self.columns[column]
+
+    def extend(
+        self,
+        fields: Iterable[Dict[str, Any]],
+        data_store_id: int,
+        data_schema_id: int
+    ) -> None:
+        """Appends fields, e.g. a page of fields from the API, to the table
+
+        :param fields: the fields as dictionaries
+        :param data_store_id: the data store the fields belong to
+        :param data_schema_id: the schema the fields belong to
+        """
+        cols = self.columns
+        for f in fields:
+            cols['field_id'].append(f['field_id'])
+            cols['data_schema_id'].append(data_schema_id)
+            cols['data_store_id'].append(data_store_id)
+            cols['steward_id'].append(_id_or_missing(f.get('steward')))
+            cols['tech_poc_id'].append(_id_or_missing(f.get('tech_poc')))
+            cols['nullable'].append(bool(f.get('nullable')))
+            cols['has_description'].append(bool(f.get('description_raw')))
+            for c in STR_COLUMNS + TIMESTAMP_COLUMNS:
+                v = f.get(c)
+                if c in _INTERNED and isinstance(v, str):
+                    v = sys.intern(v)
+                cols[c].append(v)
+
+    @classmethod
+    def concat(cls, tables: Iterable['FieldsTable']) -> 'FieldsTable':
+        """Combines tables in order into a new table"""
+        result = cls()
+        for table in tables:
+            for c in COLUMNS:
+                result.columns[c].extend(table.columns[c])
+        return result
+
+    def take(self, rows: Iterable[int]) -> 'FieldsTable':
+        """Returns a new table with the given rows"""
+        result = FieldsTable()
+        rows = list(rows)
+        for c in COLUMNS:
+            col = self.columns[c]
+            result.columns[c].extend(col[i] for i in rows)
+        return result
+
+    def where(self, **conditions) -> 'FieldsTable':
+        """Returns the rows where every column equals the given value
+
+        >>> table.where(nullable=True, data_type='string', has_description=False)
+        """
+        cols = [(self.columns[c], v) for c, v in conditions.items()]
+        return self.take(
+            i for i in range(len(self))
+            if all(col[i] == v for col, v in cols)
+        )
+
+    def value_counts(self, column: str) -> Dict[Any, int]:
+        """Counts the rows for each value of a column"""
+        return dict(Counter(self.columns[column]))
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Returns a dictionary of NumPy arrays, one per column. Strings
+        are object arrays and timestamps are `datetime64[s]`.
+        """
+        if np is None:
+            raise ImportError('numpy must be installed to use FieldsTable.to_numpy()')
+        result = {}
+        for c in ID_COLUMNS:
+            result[c] = np.frombuffer(self.columns[c], dtype=np.int64).copy()
+        for c in BOOL_COLUMNS:
+            result[c] = np.frombuffer(self.columns[c], dtype=np.int8).astype(bool)
+        for c in STR_COLUMNS:
+            result[c] = np.array(self.columns[c], dtype=object)
+        for c in TIMESTAMP_COLUMNS:
+            result[c] = np.array(
+                [v.replace(' ', 'T') if v else 'NaT' for v in self.columns[c]],
+                dtype='datetime64[s]'
+            )
+        return result
+
+    def to_arrow(self) -> Any:
+        """Returns a `pyarrow.Table` with one column per column"""
+        if pa is None:
+            raise ImportError('pyarrow must be installed to use FieldsTable.to_arrow()')
+        arrays = []
+        for c in ID_COLUMNS:
+            arrays.append(pa.array(self.columns[c], type=pa.int64()))
+        for c in BOOL_COLUMNS:
+            arrays.append(pa.array([bool(v) for v in self.columns[c]], type=pa.bool_()))
+        for c in STR_COLUMNS:
+            col = pa.array(self.columns[c], type=pa.string())
+            arrays.append(col.dictionary_encode() if c in _INTERNED else col)
+        for c in TIMESTAMP_COLUMNS:
+            arrays.append(pa.array(self.columns[c], type=pa.string()).cast(pa.timestamp('s')))
+        return pa.Table.from_arrays(arrays, names=list(COLUMNS))
+
+
+def build(schemas: List, max_workers: int = 1) -> FieldsTable:
+    """Builds one table for several schemas, the schemas are read
+    concurrently on at most `max_workers` threads
+
+    :param schemas: `DataSchema` objects
+    """
+    if max_workers > 1 and len(schemas) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(schemas))) as executor:
+            tables = list(executor.map(lambda s: s.fields_table(), schemas))
+    else:
+        tables = [s.fields_table() for s in schemas]
+    return FieldsTable.concat(tables)
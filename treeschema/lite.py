@@ -0,0 +1,108 @@
+import threading
+from typing import Dict, Tuple
+
+from . import catalog_cache
+from .api import APIClient
+from .catalog.records import FieldRecord, FieldValueRecord, LinkRecord, SchemaRecord
+
+
+class LiteCatalog(object):
+    """Read-only access to schemas, fields, field values and links as
+    compact records. A single client is shared by every listing and the
+    records hold no client, tags or child maps, which keeps the memory
+    used by large catalogs to a fraction of the full entities. Listings
+    are kept once they are retrieved and go through the persistent
+    catalog cache when it is enabled.
+
+    >>> lite = ts.lite()
+    >>> for field in lite.fields(data_store_id=1, data_schema_id=12):
+    >>>     print(field.full_path_name, field.data_type)
+    """
+
+    def __init__(self, client: APIClient = None) -> None:
+        self.client = client or APIClient()
+        self._lock = threading.Lock()
+        self._listings = {}
+
+    def _listing(self, collection: str, parent_id: int, fetch, build, refresh: bool) -> Tuple:
+        key = (collection, parent_id)
+        if not refresh:
+            with self._lock:
+                found = self._listings.get(key)
+            if found is not None:
+                return found
+        results = catalog_cache.cached_listing(collection, parent_id, fetch, refresh=refresh)
+        records = tuple(build(obj) for obj in results)
+        with self._lock:
+            self._listings[key] = records
+        return records
+
+    def schemas(self, data_store_id: int, refresh: bool = False) -> Tuple[SchemaRecord, ...]:
+        """Returns every schema in a data store"""
+        return self._listing(
+            catalog_cache.SCHEMAS,
+            data_store_id,
+            lambda: self.client.get_all_schemas_for_data_store(data_store_id),
+            lambda obj: SchemaRecord(obj, data_store_id=data_store_id),
+            refresh
+        )
+
+    def fields(
+        self,
+        data_store_id: int,
+        data_schema_id: int,
+        refresh: bool = False
+    ) -> Tuple[FieldRecord, ...]:
+        """Returns every field in a schema"""
+        return self._listing(
+            catalog_cache.FIELDS,
+            data_schema_id,
+            lambda: self.client.get_all_fields_for_schema(
+                data_store_id=data_store_id,
+                data_schema_id=data_schema_id
+            ),
+            lambda obj: FieldRecord(
+                obj,
+                data_store_id=data_store_id,
+                data_schema_id=data_schema_id
+            ),
+            refresh
+        )
+
+    def field_values(
+        self,
+        data_store_id: int,
+        data_schema_id: int,
+        field_id: int,
+        refresh: bool = False
+    ) -> Tuple[FieldValueRecord, ...]:
+        """Returns every sample value of a field"""
+        return self._listing(
+            catalog_cache.FIELD_VALUES,
+            field_id,
+            lambda: self.client.get_all_values_for_field(
+                data_store_id, data_schema_id, field_id
+            ),
+            lambda obj: FieldValueRecord(
+                obj,
+                data_store_id=data_store_id,
+                data_schema_id=data_schema_id,
+                field_id=field_id
+            ),
+            refresh
+        )
+
+    def links(self, transformation_id: int, refresh: bool = False) -> Tuple[LinkRecord, ...]:
+        """Returns every link of a transformation"""
+        return self._listing(
+            catalog_cache.LINKS,
+            transformation_id,
+            lambda: self.client.get_all_transformation_links(transformation_id),
+            lambda obj: LinkRecord(obj, transformation_id=transformation_id),
+            refresh
+        )
+
+    def clear(self) -> None:
+        """Releases every listing held"""
+        with self._lock:
+            self._listings.clear()
@@ -0,0 +1,184 @@
+import re
+import threading
+from bisect import bisect_left
+from collections import Counter
+from fnmatch import translate
+from typing import Any, Dict, Iterable, List, Tuple
+
+from . import entity_map
+
+
+SCHEMAS = entity_map.SCHEMAS
+FIELDS = entity_map.FIELDS
+
+DEFAULT_FUZZY_LIMIT = 10
+DEFAULT_MIN_SIMILARITY = 0.3
+# Fuzzy searches count the names that share the query's rarest trigrams,
+# reading up to about this many postings, and score the names that share
+# the most trigrams exactly
+MAX_FUZZY_POSTINGS = 50000
+FUZZY_CANDIDATES_PER_RESULT = 20
+
+# Incremented whenever schemas or fields are added to or removed from the
+# catalog in memory, indexes built for an older generation are rebuilt
+_generations = Counter()
+_generations_lock = threading.Lock()
+
+
+def touch(kind: str) -> None:
+    """Records that the schemas or fields in memory changed"""
+    with _generations_lock:
+        _generations[kind] += 1
+
+
+def generation(kind: str) -> int:
+    return _generations[kind]
+
+
+def _ngrams(name: str, n: int = 3) -> set:
+    padded = ' %s ' % name
+    if len(padded) <= n:
+        return {padded}
+    return {padded[i: i + n] for i in range(len(padded) - n + 1)}
+
+
+def _wildcards(pattern: str) -> List[Tuple[int, int]]:
+    """The start and end of each wildcard in a shell style pattern. Like
+    `fnmatch`, a `[` without a closing `]` is a literal character.
+    """
+    spans = []
+    i, n = 0, len(pattern)
+    while i < n:
+        if pattern[i] in '*?':
+            spans.append((i, i + 1))
+        elif pattern[i] == '[':
+            j = i + 1
+            if j < n and pattern[j] == '!':
+                j += 1
+            if j < n and pattern[j] == ']':
+                j += 1
+            j = pattern.find(']', j)
+            if j != -1:
+                spans.append((i, j + 1))
+                i = j
+        i += 1
+    return spans
+
+
+def _prefix_range(keys: List[str], prefix: str) -> Tuple[int, int]:
+    """The range of sorted keys that start with `prefix`"""
+    start = bisect_left(keys, prefix)
+    end = bisect_left(keys, prefix + '\U0010ffff') if prefix else len(keys)
+    return start, end
+
+
+class NameIndex(object):
+    """Searches many names by prefix, glob pattern or similarity. Names are
+    not case sensitive and several items may share a name.
+
+    Names are kept sorted, once forwards and once reversed, so that a
+    pattern with a literal prefix, e.g. `spoc.accounts*`, or a literal
+    suffix, e.g. `*.created_ts`, only tests the names in a range found by
+    binary search. The trigrams used for fuzzy matching are indexed on
+    the first fuzzy search.
+
+    >>> index = NameIndex((s.name, s) for s in schemas)
+    >>> index.prefix('spoc.acc')
+    >>> index.glob('spoc.accounts*')
+    >>> index.fuzzy('spoc.acounts')
+    """
+
+    def __init__(self, items: Iterable[Tuple[str, Any]]) -> None:
+        """
+        :param items: `(name, item)` pairs, e.g. the name of a schema
+            and the schema
+        """
+        pairs = sorted(((n.lower(), i) for n, i in items if n is not None), key=lambda p: p[0])
+        self._keys = [n for n, _ in pairs]
+        self._items = [i for _, i in pairs]
+        reversed_pairs = sorted((n[::-1], pos) for pos, n in enumerate(self._keys))
+        self._reversed_keys = [n for n, _ in reversed_pairs]
+        self._reversed_pos = [pos for _, pos in reversed_pairs]
+        self._grams = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def prefix(self, prefix: str) -> List[Any]:
+        """The items with a name that starts with `prefix`"""
+        start, end = _prefix_range(self._keys, prefix.lower())
+        return self._items[start:end]
+
+    def glob(self, pattern: str) -> List[Any]:
+        """The items with a name that matches a shell style pattern, e.g.
+        `orders.*`, `*.created_ts` or `user_?[0-9]`. A pattern without
+        wildcards matches the name exactly.
+        """
+        pattern = pattern.lower()
+        wildcards = _wildcards(pattern)
+        if not wildcards:
+            start = end = bisect_left(self._keys, pattern)
+            while end < len(self._keys) and self._keys[end] == pattern:
+                end += 1
+            return self._items[start:end]
+
+        matches = re.compile(translate(pattern)).match
+        literal_prefix = pattern[:wildcards[0][0]]
+        literal_suffix = pattern[wildcards[-1][1]:]
+        if literal_prefix or not literal_suffix:
+            start, end = _prefix_range(self._keys, literal_prefix)
+            return [
+                self._items[i] for i in range(start, end) if matches(self._keys[i])
+            ]
+        start, end = _prefix_range(self._reversed_keys, literal_suffix[::-1])
+        positions = sorted(
+            self._reversed_pos[i] for i in range(start, end)
+            if matches(self._keys[self._reversed_pos[i]])
+        )
+        return [self._items[pos] for pos in positions]
+
+    def _gram_index(self) -> Dict[str, List[int]]:
+        with self._lock:
+            if self._grams is None:
+                grams = {}
+                for pos, name in enumerate(self._keys):
+                    for gram in _ngrams(name):
+                        grams.setdefault(gram, []).append(pos)
+                self._grams = grams
+        return self._grams
+
+    def fuzzy(
+        self,
+        name: str,
+        limit: int = DEFAULT_FUZZY_LIMIT,
+        min_similarity: float = DEFAULT_MIN_SIMILARITY
+    ) -> List[Tuple[Any, float]]:
+        """The items with the names most similar to `name`, measured by
+        the trigrams that the names share. Only the names that share the
+        query's least common trigrams are scored, which keeps searches
+        fast when most names share some trigrams, e.g. a common prefix.
+
+        :param name: the name to look for, e.g. a name with a typo
+        :param limit: the most items returned
+        :param min_similarity: between 0 and 1, items with less similar
+            names are left out
+        :returns: `(item, similarity)` pairs, the most similar first
+        """
+        grams = self._gram_index()
+        query = _ngrams(name.lower())
+        shared = Counter()
+        read = 0
+        for positions in sorted((grams.get(g, ()) for g in query), key=len):
+            if read and read + len(positions) > MAX_FUZZY_POSTINGS:
+                break
+            shared.update(positions)
+            read += len(positions)
+        scored = []
+        for pos, _ in shared.most_common(limit * FUZZY_CANDIDATES_PER_RESULT):
+            name_grams = _ngrams(self._keys[pos])
+            similarity = 2.0 * len(query & name_grams) / (len(query) + len(name_grams))
+            if similarity >= min_similarity:
+                scored.append((similarity, pos))
+        scored.sort(key=lambda s: (-s[0], s[1]))
+        return [(self._items[pos], similarity) for similarity, pos in scored[:limit]]
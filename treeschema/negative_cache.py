@@ -0,0 +1,104 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable
+
+
+DEFAULT_TTL = 30.0
+DEFAULT_MAX_ENTRIES = 10000
+
+
+class NegativeCache(object):
+    """Remembers the assets that Tree Schema reported as not existing so
+    that repeated lookups for the same ID or name are answered locally
+    until the entry expires.
+
+    >>> cache = NegativeCache(ttl=30)
+    >>> cache.add(key)
+    >>> cache.is_missing(key)
+    True
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        :param ttl: the number of seconds a not found result is kept
+        :param max_entries: the number of not found results kept, the
+            oldest results are dropped first
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self._lock = threading.Lock()
+        self._missing = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._missing)
+
+    def is_missing(self, key: Hashable) -> bool:
+        """Whether `key` was recently reported as not existing"""
+        with self._lock:
+            added_at = self._missing.get(key)
+            if added_at is None:
+                return False
+            if time.monotonic() - added_at > self.ttl:
+                del self._missing[key]
+                return False
+            self.hits += 1
+            return True
+
+    def add(self, key: Hashable) -> None:
+        """Records that `key` does not exist"""
+        with self._lock:
+            self._missing.pop(key, None)
+            self._missing[key] = time.monotonic()
+            while len(self._missing) > self.max_entries:
+                self._missing.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        """Forgets a not found result, e.g. after the asset was created"""
+        with self._lock:
+            self._missing.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._missing.clear()
+
+
+_cache = None
+
+
+def configure(ttl: [float, None] = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES) -> [NegativeCache, None]:
+    """Enables the cache of not found lookups for this process
+
+    :param ttl: the number of seconds a not found result is kept, None
+        or 0 disables the cache
+    :param max_entries: the number of not found results kept
+    :returns: the cache that is now in use, None if disabled
+    """
+    global _cache
+    _cache = NegativeCache(ttl, max_entries) if ttl else None
+    return _cache
+
+
+def get_cache() -> [NegativeCache, None]:
+    return _cache
+
+
+def is_missing(key: Hashable) -> bool:
+    """Whether `key` was recently reported as not existing, always False
+    when the cache is disabled
+    """
+    cache = _cache
+    return cache is not None and cache.is_missing(key)
+
+
+def add(key: Hashable) -> None:
+    cache = _cache
+    if cache is not None:
+        cache.add(key)
+
+
+def discard(key: Hashable) -> None:
+    cache = _cache
+    if cache is not None:
+        cache.discard(key)
@@ -0,0 +1,188 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from . import catalog_cache
+from .api import APIClient
+from .exceptions import DataAssetDoesNotExist, InvalidInputs
+
+
+DEFAULT_MAX_WORKERS = 8
+
+# A path is a string, "<data store>.<schema>.<field full path>", or a
+# tuple of the data store name, schema name and field full path name
+Path = Union[str, Tuple[str, str, str]]
+
+# The collection, ID and name of each level of a path
+_LEVELS = (
+    (catalog_cache.DATA_STORES, 'data_store_id', 'name'),
+    (catalog_cache.SCHEMAS, 'data_schema_id', 'name'),
+    (catalog_cache.FIELDS, 'field_id', 'full_path_name'),
+)
+
+
+def _parts(path: Any) -> Path:
+    if isinstance(path, str):
+        return path
+    if (isinstance(path, (tuple, list)) and len(path) == 3
+        and all(isinstance(p, str) for p in path)):
+        return tuple(path)
+    raise InvalidInputs(
+        'A path must be a string or a tuple of the data store, schema and field names: %s' % (path,)
+    )
+
+
+def _match(names: Dict[str, int], rest: Path, last: bool) -> Tuple[Optional[int], Path]:
+    """Finds the ID for the first level of a path and returns the rest.
+    Names can contain dots, for strings the longest name that is followed
+    by a dot is used.
+    """
+    if isinstance(rest, tuple):
+        return names.get(rest[0].lower()), rest[1:]
+    lower = rest.lower()
+    if last:
+        return names.get(lower), ''
+    best = None
+    i = lower.find('.')
+    while i != -1:
+        if lower[:i] in names:
+            best = i
+        i = lower.find('.', i + 1)
+    if best is None:
+        return None, rest
+    return names[lower[:best]], rest[best + 1:]
+
+
+class PathIndex(object):
+    """Maps fully qualified field paths to the IDs of the data store,
+    schema and field. Only the names and IDs are kept, each data store
+    and schema that a path refers to is listed once, through the
+    persistent catalog cache when it is enabled, and the listings of
+    different parents are retrieved concurrently.
+
+    >>> index = ts.path_index()
+    >>> index.resolve('Kafka.orders.created.order_id')
+    (1, 12, 345)
+    >>> index.resolve_many([('Kafka', 'orders.created', 'order_id'), 'PG.public.users.id'])
+    [(1, 12, 345), (2, 40, 812)]
+    """
+
+    def __init__(self, client: APIClient = None, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        self.client = client or APIClient()
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        # The lower case names to IDs of the children of each parent,
+        # keyed on the IDs of the parent, e.g. (data_store_id,)
+        self._names = {}
+
+    def __len__(self) -> int:
+        """The number of fields in the index"""
+        return sum(len(names) for parent, names in self._names.items() if len(parent) == 2)
+
+    def _fetch(self, level: int, parent: Tuple[int, ...]) -> List[Dict]:
+        if level == 0:
+            return self.client.get_all_data_stores()
+        if level == 1:
+            return self.client.get_all_schemas_for_data_store(parent[0])
+        return self.client.get_all_fields_for_schema(
+            data_store_id=parent[0],
+            data_schema_id=parent[1]
+        )
+
+    def _load(self, level: int, parents: Iterable[Tuple[int, ...]], refresh: bool) -> None:
+        """Lists the children of each parent"""
+        collection, id_field, name_field = _LEVELS[level]
+
+        def load(parent):
+            results = catalog_cache.cached_listing(
+                collection,
+                parent[-1] if parent else None,
+                lambda: self._fetch(level, parent),
+                refresh=refresh
+            )
+            names = {r[name_field].lower(): r[id_field] for r in results}
+            with self._lock:
+                self._names[parent] = names
+
+        parents = list(parents)
+        if self.max_workers > 1 and len(parents) > 1:
+            workers = min(self.max_workers, len(parents))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(load, parents))
+        else:
+            for parent in parents:
+                load(parent)
+
+    def _match_level(self, states: List[List], indexes: Iterable[int], last: bool) -> List[int]:
+        """Resolves one level of each path, returns the paths not found"""
+        missed = []
+        for i in indexes:
+            rest, ids = states[i]
+            found, rest = _match(self._names.get(ids, {}), rest, last)
+            if found is None:
+                missed.append(i)
+            else:
+                states[i] = [rest, ids + (found,)]
+        return missed
+
+    def resolve_many(self, paths: Iterable[Path]) -> List[Optional[Tuple[int, int, int]]]:
+        """Resolves many paths at once. Every data store and schema that
+        is not in the index yet is listed once for all of the paths, a
+        parent that was listed before and is missing a name is listed
+        again in case the asset was created since.
+
+        :param paths: strings or tuples of the data store, schema and
+            field names, names are not case sensitive
+        :returns: the `(data_store_id, data_schema_id, field_id)` of each
+            path, in order, None for paths that do not exist
+        """
+        states = [[_parts(p), ()] for p in paths]
+        active = list(range(len(states)))
+        for level in range(len(_LEVELS)):
+            last = level == len(_LEVELS) - 1
+            parents = {states[i][1] for i in active}
+            new_parents = {p for p in parents if p not in self._names}
+            self._load(level, new_parents, refresh=False)
+            missed = self._match_level(states, active, last)
+            stale = {states[i][1] for i in missed} - new_parents
+            if stale:
+                self._load(level, stale, refresh=True)
+                missed = self._match_level(states, missed, last)
+            for i in missed:
+                states[i][1] = None
+            missed = set(missed)
+            active = [i for i in active if i not in missed]
+        return [ids for _, ids in states]
+
+    def resolve(self, path: Path, raise_if_not_exist: bool = False) -> Optional[Tuple[int, int, int]]:
+        """Resolves a single path
+
+        :param path: a string or a tuple of the data store, schema and
+            field names
+        :param raise_if_not_exist: default is False, if True will raise a
+            `treeschema.exceptions.DataAssetDoesNotExist` exception if the
+            path does not exist, when False `None` is returned
+        :returns: the `(data_store_id, data_schema_id, field_id)` of the path
+        """
+        found = self.resolve_many([path])[0]
+        if found is None and raise_if_not_exist:
+            raise DataAssetDoesNotExist('The path requested: %s does not exist' % (path,))
+        return found
+
+    def clear(self) -> None:
+        """Drops every name in the index"""
+        with self._lock:
+            self._names.clear()
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_index() -> PathIndex:
+    """The index shared by the process, created on first use"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = PathIndex()
+        return _index
@@ -0,0 +1,346 @@
+import atexit
+import math
+import os
+import re
+import sqlite3
+import threading
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from . import catalog_cache
+from .api import APIClient
+from .ts_enums import DATA_STORE, FIELD, SCHEMA
+
+
+FIELD_VALUE = 'field_value'
+TRANSFORMATION = 'transformation'
+
+# The entities that are indexed, keyed on the name of their ID field
+_ENTITY_TYPES = {
+    'data_store_id': DATA_STORE,
+    'data_schema_id': SCHEMA,
+    'field_id': FIELD,
+    'field_value_id': FIELD_VALUE,
+    'transformation_id': TRANSFORMATION,
+}
+_PARENT_ID_FIELDS = ('data_store_id', 'data_schema_id', 'field_id')
+
+# Terms in names and tags count more than terms in descriptions
+NAME_WEIGHT = 3
+TAG_WEIGHT = 2
+DESCRIPTION_WEIGHT = 1
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+DEFAULT_LIMIT = 20
+# Changes are written to disk once this many are pending, and on exit
+FLUSH_EVERY = 500
+
+_TOKEN = re.compile(r'[^\W_]+')
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Splits text into lower case words, underscores and dots separate
+    words so that `order_created_ts` matches `created`
+    """
+    if not text:
+        return []
+    return _TOKEN.findall(text.lower())
+
+
+def default_path() -> str:
+    """The index file, next to the persistent catalog cache"""
+    cache = catalog_cache.get_cache()
+    cache_path = cache.path if cache is not None else catalog_cache.DEFAULT_PATH
+    return os.path.join(os.path.dirname(cache_path), 'search.sqlite')
+
+
+class SearchResult(object):
+    """An entity found by a search, with the IDs needed to retrieve it"""
+    __slots__ = ('entity_type', 'id', 'name', 'data_store_id', 'data_schema_id', 'field_id', 'score')
+
+    def __init__(self, key: Tuple[str, int], doc: Tuple, score: float) -> None:
+        self.entity_type, self.id = key
+        self.data_store_id, self.data_schema_id, self.field_id, self.name = doc[:4]
+        self.score = score
+
+    def __repr__(self) -> str:
+        return 'SearchResult(%s %s: %s, score=%.3f)' % (
+            self.entity_type, self.id, self.name, self.score
+        )
+
+
+class SearchIndex(object):
+    """An inverted index over the names, descriptions and tags of data
+    stores, schemas, fields, field values and transformations. Entities
+    are added as they are serialized, so the index covers whatever has
+    been retrieved, and searches are ranked with BM25.
+
+    When a path is given the index is kept in a SQLite database, scoped
+    to the credentials in use like the catalog cache, and a new process
+    starts with everything indexed by earlier ones.
+
+    >>> index = SearchIndex()
+    >>> index.search('customer email', entity_type='field', data_store_id=1)
+    """
+
+    def __init__(self, path: str = None) -> None:
+        """
+        :param path: the SQLite database file, None keeps the index in
+            memory only
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        # (entity type, ID) to (data store ID, schema ID, field ID, name,
+        # weighted term counts, total weight)
+        self._docs = {}
+        self._postings = {}
+        self._total_length = 0
+        self._dirty = set()
+        self._conn = None
+        self._scope = None
+        if path:
+            self._open(path)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def _open(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._scope = catalog_cache.CatalogCache._scope()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS documents (
+                    scope TEXT NOT NULL,
+                    entity_type TEXT NOT NULL,
+                    entity_id INTEGER NOT NULL,
+                    data_store_id INTEGER,
+                    data_schema_id INTEGER,
+                    field_id INTEGER,
+                    name TEXT,
+                    terms BLOB NOT NULL,
+                    PRIMARY KEY (scope, entity_type, entity_id)
+                )"""
+            )
+        rows = self._conn.execute(
+            'SELECT entity_type, entity_id, data_store_id, data_schema_id, field_id, name, terms '
+            'FROM documents WHERE scope = ?',
+            (self._scope,)
+        ).fetchall()
+        with self._lock:
+            for entity_type, entity_id, ds_id, schema_id, field_id, name, terms in rows:
+                self._put((entity_type, entity_id), ds_id, schema_id, field_id, name,
+                          Counter(APIClient.codec.loads(terms)))
+
+    def _put(self, key, data_store_id, data_schema_id, field_id, name, terms: Counter) -> None:
+        self._drop(key)
+        length = sum(terms.values())
+        self._docs[key] = (data_store_id, data_schema_id, field_id, name, terms, length)
+        self._total_length += length
+        for term, weight in terms.items():
+            self._postings.setdefault(term, {})[key] = weight
+
+    def _drop(self, key) -> None:
+        doc = self._docs.pop(key, None)
+        if doc is None:
+            return
+        self._total_length -= doc[5]
+        for term in doc[4]:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(key, None)
+                if not postings:
+                    del self._postings[term]
+
+    def add(
+        self,
+        entity_type: str,
+        entity_id: int,
+        name: str = None,
+        description: str = None,
+        tags: Iterable[str] = (),
+        data_store_id: int = None,
+        data_schema_id: int = None,
+        field_id: int = None,
+        other_names: Iterable[str] = ()
+    ) -> None:
+        """Adds or replaces an entity in the index"""
+        terms = Counter()
+        name_tokens = set()
+        for text in [name] + list(other_names):
+            name_tokens.update(tokenize(text))
+        for token in name_tokens:
+            terms[token] += NAME_WEIGHT
+        for tag in tags:
+            for token in tokenize(tag):
+                terms[token] += TAG_WEIGHT
+        for token in tokenize(description):
+            terms[token] += DESCRIPTION_WEIGHT
+        key = (entity_type, entity_id)
+        with self._lock:
+            self._put(key, data_store_id, data_schema_id, field_id, name, terms)
+            self._dirty.add(key)
+            pending = len(self._dirty)
+        if self._conn is not None and pending >= FLUSH_EVERY:
+            self.flush()
+
+    def add_entity(self, entity: Any, obj: Dict[str, Any]) -> None:
+        """Adds a serialized entity, `obj` holds its values"""
+        id_field = getattr(entity, '__ID_FIELD_NAME__', None)
+        entity_type = _ENTITY_TYPES.get(id_field)
+        if entity_type is None or obj.get(id_field) is None:
+            return
+        name_field = getattr(entity, '__NAME_FIELD__', 'name')
+        parents = {
+            f: obj.get(f, entity.__dict__.get(f)) for f in _PARENT_ID_FIELDS
+        }
+        self.add(
+            entity_type,
+            obj[id_field],
+            name=obj.get(name_field),
+            description=obj.get('description_raw'),
+            tags=entity.__dict__.get('tags') or (),
+            other_names=[obj['name']] if name_field != 'name' and obj.get('name') else (),
+            **parents
+        )
+
+    def remove(self, entity_type: str, entity_id: int) -> None:
+        """Removes an entity, e.g. once it is deleted"""
+        key = (entity_type, entity_id)
+        with self._lock:
+            self._drop(key)
+            self._dirty.add(key)
+
+    def search(
+        self,
+        query: str,
+        entity_type: [str, Iterable[str]] = None,
+        data_store_id: int = None,
+        limit: int = DEFAULT_LIMIT
+    ) -> List[SearchResult]:
+        """Finds the entities that best match the words of `query`
+
+        :param query: one or more words, entities that match more of the
+            words, or match them in their names, rank higher
+        :param entity_type: only return entities of this type, or types,
+            e.g. `'field'` or `['schema', 'field']`
+        :param data_store_id: only return entities within this data store
+        :param limit: the most results returned
+        :returns: a list of `SearchResult`, best match first
+        """
+        if isinstance(entity_type, str):
+            entity_type = {entity_type}
+        elif entity_type is not None:
+            entity_type = set(entity_type)
+        scores = Counter()
+        with self._lock:
+            n_docs = len(self._docs)
+            if not n_docs:
+                return []
+            avg_length = self._total_length / n_docs or 1
+            for term in set(tokenize(query)):
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                for key, tf in postings.items():
+                    if entity_type is not None and key[0] not in entity_type:
+                        continue
+                    doc = self._docs[key]
+                    if data_store_id is not None and doc[0] != data_store_id:
+                        continue
+                    norm = K1 * (1 - B + B * doc[5] / avg_length)
+                    scores[key] += idf * tf * (K1 + 1) / (tf + norm)
+            return [
+                SearchResult(key, self._docs[key], score)
+                for key, score in scores.most_common(limit)
+            ]
+
+    def flush(self) -> None:
+        """Writes the pending changes to disk"""
+        if self._conn is None:
+            return
+        with self._lock, self._conn:
+            keys, self._dirty = self._dirty, set()
+            rows, removed = [], []
+            for key in keys:
+                doc = self._docs.get(key)
+                if doc is None:
+                    removed.append((self._scope,) + key)
+                else:
+                    terms = APIClient.codec.dumps(dict(doc[4]))
+                    rows.append((self._scope,) + key + doc[:4] + (terms,))
+            self._conn.executemany(
+                'DELETE FROM documents WHERE scope = ? AND entity_type = ? AND entity_id = ?', removed
+            )
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows
+            )
+
+    def clear(self) -> None:
+        """Drops every entity, on disk as well"""
+        with self._lock:
+            self._docs.clear()
+            self._postings.clear()
+            self._total_length = 0
+            self._dirty.clear()
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute('DELETE FROM documents WHERE scope = ?', (self._scope,))
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self.flush()
+            self._conn.close()
+            self._conn = None
+
+
+_index = None
+
+
+def configure(enabled: bool = True, persist: bool = True, path: str = None) -> [SearchIndex, None]:
+    """Enables the search index for this process
+
+    :param enabled: False disables the index
+    :param persist: whether the index is kept on disk
+    :param path: the SQLite database file, by default `search.sqlite`
+        next to the persistent catalog cache
+    :returns: the index that is now in use, None if disabled
+    """
+    global _index
+    if _index is not None:
+        _index.close()
+    _index = None
+    if enabled:
+        _index = SearchIndex((path or default_path()) if persist else None)
+    return _index
+
+
+def get_index() -> [SearchIndex, None]:
+    return _index
+
+
+def index_entity(entity: Any, obj: Dict[str, Any]) -> None:
+    """Adds a serialized entity when the index is enabled"""
+    index = _index
+    if index is not None:
+        index.add_entity(entity, obj)
+
+
+def remove(entity_type: str, entity_id: int) -> None:
+    index = _index
+    if index is not None:
+        index.remove(entity_type, entity_id)
+
+
+@atexit.register
+def _close() -> None:
+    index = _index
+    if index is not None:
+        index.close()
@@ -0,0 +1,241 @@
+import os
+import struct
+import time
+import zlib
+from typing import Any, Dict, List
+
+from . import entity_map
+from .api import APIClient
+from .catalog import (
+    DataField,
+    DataSchema,
+    DataStore,
+    FieldValue,
+    Transformation,
+    TransformationLink,
+    TreeSchemaUser
+)
+from .catalog import user as user_module
+from .catalog.base_serializer import is_lazy_handle
+from .catalog.user import resolve_user
+from .exceptions import InvalidSnapshot
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+# A snapshot file starts with the magic bytes, the format version and the
+# encoding of the payload that follows
+MAGIC = b'TSSNAP'
+VERSION = 1
+_HEADER = struct.Struct('!6sHB')
+
+ENCODING_MSGPACK = 1
+ENCODING_JSON_ZLIB = 2
+
+_USER_ROLES = ('steward', 'tech_poc')
+
+
+def _columns(cls) -> List[str]:
+    """Entities are stored as rows of values in the order of their 
+    class' `__FIELDS__`, the column names are stored once per class
+    """
+    return list(cls.__FIELDS__.keys())
+
+
+def _held(entities: Dict[int, Any]) -> List[Any]:
+    """The entities of a mapping that hold values, lazy handles that have
+    not been retrieved are left out
+    """
+    return [e for e in list(entities.values()) if not is_lazy_handle(e)]
+
+
+def _row(entity, columns: List[str]) -> List[Any]:
+    """Converts an entity to a row, users are stored by ID"""
+    obj = entity._obj
+    row = []
+    for c in columns:
+        v = obj.get(c)
+        if c in _USER_ROLES and isinstance(v, TreeSchemaUser):
+            v = v.id
+        row.append(v)
+    return row
+
+
+def _inputs(row: List[Any], columns: List[str]) -> Dict[str, Any]:
+    return dict(zip(columns, row))
+
+
+def _encode(payload: Dict, encoding: int) -> bytes:
+    if encoding == ENCODING_MSGPACK:
+        return msgpack.packb(payload, use_bin_type=True)
+    return zlib.compress(APIClient.codec.dumps(payload), 6)
+
+
+def _decode(data: bytes, encoding: int) -> Dict:
+    if encoding == ENCODING_MSGPACK:
+        if msgpack is None:
+            raise ImportError('msgpack must be installed to load this snapshot')
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+    if encoding == ENCODING_JSON_ZLIB:
+        return APIClient.codec.loads(zlib.decompress(data))
+    raise InvalidSnapshot('Unknown snapshot encoding: %s' % encoding)
+
+
+def build_payload(ts) -> Dict[str, Any]:
+    """Collects every entity held by a `TreeSchema` into a dictionary of
+    plain values. Only the collections already in memory are included,
+    nothing is requested from Tree Schema, and lazy handles that have not
+    been retrieved are left out.
+    """
+    users = user_module.shared_users()
+    users.update(ts._entity_holder._users_by_id)
+    user_cols = _columns(TreeSchemaUser)
+    ds_cols = _columns(DataStore)
+    schema_cols = _columns(DataSchema)
+    field_cols = _columns(DataField)
+    value_cols = _columns(FieldValue)
+    tf_cols = _columns(Transformation)
+    link_cols = _columns(TransformationLink)
+
+    data_stores = []
+    for ds in _held(ts._entity_holder._data_stores_by_id):
+        schemas = []
+        for schema in _held(ds._schemas_by_id):
+            fields = []
+            for field in _held(schema._fields_by_id):
+                values_complete = entity_map.is_complete(
+                    field._field_values_retrieved, field._field_values_by_id
+                )
+                fields.append([
+                    _row(field, field_cols),
+                    values_complete,
+                    [_row(v, value_cols) for v in _held(field._field_values_by_id)]
+                ])
+            fields_complete = entity_map.is_complete(schema._fields_retrieved, schema._fields_by_id)
+            schemas.append([_row(schema, schema_cols), fields_complete, fields])
+        schemas_complete = entity_map.is_complete(ds._schemas_retrieved, ds._schemas_by_id)
+        data_stores.append([_row(ds, ds_cols), schemas_complete, schemas])
+
+    transformations = []
+    for tf in _held(ts._entity_holder._transformations_by_id):
+        transformations.append([
+            _row(tf, tf_cols),
+            entity_map.is_complete(tf._links_retrieved, tf._links_by_id),
+            [_row(link, link_cols) for link in _held(tf._links_by_id)]
+        ])
+
+    return {
+        'created_at': time.time(),
+        'columns': {
+            'users': user_cols,
+            'data_stores': ds_cols,
+            'schemas': schema_cols,
+            'fields': field_cols,
+            'field_values': value_cols,
+            'transformations': tf_cols,
+            'links': link_cols
+        },
+        'retrieved': {
+            'data_stores': entity_map.is_complete(ts._data_stores_retrieved, ts.data_stores),
+            'transformations': entity_map.is_complete(
+                ts._transformations_retrieved, ts.transformations
+            ),
+            'users': entity_map.is_complete(ts._users_retrieved, ts.users)
+        },
+        'users': [
+            _row(u, user_cols) for u in users.values() 
+            if isinstance(getattr(u, '_obj', None), dict)
+        ],
+        'data_stores': data_stores,
+        'transformations': transformations
+    }
+
+
+def save_snapshot(ts, path: str, encoding: int = None) -> int:
+    """Writes the entities held by a `TreeSchema` to a snapshot file
+
+    :param ts: the `TreeSchema`
+    :param path: the file to write, it is replaced atomically
+    :param encoding: `ENCODING_MSGPACK` or `ENCODING_JSON_ZLIB`, by
+        default msgpack is used when it is installed
+    :returns: the size of the file in bytes
+    """
+    if encoding is None:
+        encoding = ENCODING_MSGPACK if msgpack is not None else ENCODING_JSON_ZLIB
+    data = _HEADER.pack(MAGIC, VERSION, encoding) + _encode(build_payload(ts), encoding)
+    tmp_path = '%s.%s.tmp' % (path, os.getpid())
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return len(data)
+
+
+def read_snapshot(path: str) -> Dict[str, Any]:
+    """Reads and validates a snapshot file, returning its payload"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < _HEADER.size:
+        raise InvalidSnapshot('%s is not a Tree Schema snapshot' % path)
+    magic, version, encoding = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise InvalidSnapshot('%s is not a Tree Schema snapshot' % path)
+    if version > VERSION:
+        raise InvalidSnapshot(
+            'Snapshot version %s is newer than the supported version %s' % (version, VERSION)
+        )
+    return _decode(data[_HEADER.size:], encoding)
+
+
+def load_snapshot(ts, path: str) -> None:
+    """Loads a snapshot into a `TreeSchema`. Users are loaded first so
+    that stewards and technical points of contact resolve locally, every
+    entity is then built from a complete set of values and no requests
+    are sent to Tree Schema.
+    """
+    payload = read_snapshot(path)
+    cols = payload['columns']
+
+    for row in payload['users']:
+        ts._add_user(resolve_user(_inputs(row, cols['users'])))
+
+    for ds_row, schemas_retrieved, schemas in payload['data_stores']:
+        ds = DataStore(_inputs(ds_row, cols['data_stores']))
+        ts._add_data_store(ds)
+        for schema_row, fields_retrieved, fields in schemas:
+            schema = DataSchema(_inputs(schema_row, cols['schemas']), data_store_id=ds.id)
+            ds._add_data_schema(schema)
+            for field_row, values_retrieved, values in fields:
+                field = DataField(
+                    _inputs(field_row, cols['fields']),
+                    data_store_id=ds.id,
+                    data_schema_id=schema.id
+                )
+                schema._add_data_field(field)
+                for value_row in values:
+                    field._add_field_value(FieldValue(
+                        _inputs(value_row, cols['field_values']),
+                        data_store_id=ds.id,
+                        data_schema_id=schema.id,
+                        field_id=field.id
+                    ))
+                field._field_values_retrieved = values_retrieved
+            schema._fields_retrieved = fields_retrieved
+        ds._schemas_retrieved = schemas_retrieved
+
+    for tf_row, links_retrieved, links in payload['transformations']:
+        tf = Transformation(_inputs(tf_row, cols['transformations']))
+        ts._add_transformation(tf)
+        for link_row in links:
+            tf._add_link(TransformationLink(
+                _inputs(link_row, cols['links']),
+                transformation_id=tf.id
+            ))
+        tf._links_retrieved = links_retrieved
+
+    retrieved = payload['retrieved']
+    ts._data_stores_retrieved = retrieved['data_stores']
+    ts._transformations_retrieved = retrieved['transformations']
+    ts._users_retrieved = retrieved['users']
@@ -1,10 +1,17 @@
 
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
 from . import TreeSchemaAuth
+from . import (
+    catalog_cache, delta_sync, entity_map, fields_table, name_index, negative_cache, path_index,
+    search_index, snapshot, warmup
+)
 from .api import APIClient
 from .catalog import DataStore, Transformation, TreeSchemaUser
+from .catalog.base_serializer import is_lazy_handle
+from .catalog.user import prefetch_users, referenced_user_ids, resolve_user
 from .exceptions import InvalidInputs, UsernameSecretRequired
+from .lite import LiteCatalog
 from .ts_enums import FIELD, SCHEMA, DATA_STORE
 
 
@@ -48,11 +55,12 @@ class TreeSchema(object):
             cls.username = username
             cls.auth = TreeSchemaAuth(username, secret_key)
             cls.client = APIClient()
-            cls._entity_holder = _EntityHolder()
             cls._data_stores_retrieved = False
+            cls._data_stores_hwm = None
             cls._transformations_retrieved = False
             cls._users_retrieved = False
             cls.instance = super(TreeSchema, cls).__new__(cls)
+            cls._entity_holder = _EntityHolder(cls.instance)
             # cls.encoded_secret = get_encoded_secret(username, secret_key)
         return cls.instance
 
@@ -83,20 +91,54 @@ class TreeSchema(object):
         """
         return self._entity_holder._users_by_id
 
-    def _add_data_store(self, data_store):
-        """Adds a data store to the internal mappings"""
+    def _add_data_store(self, data_store, touch=True):
+        """Adds a data store to the internal mappings, listings pass 
+        `touch=False` and update the name indexes once for all data stores
+        """
         self._entity_holder._data_stores_by_id[data_store.id] = data_store
-        self._entity_holder._data_stores_by_name[data_store._name.lower()] = data_store        
+        if not is_lazy_handle(data_store):
+            self._entity_holder._data_stores_by_name[data_store._name.lower()] = data_store        
+        if touch:
+            name_index.touch(name_index.SCHEMAS)
+            name_index.touch(name_index.FIELDS)
 
     def _add_transformation(self, transformation):
         """Adds a transformation to the internal mappings"""
         self._entity_holder._transformations_by_id[transformation.id] = transformation
-        self._entity_holder._transformations_by_name[transformation._name.lower()] = transformation        
+        if not is_lazy_handle(transformation):
+            self._entity_holder._transformations_by_name[transformation._name.lower()] = transformation        
 
     def _add_user(self, user):
         """Adds a user to the internal mappings"""
         self._entity_holder._users_by_id[user.id] = user
-        self._entity_holder._users_by_email[user._name.lower()] = user 
+        if not is_lazy_handle(user):
+            self._entity_holder._users_by_email[user._name.lower()] = user 
+
+    def _evict_data_store(self, data_store, expired):
+        """Removes a data store that was evicted from the internal mappings"""
+        self._entity_holder._data_stores_by_id.pop(data_store.id, None)
+        if data_store._name is not None:
+            self._entity_holder._data_stores_by_name.pop(data_store._name.lower(), None)
+        name_index.touch(name_index.SCHEMAS)
+        name_index.touch(name_index.FIELDS)
+        if expired:
+            self._data_stores_retrieved = False
+
+    def _evict_transformation(self, transformation, expired):
+        """Removes a transformation that was evicted from the internal mappings"""
+        self._entity_holder._transformations_by_id.pop(transformation.id, None)
+        if transformation._name is not None:
+            self._entity_holder._transformations_by_name.pop(transformation._name.lower(), None)
+        if expired:
+            self._transformations_retrieved = False
+
+    def _evict_user(self, user, expired):
+        """Removes a user that was evicted from the internal mappings"""
+        self._entity_holder._users_by_id.pop(user.id, None)
+        if user._name is not None:
+            self._entity_holder._users_by_email.pop(user._name.lower(), None)
+        if expired:
+            self._users_retrieved = False
 
     def data_store(
         self,
@@ -136,23 +178,138 @@ class TreeSchema(object):
             and data_store_input.lower() in self._entity_holder._data_stores_by_name):
             data_store = self._entity_holder._data_stores_by_name[data_store_input.lower()]
         else:
+            created = DataStore._creates(data_store_input)
             data_store = DataStore(data_store_input)
             self._add_data_store(data_store)
+            if created:
+                catalog_cache.invalidate(catalog_cache.DATA_STORES)
         return data_store
     
+    def _merge_data_stores(self, ds_results: List[Dict]) -> None:
+        """Adds or updates data stores that changed in Tree Schema"""
+        # Users are held weakly, this keeps them alive while the entities are built
+        users = prefetch_users(referenced_user_ids(ds_results))
+        for ds in ds_results:
+            existing = self._entity_holder._data_stores_by_id.get(ds['data_store_id'])
+            if existing is not None and not is_lazy_handle(existing):
+                self._entity_holder._data_stores_by_name.pop(existing._name.lower(), None)
+            self._add_data_store(DataStore(ds), touch=False)
+        name_index.touch(name_index.SCHEMAS)
+        name_index.touch(name_index.FIELDS)
+        catalog_cache.invalidate(catalog_cache.DATA_STORES)
+
+    def _sync_data_stores(self) -> bool:
+        """Merges the data stores updated since the last retrieval, returns
+        False if the data stores must be retrieved in full instead
+        """
+        if not delta_sync.can_sync(
+            entity_map.DATA_STORES, self._data_stores_retrieved, self._data_stores_hwm
+        ):
+            return False
+        mark = delta_sync.sync_listing(
+            self._entity_holder._data_stores_by_id,
+            self._data_stores_hwm,
+            lambda since: self.client.get_all_data_stores(updated_since=since),
+            self.client.count_data_stores,
+            self._merge_data_stores
+        )
+        if mark is None:
+            return False
+        self._data_stores_hwm = mark
+        return True
+
     def get_data_stores(
         self, 
-        refresh: bool = False
+        refresh: bool = False,
+        incremental: bool = False
     ) -> Dict[int, DataStore]:
-        """Retrieves all data stores from Tree Schema"""
-        if refresh or not self._data_stores_retrieved:
-            ds_results = self.client.get_all_data_stores()
-            self._data_stores_retrieved = True
-            for ds in ds_results:
-                found_ds = DataStore(ds)
-                self._add_data_store(found_ds)
+        """Retrieves all data stores from Tree Schema
+
+        :param refresh: Default False, if True, will force all data stores 
+            to be retrieved from Tree Schema and not the local cache
+        :param incremental: Default False, if True and `refresh` is True, 
+            only the data stores updated since the last retrieval are 
+            fetched and merged into the local cache. All data stores are 
+            retrieved when data stores were deleted.
+
+        >>> ts.get_data_stores(refresh=True, incremental=True)
+        """
+        if refresh and incremental and self._sync_data_stores():
+            return self.data_stores
+        if refresh or not entity_map.is_complete(self._data_stores_retrieved, self.data_stores):
+            ds_results = self._list_data_stores(refresh)
+            loaded = self._load_data_stores(ds_results)
+            if incremental:
+                # The incremental refresh found deleted data stores
+                found_ids = {ds['data_store_id'] for ds in ds_results}
+                for ds in list(self.data_stores.values()):
+                    if ds.id not in found_ids:
+                        self._evict_data_store(ds, expired=False)
+            return loaded
             
         return self.data_stores    
+
+    def _list_data_stores(self, refresh: bool = False) -> List[Dict]:
+        """Retrieves the raw listing of the data stores, it does not change
+        any local state and can run on any thread
+        """
+        return catalog_cache.cached_listing(
+            catalog_cache.DATA_STORES, 
+            None, 
+            self.client.get_all_data_stores, 
+            refresh=refresh
+        )
+
+    def _load_data_stores(self, ds_results: List[Dict]) -> Dict[int, DataStore]:
+        """Adds a complete listing of the data stores"""
+        self._data_stores_retrieved = True
+        self._entity_holder._data_stores_by_id.evicted = False
+        found = {}
+        self._data_stores_hwm = delta_sync.high_water_mark(ds_results)
+        # Users are held weakly, this keeps them alive while the entities are built
+        users = prefetch_users(referenced_user_ids(ds_results))
+        for ds in ds_results:
+            found_ds = DataStore(ds)
+            self._add_data_store(found_ds, touch=False)
+            found[found_ds.id] = found_ds
+        name_index.touch(name_index.SCHEMAS)
+        name_index.touch(name_index.FIELDS)
+        if not entity_map.is_complete(self._data_stores_retrieved, self.data_stores):
+            # Data stores were evicted, the listing does not fit in memory
+            return found
+        return self.data_stores
+
+    def fields_table(self, max_workers: int = None) -> fields_table.FieldsTable:
+        """Returns the fields of every schema in every data store as one 
+        columnar table, see `DataSchema.fields_table()`. Schemas are read
+        concurrently.
+
+        :param max_workers: the number of schemas read at the same time, 
+            defaults to `APIClient.page_workers`
+
+        >>> cols = ts.fields_table().to_numpy()
+        >>> unowned = cols['steward_id'] == fields_table.MISSING_ID
+        """
+        schemas = [
+            schema for ds in list(self.get_data_stores().values())
+            for schema in list(ds.schemas.values())
+        ]
+        return fields_table.build(schemas, max_workers=max_workers or APIClient.page_workers)
+
+    def iter_data_stores(self) -> Iterator[DataStore]:
+        """Yields each data store. Data stores are streamed from Tree Schema 
+        one page at a time and are not added to the local cache. If the data 
+        stores have already been retrieved the cached data stores are 
+        yielded instead.
+
+        >>> for ds in ts.iter_data_stores():
+        >>>     print(ds.name)
+        """
+        if entity_map.is_complete(self._data_stores_retrieved, self.data_stores):
+            yield from list(self.data_stores.values())
+            return
+        for ds in self.client.iter_all_data_stores():
+            yield DataStore(ds)
     
     def transformation(
         self, 
@@ -190,8 +347,11 @@ class TreeSchema(object):
             and transformation_input.lower() in self._entity_holder._transformations_by_name):
             transformation = self._entity_holder._transformations_by_name[transformation_input.lower()]
         else:
+            created = Transformation._creates(transformation_input)
             transformation = Transformation(transformation_input)
             self._add_transformation(transformation)
+            if created:
+                catalog_cache.invalidate(catalog_cache.TRANSFORMATIONS)
         return transformation
 
     def get_transformations(
@@ -199,15 +359,52 @@ class TreeSchema(object):
         refresh: bool = False
     ) -> Dict[int, Transformation]:
         """Retrieves all transformations from Tree Schema"""
-        if refresh or not self._transformations_retrieved:
-            transform_results = self.client.get_all_transformations()
-            self._transformations_retrieved = True
-            for tf in transform_results:
-                transformation = Transformation(tf)
-                self._add_transformation(transformation)
+        if refresh or not entity_map.is_complete(
+            self._transformations_retrieved, self.transformations
+        ):
+            return self._load_transformations(self._list_transformations(refresh))
             
         return self.transformations    
 
+    def _list_transformations(self, refresh: bool = False) -> List[Dict]:
+        """Retrieves the raw listing of the transformations, it does not
+        change any local state and can run on any thread
+        """
+        return catalog_cache.cached_listing(
+            catalog_cache.TRANSFORMATIONS, 
+            None, 
+            self.client.get_all_transformations, 
+            refresh=refresh
+        )
+
+    def _load_transformations(self, transform_results: List[Dict]) -> Dict[int, Transformation]:
+        """Adds a complete listing of the transformations"""
+        self._transformations_retrieved = True
+        self._entity_holder._transformations_by_id.evicted = False
+        found = {}
+        # Users are held weakly, this keeps them alive while the entities are built
+        users = prefetch_users(referenced_user_ids(transform_results))
+        for tf in transform_results:
+            transformation = Transformation(tf)
+            self._add_transformation(transformation)
+            found[transformation.id] = transformation
+        if not entity_map.is_complete(self._transformations_retrieved, self.transformations):
+            # Transformations were evicted, the listing does not fit in memory
+            return found
+        return self.transformations
+
+    def iter_transformations(self) -> Iterator[Transformation]:
+        """Yields each transformation. Transformations are streamed from Tree 
+        Schema one page at a time and are not added to the local cache. If the 
+        transformations have already been retrieved the cached transformations 
+        are yielded instead.
+        """
+        if entity_map.is_complete(self._transformations_retrieved, self.transformations):
+            yield from list(self.transformations.values())
+            return
+        for tf in self.client.iter_all_transformations():
+            yield Transformation(tf)
+
     def user(
         self, 
         user_input: [int, str]
@@ -232,7 +429,7 @@ class TreeSchema(object):
             and user_input.lower() in self._entity_holder._users_by_email):
             user = self._entity_holder._users_by_email[user_input.lower()]
         else:
-            user = TreeSchemaUser(user_input)
+            user = resolve_user(TreeSchemaUser(user_input))
             self.users[user.id] = user
         return user
 
@@ -241,15 +438,349 @@ class TreeSchema(object):
         refresh: bool = False
     ) -> Dict[int, TreeSchemaUser]:
         """Retrieves all transformations from Tree Schema"""
-        if refresh or not self._users_retrieved:
-            user_results = self.client.get_all_users()
-            self._users_retrieved = True
-            for usr in user_results:
-                user = TreeSchemaUser(usr)
-                self._add_user(user)
+        if refresh or not entity_map.is_complete(self._users_retrieved, self.users):
+            return self._load_users(self._list_users(refresh))
             
         return self.users
 
+    def _list_users(self, refresh: bool = False) -> List[Dict]:
+        """Retrieves the raw listing of the users, it does not change any
+        local state and can run on any thread
+        """
+        return catalog_cache.cached_listing(
+            catalog_cache.USERS, 
+            None, 
+            self.client.get_all_users, 
+            refresh=refresh
+        )
+
+    def _load_users(self, user_results: List[Dict]) -> Dict[int, TreeSchemaUser]:
+        """Adds a complete listing of the users"""
+        self._users_retrieved = True
+        self._entity_holder._users_by_id.evicted = False
+        found = {}
+        for usr in user_results:
+            user = resolve_user(usr)
+            self._add_user(user)
+            found[user.id] = user
+        if not entity_map.is_complete(self._users_retrieved, self.users):
+            # Users were evicted, the listing does not fit in memory
+            return found
+        return self.users
+
+    def iter_users(self) -> Iterator[TreeSchemaUser]:
+        """Yields each user in the organization. Users are streamed from Tree 
+        Schema one page at a time and are not added to the local cache. If the 
+        users have already been retrieved the cached users are yielded instead.
+        """
+        if entity_map.is_complete(self._users_retrieved, self.users):
+            yield from list(self.users.values())
+            return
+        for usr in self.client.iter_all_users():
+            yield resolve_user(usr)
+
+    def configure_eviction(
+        self,
+        level: str,
+        ttl: float = None,
+        max_entries: int = None,
+        max_bytes: int = None
+    ) -> [entity_map.EvictionPolicy, None]:
+        """Bounds the entities held in memory at one level of the catalog.
+        Limits apply to each collection at that level, e.g. `max_entries` 
+        for `fields` limits the fields kept for every schema, and evicting 
+        an entity releases its children as well. Entities that are evicted 
+        for size are fetched again when they are requested, entities that 
+        expire also cause the next listing to be downloaded again.
+
+        :param level: one of `data_stores`, `schemas`, `fields`, 
+            `field_values`, `transformations`, `links` or `users`
+        :param ttl: the number of seconds an entity is kept
+        :param max_entries: the number of entities kept per collection, 
+            least recently used first
+        :param max_bytes: the approximate memory the entities in each 
+            collection may use
+        :returns: the policy now in use, None when all limits are removed
+
+        >>> ts.configure_eviction('fields', ttl=15 * 60, max_entries=5000)
+        >>> ts.configure_eviction('schemas', max_bytes=50 * 1024 * 1024)
+        """
+        return entity_map.configure_eviction(level, ttl, max_entries, max_bytes)
+
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Returns the hits, misses, evictions, expirations and resident 
+        entities and bytes for every level of the in-memory catalog
+
+        >>> ts.cache_stats()['fields']
+        {'hits': 5012, 'misses': 34, 'evictions': 0, 'expirations': 0, ...}
+        """
+        return entity_map.cache_stats()
+
+    def configure_negative_cache(
+        self, 
+        ttl: float = negative_cache.DEFAULT_TTL,
+        max_entries: int = negative_cache.DEFAULT_MAX_ENTRIES
+    ) -> [negative_cache.NegativeCache, None]:
+        """Remembers the IDs and names that Tree Schema reported as not 
+        existing. Repeating a lookup for one of them within `ttl` seconds 
+        raises `DataAssetDoesNotExist`, or returns None from accessors such 
+        as `schema()`, without sending a request. Creating an asset through 
+        this client forgets the not found results for its ID and name.
+
+        :param ttl: the number of seconds a not found result is kept, 
+            None or 0 disables the cache
+        :param max_entries: the number of not found results kept
+        :returns: the cache now in use, None when disabled
+
+        >>> ts.configure_negative_cache(ttl=10)
+        >>> ds.schema('optional.topic') is None
+        True
+        """
+        return negative_cache.configure(ttl, max_entries)
+
+    def save_snapshot(self, path: str) -> int:
+        """Saves every data store, schema, field, field value, 
+        transformation, link and user currently held in memory to a 
+        compact, versioned binary file. The file uses msgpack when it is 
+        installed and zlib compressed JSON otherwise.
+
+        :param path: the file to write
+        :returns: the size of the snapshot in bytes
+
+        >>> for ds in ts.get_data_stores().values():
+        >>>     for schema in ds.get_schemas().values():
+        >>>         schema.get_fields()
+        >>> ts.save_snapshot('catalog.tssnap')
+        """
+        return snapshot.save_snapshot(self, path)
+
+    def load_snapshot(self, path: str) -> None:
+        """Loads a file written by `save_snapshot()`. Entities are built 
+        from the values in the snapshot without any requests to Tree 
+        Schema, collections that were fully retrieved when the snapshot 
+        was saved are treated as retrieved.
+
+        :param path: the snapshot file
+
+        >>> ts = TreeSchema('<your email>', '<your secret key>')
+        >>> ts.load_snapshot('catalog.tssnap')
+        >>> ts.data_store('my data store').schema('some schema').field('id')
+        """
+        snapshot.load_snapshot(self, path)
+
+    def enable_persistent_cache(
+        self,
+        path: str = catalog_cache.DEFAULT_PATH,
+        max_age: float = catalog_cache.DEFAULT_MAX_AGE
+    ) -> catalog_cache.CatalogCache:
+        """Keeps the results of catalog listings (data stores, schemas,
+        fields, field values, transformations, links and users) in a local
+        SQLite database. Later processes read the listings from disk instead
+        of downloading them again until they are older than `max_age`.
+        Listings are dropped when an entity within them is created, updated
+        or deleted through this client, use `refresh=True` to pick up
+        changes made elsewhere.
+
+        :param path: the SQLite database file
+        :param max_age: the number of seconds a cached listing is used for
+        :returns: the `CatalogCache`
+
+        >>> ts = TreeSchema('<your email>', '<your secret key>')
+        >>> ts.enable_persistent_cache(max_age=60 * 60)
+        >>> ts.data_store('my data store').schema('some schema')
+        """
+        return catalog_cache.configure(path, max_age)
+
+    def disable_persistent_cache(self) -> None:
+        """Stops reading and writing the persistent catalog cache"""
+        catalog_cache.configure(None)
+
+    def configure_search_index(
+        self,
+        enabled: bool = True,
+        persist: bool = True,
+        path: str = None
+    ) -> [search_index.SearchIndex, None]:
+        """Indexes the names, descriptions and tags of the data stores, 
+        schemas, fields, field values and transformations as they are 
+        retrieved so that `search()` can find them by keyword without any
+        requests. The index is disabled by default.
+
+        :param enabled: False disables the index
+        :param persist: whether the index is kept on disk so that later 
+            processes start with it
+        :param path: the SQLite database file, by default `search.sqlite` 
+            next to the persistent catalog cache
+        :returns: the `SearchIndex` now in use, None when disabled
+
+        >>> ts.configure_search_index()
+        >>> ts.warm([{'data_store': 'Kafka', 'schemas': '*', 'depth': 'fields'}])
+        >>> ts.search('customer email', entity_type='field')
+        """
+        return search_index.configure(enabled, persist, path)
+
+    def search(
+        self,
+        query: str,
+        entity_type: [str, List[str]] = None,
+        data_store_id: int = None,
+        limit: int = search_index.DEFAULT_LIMIT
+    ) -> List[search_index.SearchResult]:
+        """Searches the entities in the search index by keyword, the best 
+        matches first. See `configure_search_index()`.
+
+        :param query: one or more words to look for in names, descriptions
+            and tags
+        :param entity_type: only return entities of this type, or types: 
+            `'data_store'`, `'schema'`, `'field'`, `'field_value'` or 
+            `'transformation'`
+        :param data_store_id: only return entities within this data store
+        :param limit: the most results returned
+        :returns: a list of `SearchResult` with the IDs of each entity
+
+        >>> for result in ts.search('order total', entity_type='field', data_store_id=1):
+        >>>     print(result.name, result.score)
+        """
+        index = search_index.get_index()
+        if index is None:
+            raise InvalidInputs(
+                'The search index is not enabled, use `configure_search_index()` first'
+            )
+        return index.search(query, entity_type, data_store_id, limit)
+
+    def lite(self) -> LiteCatalog:
+        """Returns a read-only view of the catalog that lists schemas, 
+        fields, field values and links as compact records. Records use 
+        `__slots__`, share interned strings and hold no client, which is 
+        suited to loading very large catalogs that are only read.
+
+        >>> lite = ts.lite()
+        >>> fields = lite.fields(data_store_id=1, data_schema_id=12)
+        >>> fields[0].data_type
+        'string'
+        """
+        return LiteCatalog(self.client)
+
+    def path_index(self) -> path_index.PathIndex:
+        """The index of fully qualified field paths shared by the process,
+        see `PathIndex`
+
+        >>> ts.path_index().resolve('Kafka.orders.created.order_id')
+        (1, 12, 345)
+        """
+        return path_index.get_index()
+
+    def resolve_paths(self, paths: List) -> List:
+        """Resolves many field paths to the IDs of their data store, schema
+        and field at once. Each data store and schema is listed at most once
+        no matter how many paths refer to it.
+
+        :param paths: strings, `'<data store>.<schema>.<field>'`, or tuples of
+            the data store, schema and field names
+        :returns: a `(data_store_id, data_schema_id, field_id)` tuple for each 
+            path, None for paths that do not exist
+
+        >>> ts.resolve_paths([
+        >>>     'Kafka.orders.created.order_id', 
+        >>>     ('Postgres', 'public.orders', 'id')
+        >>> ])
+        [(1, 12, 345), (2, 40, 812)]
+        """
+        return path_index.get_index().resolve_many(paths)
+
+    def _name_index(self, kind: str) -> name_index.NameIndex:
+        """The name index for the schemas or fields in memory, rebuilt
+        when they have changed since it was built
+        """
+        current = name_index.generation(kind)
+        found = self._entity_holder._name_indexes.get(kind)
+        if found is not None and found[0] == current:
+            return found[1]
+        schemas = [
+            s for ds in list(self.data_stores.values())
+            for s in list(ds._schemas_by_id.values())
+            if not is_lazy_handle(s)
+        ]
+        if kind == name_index.SCHEMAS:
+            items = ((s.name, s) for s in schemas)
+        else:
+            items = (
+                (f.full_path_name, f) for s in schemas 
+                for f in list(s._fields_by_id.values())
+                if not is_lazy_handle(f)
+            )
+        index = name_index.NameIndex(items)
+        self._entity_holder._name_indexes[kind] = (current, index)
+        return index
+
+    def find_schemas(self, pattern: str, fuzzy: bool = False, limit: int = None) -> List:
+        """Finds the schemas in memory with a name that matches a shell 
+        style pattern, names are not case sensitive. Only the schemas that
+        have already been retrieved are searched, nothing is requested from
+        Tree Schema. Schemas evicted under the limits set with 
+        `configure_eviction()` are no longer in memory and are not found.
+
+        :param pattern: a pattern such as `spoc.accounts*`, `*.events` or 
+            `orders_20[12]?`, a pattern without wildcards matches exactly
+        :param fuzzy: instead of matching the pattern, return the schemas
+            with the most similar names, most similar first, e.g. for names
+            that are misspelled
+        :param limit: the most schemas returned, fuzzy searches return 10
+            by default
+        :returns: a list of `DataSchema` objects
+
+        >>> ts.data_store('Kafka').get_schemas()
+        >>> ts.find_schemas('spoc.accounts*')
+        >>> ts.find_schemas('spoc.acounts', fuzzy=True)
+        """
+        return self._find(name_index.SCHEMAS, pattern, fuzzy, limit)
+
+    def find_fields(self, pattern: str, fuzzy: bool = False, limit: int = None) -> List:
+        """Finds the fields in memory with a full path name that matches 
+        a shell style pattern, see `find_schemas()`
+
+        :returns: a list of `DataField` objects
+
+        >>> ts.find_fields('address.*')
+        >>> ts.find_fields('*_ts')
+        """
+        return self._find(name_index.FIELDS, pattern, fuzzy, limit)
+
+    def _find(self, kind: str, pattern: str, fuzzy: bool, limit: int) -> List:
+        index = self._name_index(kind)
+        if fuzzy:
+            limit = limit or name_index.DEFAULT_FUZZY_LIMIT
+            return [item for item, _ in index.fuzzy(pattern, limit=limit)]
+        found = index.glob(pattern)
+        return found[:limit] if limit else found
+
+    def warm(
+        self,
+        spec: List[Dict],
+        max_workers: int = warmup.DEFAULT_MAX_WORKERS
+    ) -> warmup.WarmupReport:
+        """Loads a declared part of the catalog, e.g. at service start up. 
+        Each entry of `spec` names a data store, by ID or name, the schemas 
+        to load as globs or schema IDs (all schemas by default) and the 
+        depth to load: `stores`, `schemas` (the default), `fields` or 
+        `values`. The listings needed at each level are requested 
+        concurrently and loaded on the calling thread, schemas requested 
+        only by ID are batch loaded, and anything already retrieved is not 
+        fetched again.
+
+        :param spec: a list of dictionaries with the keys `data_store`, 
+            `schemas` and `depth`
+        :param max_workers: the maximum number of concurrent requests
+        :returns: a report with the time, requests and entities of each step
+
+        >>> report = ts.warm([
+        >>>     {'data_store': 'Kafka', 'schemas': ['orders.*'], 'depth': 'fields'},
+        >>>     {'data_store': 'Postgres', 'schemas': [12, 13], 'depth': 'schemas'}
+        >>> ])
+        >>> report.as_dict()
+        """
+        return warmup.warm(self, spec, max_workers=max_workers)
+
     def batch_load_by_id(
         self,
         data_store_ids: List[int] = None,
@@ -270,6 +801,21 @@ class TreeSchema(object):
 
         >>> Example...
         """
+        for asset_batch in self._asset_batches(data_store_ids, schema_ids, field_ids, batch_size):
+            self._load_asset_batch(
+                self.client.batch_retrieve_assets(assets={'assets': asset_batch})
+            )
+
+    def _asset_batches(
+        self,
+        data_store_ids: List[int] = None,
+        schema_ids: List[int] = None,
+        field_ids: List[int] = None,
+        batch_size: int = 100
+    ) -> List[List[Dict]]:
+        """Splits the assets requested by `batch_load_by_id()` into the
+        batches sent to Tree Schema
+        """
         assets = []
         if isinstance(field_ids, list):
             assets.extend([{'type': FIELD, 'id': i} for i in field_ids])
@@ -285,40 +831,49 @@ class TreeSchema(object):
                 'Must provide at least one of "data_store_ids", "schema_ids" or "field_ids"'
             )
         
-        has_more_assets = True
-        asset_iter = 0
-        while has_more_assets:
-            asset_batch = assets[asset_iter * batch_size: asset_iter * batch_size + batch_size]
-            if len(asset_batch) == 0:
-                break
-
-            resp = self.client.batch_retrieve_assets(assets={'assets': asset_batch})
-            data_stores_found = resp.get('data_stores') or []
-            schemas_found = resp.get('data_schemas') or []
-            fields_found = resp.get('data_fields') or []
-            for data_store in data_stores_found:
-                self.data_store(data_store)
-
-            # Keep track of schemas to data stores
-            schema_ds_map = {}
-            for schema in schemas_found:
-                schema_ds_map[schema['data_schema_id']] = schema['data_store_id']
-                self.data_store(schema['data_store_id']).schema(schema, pre_fetch=False)
-
-            for field in fields_found:
-                ds_id = schema_ds_map[field['data_schema_id']]
-                schema_id = field['data_schema_id']
-                self.data_store(ds_id).schema(schema_id, pre_fetch=False).field(field, pre_fetch=False)
-
-            if len(asset_batch) < batch_size:
-                has_more_assets = False
+        return [assets[i:i + batch_size] for i in range(0, len(assets), batch_size)]
+
+    def _load_asset_batch(self, resp: Dict) -> None:
+        """Adds the assets of one `batch_retrieve_assets` response"""
+        data_stores_found = resp.get('data_stores') or []
+        schemas_found = resp.get('data_schemas') or []
+        fields_found = resp.get('data_fields') or []
+        # Users are held weakly, this keeps them alive while the entities are built
+        users = prefetch_users(referenced_user_ids(
+            data_stores_found + schemas_found + fields_found
+        ))
+        for data_store in data_stores_found:
+            self.data_store(data_store)
+
+        # Keep track of schemas to data stores
+        schema_ds_map = {}
+        for schema in schemas_found:
+            schema_ds_map[schema['data_schema_id']] = schema['data_store_id']
+            self.data_store(schema['data_store_id']).schema(schema, pre_fetch=False)
+
+        for field in fields_found:
+            ds_id = schema_ds_map[field['data_schema_id']]
+            schema_id = field['data_schema_id']
+            self.data_store(ds_id).schema(schema_id, pre_fetch=False).field(field, pre_fetch=False)
 
 class _EntityHolder(object):
     """Holds objects to declutter the TreeSchema object"""
-    def __init__(self):
-        self._data_stores_by_id = {}
-        self._data_stores_by_name = {}
-        self._transformations_by_id = {}
-        self._transformations_by_name = {}
-        self._users_by_id = {}
-        self._users_by_email = {}
+    def __init__(self, owner):
+        self._data_stores_by_id = entity_map.EntityMap(
+            entity_map.DATA_STORES, owner._evict_data_store
+        )
+        self._data_stores_by_name = entity_map.EntityMap(
+            entity_map.DATA_STORES, owner._evict_data_store, primary=False
+        )
+        self._transformations_by_id = entity_map.EntityMap(
+            entity_map.TRANSFORMATIONS, owner._evict_transformation
+        )
+        self._transformations_by_name = entity_map.EntityMap(
+            entity_map.TRANSFORMATIONS, owner._evict_transformation, primary=False
+        )
+        self._users_by_id = entity_map.EntityMap(entity_map.USERS, owner._evict_user)
+        self._users_by_email = entity_map.EntityMap(
+            entity_map.USERS, owner._evict_user, primary=False
+        )
+        # Name indexes and the generation they were built for, by kind
+        self._name_indexes = {}
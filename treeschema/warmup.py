@@ -0,0 +1,192 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Iterator, List
+
+from .exceptions import InvalidInputs
+
+
+# How deep into the hierarchy of each data store to load
+STORES = 'stores'
+SCHEMAS = 'schemas'
+FIELDS = 'fields'
+VALUES = 'values'
+DEPTHS = (STORES, SCHEMAS, FIELDS, VALUES)
+
+DEFAULT_MAX_WORKERS = 8
+BATCH_SIZE = 100
+
+
+class WarmupStep(object):
+    """The timing of one step of a warm-up"""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.requests = 0
+        self.entities = 0
+        self.seconds = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'requests': self.requests,
+            'entities': self.entities,
+            'seconds': self.seconds
+        }
+
+    def __repr__(self) -> str:
+        return 'WarmupStep(%s: %s requests, %s entities, %.3fs)' % (
+            self.name, self.requests, self.entities, self.seconds
+        )
+
+
+class WarmupReport(object):
+    """The steps run by `TreeSchema.warm()`. The number of requests is
+    the number of listings and batch calls made, a listing with several
+    pages counts once.
+    """
+
+    def __init__(self) -> None:
+        self.steps = []
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[WarmupStep]:
+        step = WarmupStep(name)
+        start = time.perf_counter()
+        try:
+            yield step
+        finally:
+            step.seconds = time.perf_counter() - start
+            self.steps.append(step)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(s.seconds for s in self.steps)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'total_seconds': self.total_seconds,
+            'steps': [s.as_dict() for s in self.steps]
+        }
+
+    def __repr__(self) -> str:
+        return 'WarmupReport(%.3fs, %s)' % (self.total_seconds, self.steps)
+
+
+class _Target(object):
+    """A single entry of a warm-up spec"""
+
+    def __init__(self, entry: Dict[str, Any]) -> None:
+        if not isinstance(entry, dict) or 'data_store' not in entry:
+            raise InvalidInputs('Each warm-up entry must be a dictionary with a "data_store"')
+        depth = entry.get('depth', SCHEMAS)
+        if depth not in DEPTHS:
+            raise InvalidInputs('Unknown warm-up depth: %s, use one of %s' % (depth, DEPTHS))
+        schemas = entry.get('schemas', ['*'])
+        if not isinstance(schemas, list):
+            schemas = [schemas]
+
+        self.data_store = entry['data_store']
+        self.depth = DEPTHS.index(depth)
+        self.schemas = schemas
+        # Schemas requested only by ID can be batch loaded without listing
+        # every schema in the data store
+        self.schema_ids = schemas if all(isinstance(s, int) for s in schemas) else None
+
+    def matches(self, schema) -> bool:
+        name = schema.name.lower()
+        for pattern in self.schemas:
+            if isinstance(pattern, int):
+                if schema.id == pattern:
+                    return True
+            elif fnmatchcase(name, pattern.lower()):
+                return True
+        return False
+
+
+def _load_all(executor: ThreadPoolExecutor, step: WarmupStep, listings: List) -> None:
+    """Requests the raw listings concurrently and loads each one on the
+    calling thread, since the entity maps and the catalog are not thread
+    safe. `listings` is a list of `(list, load)` pairs.
+    """
+    step.requests += len(listings)
+    results = executor.map(lambda l: l[0](), listings)
+    for (_, load), result in zip(listings, results):
+        load(result)
+
+
+def warm(ts, spec: List[Dict[str, Any]], max_workers: int = DEFAULT_MAX_WORKERS) -> WarmupReport:
+    """Loads the data stores, schemas, fields and field values described
+    by `spec`, see `TreeSchema.warm()`. Each level is one step, the
+    listings within a step are requested concurrently on at most
+    `max_workers` threads and listings that were already retrieved are
+    skipped. Only requests run on the worker threads, the results are
+    loaded into the catalog by the calling thread.
+    """
+    targets = [_Target(entry) for entry in spec]
+    report = WarmupReport()
+    if not targets:
+        return report
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        with report.step('data_stores') as step:
+            if not ts._data_stores_retrieved:
+                step.requests += 1
+                ts.get_data_stores()
+            stores = [ts.data_store(t.data_store) for t in targets]
+            step.entities = len({ds.id for ds in stores})
+
+        schemas_by_id = {}
+        with report.step(SCHEMAS) as step:
+            planned = [(ds, t) for ds, t in zip(stores, targets) if t.depth >= DEPTHS.index(SCHEMAS)]
+            batch_ids = sorted({
+                i for ds, t in planned
+                if t.schema_ids is not None and not ds._schemas_retrieved
+                for i in t.schema_ids
+            })
+            if batch_ids:
+                step.requests += -(-len(batch_ids) // BATCH_SIZE)
+                ts.batch_load_by_id(schema_ids=batch_ids, batch_size=BATCH_SIZE)
+
+            listings = {
+                ds.id: (ds._list_schemas, ds._load_schemas) for ds, t in planned
+                if t.schema_ids is None and not ds._schemas_retrieved
+            }
+            _load_all(executor, step, list(listings.values()))
+
+            for ds, t in planned:
+                if t.schema_ids is not None:
+                    found = [ds.schema(i, pre_fetch=False) for i in t.schema_ids]
+                else:
+                    found = [s for s in list(ds.schemas.values()) if t.matches(s)]
+                for schema in found:
+                    if schema is None:
+                        continue
+                    depth = max(t.depth, schemas_by_id.get(schema.id, (None, -1))[1])
+                    schemas_by_id[schema.id] = (schema, depth)
+            step.entities = len(schemas_by_id)
+
+        fields = []
+        with report.step(FIELDS) as step:
+            selected = [
+                (schema, depth) for schema, depth in schemas_by_id.values()
+                if depth >= DEPTHS.index(FIELDS)
+            ]
+            _load_all(executor, step, [
+                (schema._list_fields, schema._load_fields)
+                for schema, _ in selected if not schema._fields_retrieved
+            ])
+            for schema, depth in selected:
+                fields.extend((f, depth) for f in list(schema.fields.values()))
+            step.entities = len(fields)
+
+        with report.step(VALUES) as step:
+            selected = [f for f, depth in fields if depth >= DEPTHS.index(VALUES)]
+            _load_all(executor, step, [
+                (f._list_field_values, f._load_field_values)
+                for f in selected if not f._field_values_retrieved
+            ])
+            step.entities = sum(len(f.field_values) for f in selected)
+
+    return report